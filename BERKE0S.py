@@ -2,7 +2,36 @@
 import os
 import sys
 import time
+import builtins
+import contextlib
+
+# --profile-startup: time first-time imports from here on (like -X importtime)
+STARTUP_T0 = time.perf_counter()
+PROFILE_STARTUP = "--profile-startup" in sys.argv
+IMPORT_TIMES = []
+original_import = builtins.__import__
+
+if PROFILE_STARTUP:
+    import_stack = []
+    
+    def timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return original_import(name, globals, locals, fromlist, level)
+        import_stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return original_import(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = time.perf_counter() - start
+            children = import_stack.pop()
+            if import_stack:
+                import_stack[-1] += cumulative
+            IMPORT_TIMES.append((name, cumulative - children, cumulative, len(import_stack)))
+    
+    builtins.__import__ = timed_import
+
 import json
+import atexit
 import subprocess
 import threading
 import signal
@@ -14,29 +43,23 @@ import shutil
 import getpass
 import datetime
 import logging
+import logging.handlers
 import queue
 import math
 import uuid
-import base64
-import zipfile
-import tarfile
-import glob
 import stat
-import calendar
-import random
-import string
 import tempfile
-import webbrowser
-import urllib.request
-import urllib.parse
-import http.server
-import socketserver
 import sqlite3
-import configparser
 import platform
-import ctypes
-import mimetypes
 import struct
+import sysconfig
+import traceback
+import collections
+import concurrent.futures
+import copy
+import weakref
+import importlib
+import importlib.util
 from io import BytesIO, StringIO
 from urllib.parse import quote, unquote
 import tkinter as tk
@@ -44,36 +67,494 @@ from tkinter import ttk, messagebox, filedialog, simpledialog, colorchooser
 from tkinter import font as tkFont
 from tkinter import scrolledtext
 
-# Try to import optional dependencies
-try:
-    from PIL import Image, ImageTk, ImageGrab, ImageDraw, ImageFont, ImageFilter, ImageEnhance
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# Deferred imports
+class LazyModule:
+    """Module stand-in that imports the real module on first attribute access"""
+    
+    def __init__(self, name, before_import=None):
+        self.__dict__["lazy_name"] = name
+        self.__dict__["lazy_module"] = None
+        self.__dict__["before_import"] = before_import
+    
+    def lazy_load(self):
+        module = self.__dict__["lazy_module"]
+        if module is None:
+            if self.__dict__["before_import"]:
+                self.__dict__["before_import"]()
+            start = time.perf_counter()
+            module = importlib.import_module(self.__dict__["lazy_name"])
+            LAZY_IMPORT_TIMES.append((self.__dict__["lazy_name"], time.perf_counter() - start))
+            self.__dict__["lazy_module"] = module
+        return module
+    
+    def __getattr__(self, attr):
+        return getattr(self.lazy_load(), attr)
+    
+    def __setattr__(self, attr, value):
+        setattr(self.lazy_load(), attr, value)
+    
+    def __repr__(self):
+        state = "loaded" if self.__dict__["lazy_module"] else "not loaded"
+        return f"<lazy module '{self.__dict__['lazy_name']}' ({state})>"
+
+LAZY_IMPORT_TIMES = []
+
+def module_available(name):
+    """Whether a module is installed, without importing it
+
+    For a submodule only its parent package is imported.
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+# Rarely used standard library modules
+tarfile = LazyModule("tarfile")
+zipfile = LazyModule("zipfile")
+webbrowser = LazyModule("webbrowser")
+mimetypes = LazyModule("mimetypes")
+calendar = LazyModule("calendar")
+configparser = LazyModule("configparser")
+ctypes = LazyModule("ctypes")
+
+# Optional dependencies: the flags only look the package up
+# Distributions often ship ImageTk separately (python3-pil.imagetk)
+PIL_AVAILABLE = module_available("PIL") and module_available("PIL.ImageTk")
+if PIL_AVAILABLE:
+    Image = LazyModule("PIL.Image")
+    ImageTk = LazyModule("PIL.ImageTk")
+    ImageGrab = LazyModule("PIL.ImageGrab")
+    ImageDraw = LazyModule("PIL.ImageDraw")
+    ImageFont = LazyModule("PIL.ImageFont")
+    ImageFilter = LazyModule("PIL.ImageFilter")
+    ImageEnhance = LazyModule("PIL.ImageEnhance")
+else:
     print("PIL not available - some features will be limited")
 
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
+REQUESTS_AVAILABLE = module_available("requests")
+if REQUESTS_AVAILABLE:
+    requests = LazyModule("requests")
+else:
     print("Requests not available - network features limited")
 
-try:
-    import pygame
-    PYGAME_AVAILABLE = True
-except ImportError:
-    PYGAME_AVAILABLE = False
+PYGAME_AVAILABLE = module_available("pygame")
+if PYGAME_AVAILABLE:
+    # pygame prints a banner on import unless told not to
+    pygame = LazyModule("pygame", before_import=lambda: os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1"))
+else:
     print("Pygame not available - audio/game features limited")
 
-try:
-    import numpy as np
-    NUMPY_AVAILABLE = True
-except ImportError:
-    NUMPY_AVAILABLE = False
+NUMPY_AVAILABLE = module_available("numpy")
+if NUMPY_AVAILABLE:
+    np = LazyModule("numpy")
+
+# RAM staging for the configuration directory
+PERSISTENT_CONFIG_DIR = os.path.expanduser("~/.berke0s")
+
+class StagedStorage:
+    """Keeps the configuration directory on tmpfs and flushes it in batches
+    
+    Enabled with ``storage.staging`` in config.json or BERKE0S_STAGING=1,
+    and read once at import, so changes apply on the next start. CONFIG_DIR
+    then points into a RAM directory. A background thread copies changed
+    files back to PERSISTENT_CONFIG_DIR every ``flush_interval`` seconds and
+    at shutdown. Logs are appended instead of recopied, and SQLite databases
+    are copied with the backup API so the copy is consistent.
+    
+    durability:
+      relaxed   batched flushes, no fsync (the kernel writes back when it likes)
+      balanced  batched flushes, each fsynced before it counts as done
+      strict    balanced, and small state files (config, session, plugin
+                states) flushed within ``strict_interval`` seconds
+    
+    The staging directory outlives a crashed process (not a reboot); the
+    next start adopts it and flushes whatever was not persisted yet.
+    """
+    
+    DEFAULTS = {
+        "staging": False,
+        "staging_dir": "/dev/shm",
+        "flush_interval": 900,
+        "durability": "balanced",
+        "strict_interval": 5
+    }
+    MARKER = ".staging-source"
+    SKIP_SUFFIXES = (".tmp", "-wal", "-shm", "-journal")
+    APPEND_SUFFIXES = (".log", ".jsonl")
+    RAM_FILESYSTEMS = ("tmpfs", "ramfs")
+    
+    def __init__(self, persistent_dir):
+        self.persistent_dir = persistent_dir
+        self.settings = dict(self.DEFAULTS)
+        self.settings.update(self.read_settings())
+        self.enabled = False
+        self.root = persistent_dir
+        self.notes = []
+        self.flushed = {}
+        self.log_offsets = {}
+        self.lock = threading.Lock()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.stats_data = {
+            "batches": 0,
+            "files": 0,
+            "bytes": 0,
+            "errors": 0,
+            "last_flush": None,
+            "last_flush_ms": 0.0
+        }
+        self.meter_start = (time.monotonic(), self.process_write_bytes(), 0)
+        
+        os.makedirs(persistent_dir, exist_ok=True)
+        # Registered before the logging pipeline, so it runs after it has drained
+        atexit.register(self.stop)
+        if self.settings["staging"]:
+            try:
+                self.prepare()
+            except Exception as e:
+                self.notes.append(f"staging disabled: {e}")
+                self.enabled = False
+                self.root = persistent_dir
+    
+    def read_settings(self):
+        """storage section of the persisted config, plus the environment override"""
+        settings = {}
+        try:
+            with open(os.path.join(self.persistent_dir, "config.json"), 'r') as f:
+                settings.update(json.load(f).get("storage", {}))
+        except Exception:
+            pass
+        override = os.environ.get("BERKE0S_STAGING")
+        if override is not None:
+            settings["staging"] = override.strip().lower() in ("1", "true", "yes", "on")
+        return settings
+    
+    @classmethod
+    def filesystem_type(cls, path):
+        """Type of the filesystem holding path, from /proc/mounts"""
+        path = os.path.realpath(path)
+        best, fs_type = "", None
+        try:
+            with open("/proc/mounts", 'r') as f:
+                for line in f:
+                    fields = line.split()
+                    if len(fields) < 3:
+                        continue
+                    mount_point = fields[1].replace("\\040", " ")
+                    if (path == mount_point or path.startswith(mount_point.rstrip("/") + "/")) and len(mount_point) >= len(best):
+                        best, fs_type = mount_point, fields[2]
+        except OSError:
+            pass
+        return fs_type
+    
+    def prepare(self):
+        """Choose the staging directory and fill (or adopt) it"""
+        if self.filesystem_type(self.persistent_dir) in self.RAM_FILESYSTEMS:
+            # Stock Tiny Core: home is already in RAM and filetool.sh persists it
+            self.notes.append("configuration directory is already in RAM, staging not needed")
+            return
+        
+        staging_dir = self.settings["staging_dir"]
+        if self.filesystem_type(staging_dir) not in self.RAM_FILESYSTEMS:
+            self.notes.append(f"{staging_dir} is not tmpfs, staging disabled")
+            return
+        
+        root = os.path.join(staging_dir, f"berke0s-{os.getuid()}")
+        adopted = self.live_copy(root, self.persistent_dir)
+        
+        if not adopted:
+            if os.path.isdir(root) and not os.path.islink(root):
+                shutil.rmtree(root, ignore_errors=True)
+            elif os.path.lexists(root):
+                os.unlink(root)
+            # Fails if another user's directory is still there, which disables staging
+            os.mkdir(root, 0o700)
+            # Copied entry by entry so copytree never copies the persistent
+            # directory's mode onto the root; a leftover -wal is copied too
+            # so SQLite can recover it in RAM
+            for name in os.listdir(self.persistent_dir):
+                if name.endswith(".tmp"):
+                    continue
+                source = os.path.join(self.persistent_dir, name)
+                target = os.path.join(root, name)
+                if os.path.isdir(source) and not os.path.islink(source):
+                    shutil.copytree(source, target, symlinks=True,
+                                    ignore=lambda directory, names: [n for n in names if n.endswith(".tmp")])
+                else:
+                    shutil.copy2(source, target, follow_symlinks=False)
+            with open(os.path.join(root, self.MARKER), 'w') as f:
+                f.write(self.persistent_dir)
+        
+        # Anything whose staged size/mtime matches the persistent copy is flushed
+        for rel, info in self.scan(root).items():
+            target = os.path.join(self.persistent_dir, rel)
+            persisted = self.file_info(target)
+            if persisted is None:
+                continue
+            if rel.endswith(self.APPEND_SUFFIXES) and persisted[0] <= info[0]:
+                self.log_offsets[rel] = persisted[0]
+            if persisted == info:
+                self.flushed[rel] = info
+        
+        self.root = root
+        self.enabled = True
+        self.notes.append(f"{'adopted' if adopted else 'staged'} {root}, "
+                          f"{len(self.flushed)} files in sync, durability {self.settings['durability']}")
+    
+    @classmethod
+    def live_copy(cls, root, persistent_dir):
+        """Whether root is a staging copy of persistent_dir that is safe to use
+
+        The path is predictable, so it only counts if it is a real directory
+        (not a symlink) owned by this user with mode 0700 and its marker
+        names persistent_dir. Anything else may have been planted by another
+        local user.
+        """
+        try:
+            st = os.lstat(root)
+        except OSError:
+            return False
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) != 0o700:
+            return False
+        try:
+            with open(os.path.join(root, cls.MARKER), 'r') as f:
+                return f.read().strip() == persistent_dir
+        except OSError:
+            return False
+    
+    def skip(self, name):
+        return name == self.MARKER or name.endswith(self.SKIP_SUFFIXES)
+    
+    @staticmethod
+    def file_info(path):
+        """(size, mtime_ns) of a regular file; a database includes its WAL,
+        where committed transactions sit until the next checkpoint"""
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        size, mtime = st.st_size, st.st_mtime_ns
+        if path.endswith(".db"):
+            try:
+                wal = os.stat(path + "-wal")
+                size, mtime = size + wal.st_size, max(mtime, wal.st_mtime_ns)
+            except OSError:
+                pass
+        return (size, mtime)
+    
+    def scan(self, root):
+        """relative path -> file_info for every staged file"""
+        files = {}
+        for directory, dirnames, filenames in os.walk(root):
+            for name in filenames:
+                if self.skip(name):
+                    continue
+                path = os.path.join(directory, name)
+                info = self.file_info(path)
+                if info is not None:
+                    files[os.path.relpath(path, root)] = info
+        return files
+    
+    @staticmethod
+    def is_critical(rel):
+        return not (rel.endswith((".log", ".db")) or rel.startswith(("cache" + os.sep, "logs" + os.sep)))
+    
+    def start(self):
+        """Start the flush thread; call once logging is set up"""
+        for note in self.notes:
+            logger.info(f"Storage: {note}")
+        if self.thread:
+            return
+        self.thread = threading.Thread(target=self.service, daemon=True, name="StorageFlush")
+        self.thread.start()
+    
+    def service(self):
+        strict = self.enabled and self.settings["durability"] == "strict"
+        interval = max(1, float(self.settings["flush_interval"]))
+        tick = max(1, float(self.settings["strict_interval"])) if strict else min(interval, 60)
+        next_flush = time.monotonic() + interval
+        next_report = time.monotonic() + 3600
+        
+        while not self.stop_event.wait(tick):
+            now = time.monotonic()
+            if self.enabled:
+                if now >= next_flush:
+                    self.flush()
+                    next_flush = now + interval
+                elif strict:
+                    self.flush(critical_only=True)
+            if now >= next_report:
+                self.report()
+                next_report = now + 3600
+    
+    def flush(self, critical_only=False):
+        """Copy changed staged files to persistent storage; returns files written"""
+        if not self.enabled:
+            return 0
+        
+        with self.lock:
+            start = time.perf_counter()
+            sync = self.settings["durability"] != "relaxed"
+            current = self.scan(self.root)
+            written = 0
+            touched_dirs = set()
+            
+            for rel, info in current.items():
+                if self.flushed.get(rel) == info or (critical_only and not self.is_critical(rel)):
+                    continue
+                try:
+                    size = self.flush_file(rel, sync)
+                    self.flushed[rel] = info
+                    self.stats_data["bytes"] += size
+                    written += 1
+                    touched_dirs.add(os.path.dirname(os.path.join(self.persistent_dir, rel)))
+                except Exception as e:
+                    self.stats_data["errors"] += 1
+                    logger.error(f"Storage flush error {rel}: {e}")
+            
+            for rel in list(self.flushed):
+                if rel in current or (critical_only and not self.is_critical(rel)):
+                    continue
+                # Removed from staging (pruned cache, compacted journal)
+                del self.flushed[rel]
+                self.log_offsets.pop(rel, None)
+                target = os.path.join(self.persistent_dir, rel)
+                try:
+                    os.remove(target)
+                    touched_dirs.add(os.path.dirname(target))
+                except FileNotFoundError:
+                    pass
+                except Exception as e:
+                    logger.warning(f"Storage remove error {rel}: {e}")
+            
+            if sync:
+                for directory in touched_dirs:
+                    self.fsync_dir(directory)
+            
+            elapsed = (time.perf_counter() - start) * 1000
+            if written:
+                self.stats_data["batches"] += 1
+                self.stats_data["files"] += written
+                self.stats_data["last_flush"] = time.time()
+                self.stats_data["last_flush_ms"] = elapsed
+                logger.debug(f"Storage flush: {written} files in {elapsed:.1f} ms")
+            return written
+    
+    def flush_file(self, rel, sync):
+        """Persist one staged file; returns the bytes written"""
+        source = os.path.join(self.root, rel)
+        target = os.path.join(self.persistent_dir, rel)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        
+        if rel.endswith(self.APPEND_SUFFIXES):
+            offset = self.log_offsets.get(rel)
+            size = os.path.getsize(source)
+            if offset is not None and offset <= size and os.path.exists(target):
+                # Logs only grow (until rotated): append the new tail
+                with open(source, 'rb') as src, open(target, 'ab') as dst:
+                    src.seek(offset)
+                    shutil.copyfileobj(src, dst)
+                    dst.flush()
+                    if sync:
+                        os.fsync(dst.fileno())
+                self.log_offsets[rel] = size
+                shutil.copystat(source, target)
+                return size - offset
+        
+        temp_path = f"{target}.tmp"
+        if rel.endswith(".db"):
+            # The database may be mid-transaction; the backup API gives a consistent copy
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            src_conn = sqlite3.connect(source, timeout=10)
+            dst_conn = sqlite3.connect(temp_path)
+            try:
+                src_conn.backup(dst_conn)
+            finally:
+                dst_conn.close()
+                src_conn.close()
+            if sync:
+                with open(temp_path, 'rb') as f:
+                    os.fsync(f.fileno())
+        else:
+            with open(source, 'rb') as src, open(temp_path, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+                dst.flush()
+                if sync:
+                    os.fsync(dst.fileno())
+        
+        shutil.copystat(source, temp_path)
+        os.replace(temp_path, target)
+        if rel.endswith(".db"):
+            # A stale WAL next to the fresh copy would be replayed onto it
+            for suffix in ("-wal", "-shm"):
+                if os.path.exists(target + suffix):
+                    os.remove(target + suffix)
+        size = os.path.getsize(target)
+        if rel.endswith(self.APPEND_SUFFIXES):
+            self.log_offsets[rel] = size
+        return size
+    
+    @staticmethod
+    def fsync_dir(directory):
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def process_write_bytes():
+        """Bytes this process caused to be sent to block devices (tmpfs excluded)"""
+        try:
+            with open("/proc/self/io", 'r') as f:
+                for line in f:
+                    if line.startswith("write_bytes:"):
+                        return int(line.split()[1])
+        except (OSError, ValueError):
+            pass
+        return None
+    
+    def stats(self):
+        """Flush counters and persistent write rate since the last report"""
+        data = dict(self.stats_data)
+        started, write_bytes, flushed_bytes = self.meter_start
+        hours = max((time.monotonic() - started) / 3600, 1e-6)
+        current = self.process_write_bytes()
+        data["enabled"] = self.enabled
+        data["durability"] = self.settings["durability"]
+        data["flushed_kib_per_hour"] = (data["bytes"] - flushed_bytes) / 1024 / hours
+        data["device_kib_per_hour"] = None if current is None or write_bytes is None else (current - write_bytes) / 1024 / hours
+        return data
+    
+    def report(self):
+        """Log the write volume per hour (compare with staging on and off)"""
+        data = self.stats()
+        device = "n/a" if data["device_kib_per_hour"] is None else f"{data['device_kib_per_hour']:.1f}"
+        logger.info(f"Storage writes ({'staged, ' + data['durability'] if self.enabled else 'direct'}): "
+                    f"{device} KiB/h to block devices, {data['flushed_kib_per_hour']:.1f} KiB/h flushed, "
+                    f"{data['batches']} batches, {data['errors']} errors")
+        self.meter_start = (time.monotonic(), self.process_write_bytes(), self.stats_data["bytes"])
+    
+    def stop(self):
+        """Final flush; safe to call more than once"""
+        self.stop_event.set()
+        if self.enabled:
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Storage final flush error: {e}")
+
+STAGED_STORAGE = StagedStorage(PERSISTENT_CONFIG_DIR)
 
 # Enhanced Configuration
-CONFIG_DIR = os.path.expanduser("~/.berke0s")
+CONFIG_DIR = STAGED_STORAGE.root
 CONFIG_FILE = f"{CONFIG_DIR}/config.json"
 SESSION_FILE = f"{CONFIG_DIR}/session.json"
 LOG_FILE = f"{CONFIG_DIR}/berke0s.log"
@@ -85,28 +566,549 @@ APPS_DIR = f"{CONFIG_DIR}/applications"
 DATABASE_FILE = f"{CONFIG_DIR}/berke0s.db"
 DISPLAY_LOG = f"{CONFIG_DIR}/display.log"
 X_LOG = f"{CONFIG_DIR}/x_server.log"
+LOGS_DIR = f"{CONFIG_DIR}/logs"
+JOURNAL_DIR = f"{CONFIG_DIR}/journal"
+STARTUP_PROFILE_FILE = f"{CONFIG_DIR}/startup_profile.txt"
+BOOT_TIMES_FILE = f"{CONFIG_DIR}/boot_times.json"
+CACHE_DIR = f"{CONFIG_DIR}/cache"
+WALLPAPER_CACHE_DIR = f"{CACHE_DIR}/wallpapers"
 
 # Ensure directories exist
-for directory in [CONFIG_DIR, THEMES_DIR, PLUGINS_DIR, WALLPAPERS_DIR, APPS_DIR]:
+for directory in [CONFIG_DIR, THEMES_DIR, PLUGINS_DIR, WALLPAPERS_DIR, APPS_DIR, JOURNAL_DIR, WALLPAPER_CACHE_DIR]:
     os.makedirs(directory, exist_ok=True)
 
-# Enhanced logging setup with display-specific logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
-logger = logging.getLogger('Berke0S')
+# Asynchronous logging: callers only enqueue, a listener thread does the I/O
+class RepeatFilter(logging.Filter):
+    """Suppresses repeats of a message seen within the last ``window`` seconds
+    
+    The next occurrence after the window carries a "(repeated N more times)"
+    suffix, so per-second error paths cost one line per window.
+    """
+    
+    def __init__(self, window=60.0, max_keys=512):
+        super().__init__()
+        self.window = window
+        self.max_keys = max_keys
+        self.seen = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.suppressed = 0
+    
+    def filter(self, record):
+        if self.window <= 0:
+            return True
+        
+        message = record.getMessage()
+        key = (record.name, record.levelno, message)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.seen.get(key)
+            if entry is not None and now - entry[0] < self.window:
+                entry[1] += 1
+                self.suppressed += 1
+                return False
+            self.seen[key] = [now, 0]
+            self.seen.move_to_end(key)
+            if len(self.seen) > self.max_keys:
+                self.seen.popitem(last=False)
+        
+        if entry is not None and entry[1]:
+            record.msg = f"{message} (repeated {entry[1]} more times)"
+            record.args = None
+        return True
+    
+    def pending(self):
+        with self.lock:
+            return sum(entry[1] for entry in self.seen.values())
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking on a full queue"""
+    
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class LoggingPipeline:
+    """Queue handler on the root logger, file/console I/O on a listener thread"""
+    
+    def __init__(self, handlers, queue_size=10000, repeat_window=60.0):
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.handler = NonBlockingQueueHandler(self.queue)
+        self.repeat_filter = RepeatFilter(repeat_window)
+        self.handler.addFilter(self.repeat_filter)
+        self.handlers = handlers
+        self.listener = logging.handlers.QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.started = False
+    
+    def start(self):
+        if not self.started:
+            self.listener.start()
+            self.started = True
+            atexit.register(self.stop)
+    
+    def stats(self):
+        return {
+            "queued": self.queue.qsize(),
+            "dropped": self.handler.dropped,
+            "suppressed": self.repeat_filter.suppressed
+        }
+    
+    def stop(self):
+        """Drain the queue and close the handlers"""
+        if not self.started:
+            return
+        self.started = False
+        pending = self.repeat_filter.pending()
+        if pending or self.handler.dropped:
+            self.queue.put(logging.LogRecord("Berke0S", logging.INFO, "", 0,
+                                             f"Logging: {pending} repeated messages suppressed, "
+                                             f"{self.handler.dropped} dropped on a full queue", None, None))
+        self.listener.stop()
+        for handler in self.handlers:
+            handler.close()
+
+# Structured log store: JSON-lines copy of every record, indexed per hour
+LOG_SEGMENT_SECONDS = 3600
+LOG_MARK_SECONDS = 60
+LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+def log_segment_name(bucket):
+    return datetime.datetime.fromtimestamp(bucket * LOG_SEGMENT_SECONDS, datetime.timezone.utc).strftime("%Y%m%d-%H") + ".jsonl"
 
-# Display logger
+def log_segment_bucket(name):
+    try:
+        stamp = datetime.datetime.strptime(name[:-len(".jsonl")], "%Y%m%d-%H").replace(tzinfo=datetime.timezone.utc)
+    except ValueError:
+        return None
+    return int(stamp.timestamp()) // LOG_SEGMENT_SECONDS
+
+def component_matches(component, components):
+    """Exact logger name or a child of it ("Berke0S" matches "Berke0S.Boot")"""
+    return any(component == name or component.startswith(name + ".") for name in components)
+
+def format_log_record(entry):
+    """Render a record like the text log"""
+    stamp = datetime.datetime.fromtimestamp(entry["t"]).strftime("%Y-%m-%d %H:%M:%S")
+    millis = int((entry["t"] % 1) * 1000)
+    return f"{stamp},{millis:03d} - {entry['c']} - {entry['l']} - {entry['m']}"
+
+class StructuredLogStore:
+    """Append-only hourly JSON-lines segments with sidecar indexes"""
+    
+    def __init__(self, directory, retention_hours=168, max_bytes=64 * 1024 * 1024):
+        self.directory = directory
+        self.retention_hours = retention_hours
+        self.max_bytes = max_bytes
+        self.lock = threading.RLock()
+        self.file = None
+        self.bucket = None
+        self.index = None
+        self.last_flush = 0.0
+        self.last_index_write = 0.0
+        os.makedirs(directory, exist_ok=True)
+    
+    def path(self, bucket):
+        return os.path.join(self.directory, log_segment_name(bucket))
+    
+    @staticmethod
+    def new_index():
+        return {"version": 1, "start": None, "end": None, "count": 0, "size": 0,
+                "levels": {}, "components": {}, "marks": []}
+    
+    @staticmethod
+    def add_to_index(index, entry, offset, size):
+        t = entry["t"]
+        if index["start"] is None or t < index["start"]:
+            index["start"] = t
+        if index["end"] is None or t > index["end"]:
+            index["end"] = t
+        index["count"] += 1
+        index["size"] = offset + size
+        index["levels"][entry["l"]] = index["levels"].get(entry["l"], 0) + 1
+        index["components"][entry["c"]] = index["components"].get(entry["c"], 0) + 1
+        marks = index["marks"]
+        if not marks or t >= marks[-1][0] + LOG_MARK_SECONDS:
+            marks.append([t, offset])
+    
+    def build_index(self, path, index=None):
+        """Build a sidecar by scanning its segment, or extend one from where it stopped"""
+        index = index or self.new_index()
+        with open(path, 'rb') as f:
+            offset = index["size"]
+            f.seek(offset)
+            for line in f:
+                try:
+                    self.add_to_index(index, json.loads(line), offset, len(line))
+                except ValueError:
+                    pass
+                offset += len(line)
+        index["size"] = offset
+        return index
+    
+    def load_index(self, bucket):
+        """Sidecar of a segment, rebuilt if missing or behind the segment"""
+        with self.lock:
+            if bucket == self.bucket and self.index is not None:
+                # Snapshot: the listener thread keeps appending to it
+                return dict(self.index, levels=dict(self.index["levels"]),
+                            components=dict(self.index["components"]), marks=list(self.index["marks"]))
+        path = self.path(bucket)
+        size = os.path.getsize(path)
+        index = None
+        try:
+            with open(path + ".idx", 'r') as f:
+                index = json.load(f)
+            if index.get("size") == size:
+                return index
+            if not 0 <= index.get("size", -1) < size:
+                index = None
+        except (OSError, ValueError):
+            index = None
+        # Missing (crash) or behind a segment another process is still writing
+        return self.build_index(path, index)
+    
+    def write_index(self, bucket, index):
+        path = self.path(bucket) + ".idx"
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except OSError:
+            pass  # the index is rebuilt from the segment when needed
+    
+    def append(self, entry):
+        """Append one record; called from the logging listener thread"""
+        line = (json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+        bucket = int(entry["t"]) // LOG_SEGMENT_SECONDS
+        now = time.monotonic()
+        with self.lock:
+            if bucket != self.bucket and (self.bucket is None or bucket > self.bucket):
+                self.open_segment(bucket)
+            offset = self.file.tell()
+            self.file.write(line)
+            self.add_to_index(self.index, entry, offset, len(line))
+            if now - self.last_flush >= 1.0:
+                self.file.flush()
+                self.last_flush = now
+            if now - self.last_index_write >= 30.0:
+                self.file.flush()
+                self.write_index(self.bucket, self.index)
+                self.last_index_write = now
+    
+    def open_segment(self, bucket):
+        self.close()
+        path = self.path(bucket)
+        self.index = self.build_index(path) if os.path.exists(path) else self.new_index()
+        self.file = open(path, 'ab')
+        self.bucket = bucket
+        self.prune()
+    
+    def flush(self):
+        """Make appended records visible to readers and persist the open index"""
+        with self.lock:
+            if self.file:
+                self.file.flush()
+                self.write_index(self.bucket, self.index)
+                self.last_index_write = time.monotonic()
+    
+    def close(self):
+        with self.lock:
+            if self.file:
+                self.flush()
+                self.file.close()
+                self.file = None
+                self.index = None
+                self.bucket = None
+    
+    def segments(self):
+        """Buckets of all segments, oldest first"""
+        buckets = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".jsonl"):
+                bucket = log_segment_bucket(name)
+                if bucket is not None:
+                    buckets.append(bucket)
+        return sorted(buckets)
+    
+    def prune(self):
+        """Drop segments beyond the retention age or total size"""
+        buckets = self.segments()
+        cutoff = int(time.time()) // LOG_SEGMENT_SECONDS - self.retention_hours
+        sizes = {bucket: os.path.getsize(self.path(bucket)) for bucket in buckets}
+        total = sum(sizes.values())
+        for bucket in buckets:
+            if bucket == self.bucket:
+                break
+            if bucket >= cutoff and total <= self.max_bytes:
+                break
+            total -= sizes[bucket]
+            for path in (self.path(bucket), self.path(bucket) + ".idx"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+    
+    def query(self, start=None, end=None, components=None, level=None,
+              text=None, limit=1000, newest_first=False):
+        """Records in [start, end] from the given components at or above level"""
+        components = list(components) if components else None
+        min_level = LOG_LEVELS.get(str(level).upper(), 0) if level else 0
+        needle = text.lower() if text else None
+        start_bucket = None if start is None else int(start) // LOG_SEGMENT_SECONDS
+        end_bucket = None if end is None else int(end) // LOG_SEGMENT_SECONDS
+        
+        self.flush()
+        buckets = [bucket for bucket in self.segments()
+                   if (start_bucket is None or bucket >= start_bucket) and (end_bucket is None or bucket <= end_bucket)]
+        if newest_first:
+            buckets.reverse()
+        
+        results = []
+        for bucket in buckets:
+            try:
+                index = self.load_index(bucket)
+            except OSError:
+                continue
+            if components and not any(component_matches(c, components) for c in index["components"]):
+                continue
+            if min_level and not any(LOG_LEVELS.get(l, 0) >= min_level for l in index["levels"]):
+                continue
+            
+            matches = self.scan_segment(bucket, index, start, end, components, min_level, needle,
+                                        None if newest_first else limit - len(results))
+            if newest_first:
+                matches.reverse()
+            results.extend(matches[:limit - len(results)])
+            if len(results) >= limit:
+                break
+        return results
+    
+    def scan_segment(self, bucket, index, start, end, components, min_level, needle, limit):
+        offset = 0
+        if start is not None:
+            # Records from different threads can be a little out of order
+            for mark_time, mark_offset in index["marks"]:
+                if mark_time > start - 5:
+                    break
+                offset = mark_offset
+        
+        matches = []
+        with open(self.path(bucket), 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                t = entry["t"]
+                if start is not None and t < start:
+                    continue
+                if end is not None and t > end:
+                    if t > end + 5:
+                        break
+                    continue
+                if min_level and LOG_LEVELS.get(entry["l"], 0) < min_level:
+                    continue
+                if components and not component_matches(entry["c"], components):
+                    continue
+                if needle and needle not in entry["m"].lower():
+                    continue
+                matches.append(entry)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+    
+    def stats(self):
+        buckets = self.segments()
+        return {
+            "segments": len(buckets),
+            "bytes": sum(os.path.getsize(self.path(bucket)) for bucket in buckets),
+            "oldest": buckets[0] * LOG_SEGMENT_SECONDS if buckets else None
+        }
+
+class StructuredLogHandler(logging.Handler):
+    """Logging handler feeding a StructuredLogStore (runs on the listener thread)"""
+    
+    def __init__(self, store, level=logging.NOTSET):
+        super().__init__(level)
+        self.store = store
+    
+    def emit(self, record):
+        try:
+            self.store.append({
+                "t": round(record.created, 3),
+                "l": record.levelname,
+                "c": record.name,
+                "m": record.getMessage(),
+                "s": f"{record.filename}:{record.lineno}"
+            })
+        except Exception:
+            self.handleError(record)
+    
+    def close(self):
+        self.store.close()
+        super().close()
+
+LOGGING_DEFAULTS = {
+    "level": "DEBUG",
+    "console_level": "INFO",
+    "max_bytes": 5 * 1024 * 1024,
+    "backup_count": 3,
+    "queue_size": 10000,
+    "repeat_window": 60,
+    # JSON-lines copy of every record under logs/, see StructuredLogStore
+    "structured": True,
+    "retention_hours": 168,
+    "structured_max_bytes": 64 * 1024 * 1024,
+    # Logger name -> level, e.g. {"Display": "WARNING", "Berke0S": "INFO"}
+    "components": {}
+}
+
+def level_number(name):
+    """Numeric level for a name such as "debug"; unknown names mean INFO"""
+    value = logging.getLevelName(str(name).upper())
+    return value if isinstance(value, int) else logging.INFO
+
+def setup_logging():
+    """Install the logging pipeline using the logging section of config.json"""
+    settings = dict(LOGGING_DEFAULTS)
+    try:
+        with open(CONFIG_FILE, 'r') as f:
+            settings.update(json.load(f).get("logging", {}))
+    except Exception:
+        pass
+    
+    LOG_STORE.retention_hours = settings["retention_hours"]
+    LOG_STORE.max_bytes = settings["structured_max_bytes"]
+    file_level = level_number(settings["level"])
+    console_level = level_number(settings["console_level"])
+    
+    file_handler = logging.handlers.RotatingFileHandler(
+        LOG_FILE, maxBytes=settings["max_bytes"], backupCount=settings["backup_count"])
+    file_handler.setLevel(file_level)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setLevel(console_level)
+    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    
+    # Display logger records also go to their own file
+    display_handler = logging.handlers.RotatingFileHandler(
+        DISPLAY_LOG, maxBytes=settings["max_bytes"], backupCount=settings["backup_count"])
+    display_handler.setFormatter(logging.Formatter('%(asctime)s - DISPLAY - %(levelname)s - %(message)s'))
+    display_handler.addFilter(logging.Filter('Display'))
+    
+    handlers = [file_handler, console_handler, display_handler]
+    if settings["structured"]:
+        handlers.append(StructuredLogHandler(LOG_STORE, file_level))
+    
+    pipeline = LoggingPipeline(handlers,
+                               queue_size=settings["queue_size"],
+                               repeat_window=settings["repeat_window"])
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(pipeline.handler)
+    root_logger.setLevel(min(file_level, console_level))
+    
+    for name, component_level in settings["components"].items():
+        logging.getLogger(name).setLevel(level_number(component_level))
+    
+    pipeline.start()
+    return pipeline
+
+LOG_STORE = StructuredLogStore(LOGS_DIR)
+LOGGING_PIPELINE = setup_logging()
+logger = logging.getLogger('Berke0S')
 display_logger = logging.getLogger('Display')
-display_handler = logging.FileHandler(DISPLAY_LOG)
-display_handler.setFormatter(logging.Formatter('%(asctime)s - DISPLAY - %(levelname)s - %(message)s'))
-display_logger.addHandler(display_handler)
-display_logger.setLevel(logging.DEBUG)
+
+# Startup profiling
+class StartupProfiler:
+    """Wall-clock spans of startup phases, reported with the import timings
+
+    Only active with ``--profile-startup``; otherwise ``span`` is a no-op.
+    The report is written to STARTUP_PROFILE_FILE once the Tk loop first
+    goes idle.
+    """
+    
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.spans = []
+        self.depth = 0
+        self.finished = False
+    
+    @contextlib.contextmanager
+    def span(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        index = len(self.spans)
+        self.spans.append([name, start - STARTUP_T0, 0.0, self.depth])
+        self.depth += 1
+        try:
+            yield
+        finally:
+            self.depth -= 1
+            self.spans[index][2] = time.perf_counter() - start
+    
+    def mark(self, name):
+        """Record an instant (zero-length span)"""
+        if self.enabled:
+            self.spans.append([name, time.perf_counter() - STARTUP_T0, 0.0, self.depth])
+    
+    def add_span(self, name, start, duration):
+        """Record a span measured elsewhere (e.g. on a boot worker thread)"""
+        if self.enabled:
+            self.spans.append([name, start - STARTUP_T0, duration, self.depth])
+    
+    def finish(self):
+        """Stop the import hook and write the report"""
+        if not self.enabled or self.finished:
+            return
+        self.finished = True
+        builtins.__import__ = original_import
+        total = time.perf_counter() - STARTUP_T0
+        
+        lines = [f"Berke0S startup profile ({datetime.datetime.now().isoformat(timespec='seconds')})",
+                 f"Total until first idle: {total * 1000:.1f} ms", ""]
+        
+        lines.append("Phases (start ms, duration ms):")
+        for name, start, duration, depth in self.spans:
+            lines.append(f"{start * 1000:9.1f} {duration * 1000:9.1f}  {'  ' * depth}{name}")
+        
+        lines.append("")
+        lines.append("Slowest imports (cumulative):")
+        for name, own, cumulative, depth in sorted(IMPORT_TIMES, key=lambda item: item[2], reverse=True)[:25]:
+            lines.append(f"{cumulative * 1000:9.1f} ms  {name}")
+        
+        lines.append("")
+        lines.append("Deferred imports triggered during startup:")
+        for name, duration in LAZY_IMPORT_TIMES:
+            lines.append(f"{duration * 1000:9.1f} ms  {name}")
+        if not LAZY_IMPORT_TIMES:
+            lines.append("          none")
+        
+        lines.append("")
+        lines.append("All imports (-X importtime format, microseconds):")
+        lines.append("import time: self [us] | cumulative | imported package")
+        for name, own, cumulative, depth in IMPORT_TIMES:
+            lines.append(f"import time: {int(own * 1e6):>9} | {int(cumulative * 1e6):>10} | {'  ' * depth}{name}")
+        
+        try:
+            with open(STARTUP_PROFILE_FILE, 'w') as f:
+                f.write("\n".join(lines) + "\n")
+            logger.info(f"Startup profile ({total * 1000:.0f} ms) written to {STARTUP_PROFILE_FILE}")
+        except Exception as e:
+            logger.error(f"Startup profile write error: {e}")
+
+STARTUP_PROFILER = StartupProfiler(PROFILE_STARTUP)
 
 # Enhanced default configuration
 DEFAULT_CONFIG = {
@@ -148,6 +1150,11 @@ DEFAULT_CONFIG = {
         "virtual_desktops": 4,
         "show_dock": False
     },
+    "editor": {
+        "journal_enabled": True,
+        "journal_flush_interval": 2,
+        "journal_compact_size": 4194304
+    },
     "taskbar": {
         "position": "bottom",
         "auto_hide": False,
@@ -163,7 +1170,19 @@ DEFAULT_CONFIG = {
         "timeout": 5000,
         "position": "top-right",
         "sound_enabled": True,
-        "show_previews": True
+        "show_previews": True,
+        "max_visible": 4,
+        "max_pending": 20,
+        "rate_burst": 3,
+        "rate_interval": 300,
+        "history_limit": 5000
+    },
+    "storage": dict(StagedStorage.DEFAULTS),
+    "logging": dict(LOGGING_DEFAULTS),
+    "diagnostics": {
+        "stall_monitor": True,
+        "stall_threshold_ms": 100,
+        "heartbeat_ms": 50
     },
     "power": {
         "sleep_timeout": 1800,
@@ -214,6 +1233,7 @@ class DisplayManager:
     
     def __init__(self):
         self.display_info = {}
+        self.display_info_time = None
         self.x_process = None
         self.display_ready = False
         self.current_display = ":0"
@@ -1224,9 +2244,17 @@ wait
             display_logger.error(f"Headless setup error: {e}")
             return False
     
-    def get_display_info(self):
-        """Get current display information"""
+    def get_display_info(self, max_age=None):
+        """Get current display information
+
+        With ``max_age`` (seconds) a cached result that recent is returned
+        instead of running xdpyinfo again.
+        """
         try:
+            if (max_age is not None and self.display_info and self.display_info_time is not None
+                    and time.monotonic() - self.display_info_time < max_age):
+                return self.display_info
+            
             if self.display_ready:
                 # Get display info from X server
                 try:
@@ -1240,6 +2268,7 @@ wait
                     if result.returncode == 0:
                         info = self.parse_xdpyinfo_output(result.stdout)
                         self.display_info = info
+                        self.display_info_time = time.monotonic()
                         return info
                 except:
                     pass
@@ -1433,6 +2462,34 @@ def init_database():
             )
         ''')
         
+        # Notification history table (timestamp is epoch seconds)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS notification_history (
+                id INTEGER PRIMARY KEY,
+                title TEXT,
+                message TEXT,
+                type TEXT,
+                source TEXT,
+                count INTEGER DEFAULT 1,
+                timestamp REAL
+            )
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_notification_history_time ON notification_history (timestamp, id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_notification_history_type ON notification_history (type, timestamp, id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_notification_history_source ON notification_history (source, timestamp, id)")
+        
+        # UI event-loop stalls (timestamp is epoch seconds)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS ui_stalls (
+                id INTEGER PRIMARY KEY,
+                timestamp REAL,
+                duration_ms REAL,
+                location TEXT,
+                stack TEXT
+            )
+        ''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_ui_stalls_time ON ui_stalls (timestamp)")
+        
         conn.commit()
         conn.close()
         logger.info("Database initialized successfully")
@@ -1440,6 +2497,433 @@ def init_database():
     except Exception as e:
         logger.error(f"Database initialization failed: {e}")
 
+def atomic_write(path, data, encoding='utf-8'):
+    """Atomically replace a file (temp file + fsync + rename)"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            if isinstance(data, str):
+                data = data.encode(encoding)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+
+        # Keep the permissions of the file being replaced
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+
+        os.replace(temp_path, path)
+
+        # Persist the rename itself
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+    except Exception:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+# Change-tracked persistence
+class ObservableDict(dict):
+    """dict that reports mutations, including those of nested dicts
+
+    Assigning an equal value is not a change. In-place changes to lists
+    are not seen; reassign the list (or call the store's mark_dirty).
+    """
+    
+    def __init__(self, data=(), on_change=None):
+        super().__init__()
+        self.on_change = on_change
+        for key, value in dict(data).items():
+            super().__setitem__(key, self.wrap(value))
+    
+    def wrap(self, value):
+        if isinstance(value, ObservableDict):
+            value.on_change = self.changed
+            return value
+        if isinstance(value, dict):
+            return ObservableDict(value, self.changed)
+        return value
+    
+    def changed(self):
+        if self.on_change:
+            self.on_change()
+    
+    def __setitem__(self, key, value):
+        if key in self and dict.__getitem__(self, key) == value:
+            return
+        super().__setitem__(key, self.wrap(value))
+        self.changed()
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.changed()
+    
+    def pop(self, key, *default):
+        had_key = key in self
+        value = super().pop(key, *default)
+        if had_key:
+            self.changed()
+        return value
+    
+    def popitem(self):
+        item = super().popitem()
+        self.changed()
+        return item
+    
+    def clear(self):
+        if self:
+            super().clear()
+            self.changed()
+    
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return dict.__getitem__(self, key)
+    
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+    
+    def __deepcopy__(self, memo):
+        # Plain copy; never drag the change callback (and its owner) along
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+class JsonFileStore:
+    """JSON file written only when its content changed
+
+    ``mark_dirty`` debounces bursts of changes into one write after
+    ``debounce`` seconds; ``flush`` writes immediately. Content is compared
+    by digest (ignoring ``ignore_keys`` such as timestamps) against what is
+    on disk, and written with atomic_write so a power cut never leaves a
+    truncated file.
+    """
+    
+    def __init__(self, path, serialize, debounce=2.0, indent=4, ignore_keys=()):
+        self.path = path
+        self.serialize = serialize
+        self.debounce = debounce
+        self.indent = indent
+        self.ignore_keys = set(ignore_keys)
+        self.lock = threading.Lock()
+        self.timer = None
+        self.dirty = False
+        self.stats = {"writes": 0, "skipped": 0, "bytes": 0}
+        self.last_digest = self.file_digest()
+    
+    def digest(self, data):
+        if isinstance(data, dict) and self.ignore_keys:
+            data = {key: value for key, value in data.items() if key not in self.ignore_keys}
+        return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode()).hexdigest()
+    
+    def file_digest(self):
+        """Digest of the file currently on disk"""
+        try:
+            with open(self.path, 'r') as f:
+                return self.digest(json.load(f))
+        except Exception:
+            return None
+    
+    def mark_dirty(self):
+        """Schedule a write, restarting the debounce window"""
+        with self.lock:
+            self.dirty = True
+            if self.timer:
+                self.timer.cancel()
+            self.timer = threading.Timer(self.debounce, self.background_flush)
+            self.timer.daemon = True
+            self.timer.start()
+    
+    def background_flush(self):
+        try:
+            self.flush()
+        except Exception as e:
+            logger.error(f"Save error {self.path}: {e}")
+    
+    def flush(self, force=False):
+        """Write now if the content differs from disk; returns True if written"""
+        with self.lock:
+            if self.timer:
+                self.timer.cancel()
+                self.timer = None
+            
+            try:
+                data = self.serialize()
+                digest = self.digest(data)
+                if digest == self.last_digest and not force:
+                    self.stats["skipped"] += 1
+                    self.dirty = False
+                    return False
+                
+                text = json.dumps(data, indent=self.indent, default=str)
+            except RuntimeError:
+                # Mutated while serialising on another thread; try again shortly
+                self.timer = threading.Timer(self.debounce, self.background_flush)
+                self.timer.daemon = True
+                self.timer.start()
+                return False
+            
+            atomic_write(self.path, text)
+            self.last_digest = digest
+            self.dirty = False
+            self.stats["writes"] += 1
+            self.stats["bytes"] += len(text)
+            return True
+
+# Default wallpaper rendering
+DEFAULT_WALLPAPER_GRADIENTS = {
+    "berke_dark": [(15, 15, 35), (26, 26, 26), (40, 40, 60)],
+    "berke_light": [(240, 240, 240), (220, 220, 220), (200, 200, 200)],
+    "ocean": [(13, 27, 42), (3, 4, 94), (0, 119, 190)],
+    "forest": [(27, 67, 50), (45, 145, 108), (82, 183, 136)],
+    "tinycore": [(46, 52, 54), (85, 87, 83), (136, 138, 133)]
+}
+
+WALLPAPER_GRID_SPACING = 100
+WALLPAPER_GRID_ALPHA = 20
+
+def gradient_rows(height, colors):
+    """Per-row RGB values of the three-stop vertical gradient"""
+    rows = []
+    for y in range(height):
+        progress = y / height
+        if progress < 0.5:
+            start, end, ratio = colors[0], colors[1], progress * 2
+        else:
+            start, end, ratio = colors[1], colors[2], (progress - 0.5) * 2
+        rows.append(tuple(int(start[c] + (end[c] - start[c]) * ratio) for c in range(3)))
+    return rows
+
+def render_default_wallpaper(width, height, colors, pattern=True):
+    """Render the gradient wallpaper (with optional grid) as a PIL image
+
+    Uses NumPy broadcasting when available; otherwise builds a 1-pixel wide
+    column and lets PIL stretch it, so neither path draws per scanline.
+    """
+    def blend(channel):
+        # Grid line: white at WALLPAPER_GRID_ALPHA over the gradient
+        return channel + (255 - channel) * WALLPAPER_GRID_ALPHA // 255
+    
+    if NUMPY_AVAILABLE:
+        progress = np.arange(height, dtype=np.float64) / height
+        first = progress < 0.5
+        ratio = np.where(first, progress * 2, (progress - 0.5) * 2)[:, None]
+        stops = np.array(colors, dtype=np.float64)
+        start = np.where(first[:, None], stops[0], stops[1])
+        end = np.where(first[:, None], stops[1], stops[2])
+        rows = (start + (end - start) * ratio).astype(np.int32)
+        
+        pixels = np.empty((height, width, 3), dtype=np.uint8)
+        pixels[:] = rows[:, None, :].astype(np.uint8)
+        if pattern:
+            lines = blend(rows).astype(np.uint8)
+            pixels[:, ::WALLPAPER_GRID_SPACING] = lines[:, None, :]
+            pixels[::WALLPAPER_GRID_SPACING] = lines[::WALLPAPER_GRID_SPACING, None, :]
+        return Image.fromarray(pixels)
+    
+    rows = gradient_rows(height, colors)
+    column = Image.frombytes('RGB', (1, height), bytes(value for row in rows for value in row))
+    img = column.resize((width, height), Image.NEAREST)
+    
+    if pattern:
+        lines = Image.frombytes('RGB', (1, height),
+                                bytes(blend(value) for row in rows for value in row))
+        mask = Image.new('L', (width, height), 0)
+        mask_draw = ImageDraw.Draw(mask)
+        for x in range(0, width, WALLPAPER_GRID_SPACING):
+            mask_draw.line([(x, 0), (x, height)], fill=255)
+        for y in range(0, height, WALLPAPER_GRID_SPACING):
+            mask_draw.line([(0, y), (width, y)], fill=255)
+        img = Image.composite(lines.resize((width, height), Image.NEAREST), img, mask)
+    
+    return img
+
+def default_wallpaper_cache_path(theme_name, colors, width, height, pattern):
+    """Cache file for one theme/resolution/effects combination"""
+    key = json.dumps([theme_name, colors, width, height, pattern,
+                      WALLPAPER_GRID_SPACING, WALLPAPER_GRID_ALPHA])
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return os.path.join(WALLPAPER_CACHE_DIR, f"default-{theme_name}-{width}x{height}-{digest}.png")
+
+def prune_wallpaper_cache(prefix="default-", keep=8):
+    """Keep only the most recently used cached wallpapers"""
+    try:
+        entries = [os.path.join(WALLPAPER_CACHE_DIR, name) for name in os.listdir(WALLPAPER_CACHE_DIR)
+                   if name.startswith(prefix)]
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for path in entries[keep:]:
+            os.unlink(path)
+    except OSError as e:
+        logger.debug(f"Wallpaper cache prune error: {e}")
+
+class WallpaperCache:
+    """Decode/scale wallpapers off the Tk thread and keep the results
+
+    Rendering (draft-mode decode, resize, tile, blur) runs on one worker
+    thread. Finished images are kept as JPEGs on disk and as PhotoImages in
+    a byte-bounded LRU, so switching between desktops that use different
+    wallpapers only swaps the canvas image.
+    """
+    
+    def __init__(self, dispatcher, max_memory=64 * 1024 * 1024, max_disk_items=16):
+        self.dispatcher = dispatcher
+        self.max_memory = max_memory
+        self.max_disk_items = max_disk_items
+        self.photos = collections.OrderedDict()
+        self.memory_used = 0
+        self.requests = queue.Queue()
+        self.worker = None
+        self.worker_lock = threading.Lock()
+    
+    @staticmethod
+    def key(path, mode, size, blur):
+        """Cache key; includes the source's size and mtime so edits invalidate it"""
+        stat = os.stat(path)
+        return (os.path.abspath(path), stat.st_size, stat.st_mtime_ns, mode, tuple(size), blur)
+    
+    @staticmethod
+    def disk_path(key):
+        """Disk cache file for a key"""
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:16]
+        width, height = key[4]
+        return os.path.join(WALLPAPER_CACHE_DIR, f"custom-{width}x{height}-{digest}.jpg")
+    
+    def get_photo(self, key):
+        """Cached PhotoImage (Tk thread only)"""
+        photo = self.photos.get(key)
+        if photo is not None:
+            self.photos.move_to_end(key)
+        return photo
+    
+    def put_photo(self, key, photo):
+        """Add a PhotoImage, evicting least recently used ones over budget"""
+        if key in self.photos:
+            self.memory_used -= self.photo_bytes(self.photos.pop(key))
+        self.photos[key] = photo
+        self.memory_used += self.photo_bytes(photo)
+        
+        # Always keep the newest entry, even if it alone exceeds the budget
+        while self.memory_used > self.max_memory and len(self.photos) > 1:
+            _, evicted = self.photos.popitem(last=False)
+            self.memory_used -= self.photo_bytes(evicted)
+    
+    @staticmethod
+    def photo_bytes(photo):
+        return photo.width() * photo.height() * 4
+    
+    def request(self, path, mode, size, blur, callback):
+        """Render in the background; ``callback(key, photo)`` runs on the Tk thread"""
+        key = self.key(path, mode, size, blur)
+        photo = self.get_photo(key)
+        if photo is not None:
+            callback(key, photo)
+            return key
+        
+        # The worker exits when idle; queueing and that exit share a lock so
+        # a request is never left behind a worker that is about to return
+        with self.worker_lock:
+            self.requests.put((key, path, mode, size, blur, callback))
+            if self.worker is None:
+                self.worker = threading.Thread(target=self.worker_loop, daemon=True, name="Wallpaper Loader")
+                self.worker.start()
+        return key
+    
+    def worker_loop(self):
+        """Render queued wallpapers one at a time"""
+        while True:
+            try:
+                key, path, mode, size, blur, callback = self.requests.get(timeout=30)
+            except queue.Empty:
+                with self.worker_lock:
+                    if self.requests.empty():
+                        self.worker = None
+                        return
+                continue
+            
+            try:
+                img = self.load_or_render(key, path, mode, size, blur)
+                self.dispatcher.post(self.deliver, key, img, callback)
+            except Exception as e:
+                logger.error(f"Wallpaper render error ({path}): {e}")
+                self.dispatcher.post(callback, key, None)
+    
+    def deliver(self, key, img, callback):
+        """Create the PhotoImage on the Tk thread and hand it over"""
+        photo = self.get_photo(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(img)
+            self.put_photo(key, photo)
+        callback(key, photo)
+    
+    def load_or_render(self, key, path, mode, size, blur):
+        """Final image from the disk cache, rendering and storing it on a miss"""
+        cache_path = self.disk_path(key)
+        if os.path.exists(cache_path):
+            try:
+                img = Image.open(cache_path)
+                img.load()
+                os.utime(cache_path)
+                return img
+            except Exception as e:
+                logger.warning(f"Cached wallpaper unreadable, regenerating: {e}")
+        
+        img = self.render(path, mode, size, blur)
+        
+        try:
+            buffer = BytesIO()
+            img.save(buffer, format='JPEG', quality=92)
+            atomic_write(cache_path, buffer.getvalue())
+            prune_wallpaper_cache(prefix="custom-", keep=self.max_disk_items)
+        except Exception as e:
+            logger.warning(f"Wallpaper cache write error: {e}")
+        
+        return img
+    
+    @staticmethod
+    def render(path, mode, size, blur):
+        """Decode and lay out a wallpaper for a screen size"""
+        screen_width, screen_height = size
+        img = Image.open(path)
+        
+        if mode in ("stretch", "fit"):
+            # JPEG: let libjpeg decode at 1/2, 1/4 or 1/8 scale, still >= the target
+            img.draft('RGB', (screen_width, screen_height))
+        img = img.convert('RGB')
+        
+        if mode == "stretch":
+            img = img.resize((screen_width, screen_height), Image.LANCZOS, reducing_gap=3.0)
+        elif mode == "fit":
+            img.thumbnail((screen_width, screen_height), Image.LANCZOS, reducing_gap=3.0)
+        elif mode == "center":
+            bg = Image.new('RGB', (screen_width, screen_height), (0, 0, 0))
+            bg.paste(img, ((screen_width - img.width) // 2, (screen_height - img.height) // 2))
+            img = bg
+        elif mode == "tile":
+            # One row of tiles, then copies of that row
+            strip = Image.new('RGB', (screen_width, img.height))
+            for x in range(0, screen_width, img.width):
+                strip.paste(img, (x, 0))
+            bg = Image.new('RGB', (screen_width, screen_height))
+            for y in range(0, screen_height, img.height):
+                bg.paste(strip, (0, y))
+            img = bg
+        
+        if blur > 0:
+            img = img.filter(ImageFilter.GaussianBlur(radius=blur))
+        
+        return img
+
 # Enhanced Installation System
 class InstallationWizard:
     """Complete installation wizard with advanced features and display management"""
@@ -3254,95 +4738,803 @@ Thank you for choosing Berke0S Ultimate Desktop Environment!
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=4)
+            atomic_write(CONFIG_FILE, json.dumps(self.config, indent=4))
         except Exception as e:
             logger.error(f"Config save error: {e}")
 
+# Animation engine
+EASING = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t * t,
+    "ease_out": lambda t: 1 - (1 - t) ** 3,
+    "ease_in_out": lambda t: 4 * t * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2
+}
+
+class Animator:
+    """Single frame clock that drives every active tween
+
+    Tweens are time based: each tick computes progress from the elapsed
+    time, so when a frame runs late the intermediate frames are simply
+    skipped instead of queueing up. If ticks keep overrunning the frame
+    budget (or the machine is low-end) effects are switched off and new
+    animations jump straight to their final state.
+    """
+    
+    instances = {}
+    
+    def __init__(self, root, fps=60, degrade_after=10, cooldown=30):
+        self.root = root
+        self.frame_interval = 1.0 / fps
+        self.tweens = {}
+        self.tween_id = 0
+        self.after_id = None
+        self.last_tick = None
+        self.enabled = not self.is_low_end()
+        self.degraded_until = 0
+        self.degrade_after = degrade_after
+        self.cooldown = cooldown
+        self.overruns = 0
+        self.stats_data = {"frames": 0, "dropped": 0, "degraded": 0}
+        
+        if not self.enabled:
+            logger.info("Low-end hardware detected, animations disabled")
+    
+    @classmethod
+    def for_widget(cls, widget):
+        """Get (or create) the animator of a widget's Tk root"""
+        root = widget._root()
+        key = str(root)
+        animator = cls.instances.get(key)
+        if animator is None or animator.root is not root:
+            animator = cls(root)
+            cls.instances[key] = animator
+        return animator
+    
+    @staticmethod
+    def is_low_end():
+        """Single core or under 512 MB of RAM"""
+        try:
+            if (os.cpu_count() or 1) < 2:
+                return True
+            return psutil.virtual_memory().total < 512 * 1024 * 1024
+        except Exception:
+            return False
+    
+    def active(self):
+        """Whether new animations should actually animate"""
+        return self.enabled and time.monotonic() >= self.degraded_until
+    
+    def animate(self, step, duration_ms=250, easing="ease_out", on_done=None, key=None):
+        """Run ``step(value)`` with value eased from 0 to 1 over ``duration_ms``
+
+        A tween with the same ``key`` (e.g. the alpha of one window) is
+        replaced without calling its ``on_done``. Returns the tween key.
+        """
+        if key is None:
+            self.tween_id += 1
+            key = ("tween", self.tween_id)
+        self.tweens.pop(key, None)
+        
+        if not self.active():
+            self.finish_tween(step, on_done)
+            return key
+        
+        self.tweens[key] = {
+            "step": step,
+            "start": time.monotonic(),
+            "duration": max(duration_ms, 1) / 1000.0,
+            "easing": EASING.get(easing, EASING["ease_out"]),
+            "on_done": on_done
+        }
+        
+        if self.after_id is None:
+            self.last_tick = time.monotonic()
+            self.after_id = self.root.after(0, self.tick)
+        return key
+    
+    def cancel(self, key, finish=False):
+        """Stop a tween; with ``finish`` jump it to its end state"""
+        tween = self.tweens.pop(key, None)
+        if tween and finish:
+            self.finish_tween(tween["step"], tween["on_done"])
+    
+    def finish_tween(self, step, on_done):
+        """Apply the final frame and completion callback"""
+        try:
+            step(1.0)
+        except tk.TclError:
+            pass
+        except Exception as e:
+            logger.error(f"Animation step error: {e}")
+        if on_done:
+            try:
+                on_done()
+            except Exception as e:
+                logger.error(f"Animation completion error: {e}")
+    
+    def tick(self):
+        """Advance all tweens by one frame"""
+        self.after_id = None
+        now = time.monotonic()
+        
+        # Frames that should have happened since the last tick were dropped
+        late = now - self.last_tick - self.frame_interval
+        if late > self.frame_interval:
+            self.stats_data["dropped"] += int(late / self.frame_interval)
+        self.last_tick = now
+        self.stats_data["frames"] += 1
+        
+        for key, tween in list(self.tweens.items()):
+            progress = min(1.0, (now - tween["start"]) / tween["duration"])
+            if progress >= 1.0:
+                self.tweens.pop(key, None)
+                self.finish_tween(tween["step"], tween["on_done"])
+                continue
+            try:
+                tween["step"](tween["easing"](progress))
+            except tk.TclError:
+                # Widget destroyed mid-animation
+                self.tweens.pop(key, None)
+                self.finish_tween(lambda value: None, tween["on_done"])
+            except Exception as e:
+                logger.error(f"Animation step error: {e}")
+                self.tweens.pop(key, None)
+        
+        work = time.monotonic() - now
+        self.check_load(work + max(late, 0))
+        
+        if self.tweens:
+            delay = max(1, int((self.frame_interval - work) * 1000))
+            try:
+                self.after_id = self.root.after(delay, self.tick)
+            except tk.TclError:
+                self.tweens.clear()
+    
+    def check_load(self, frame_cost):
+        """Turn effects off for a while when frames keep overrunning"""
+        if frame_cost > self.frame_interval * 2:
+            self.overruns += 1
+        else:
+            self.overruns = max(0, self.overruns - 1)
+        
+        if self.overruns >= self.degrade_after:
+            self.overruns = 0
+            self.degraded_until = time.monotonic() + self.cooldown
+            self.stats_data["degraded"] += 1
+            logger.warning(f"UI under load, animations disabled for {self.cooldown}s")
+            for key in list(self.tweens):
+                self.cancel(key, finish=True)
+    
+    def stats(self):
+        """Snapshot of animation statistics"""
+        data = dict(self.stats_data)
+        data["active"] = len(self.tweens)
+        data["enabled"] = self.active()
+        return data
+    
+    def stop(self):
+        """Finish every running tween and stop the clock"""
+        for key in list(self.tweens):
+            self.cancel(key, finish=True)
+        if self.after_id:
+            try:
+                self.root.after_cancel(self.after_id)
+            except tk.TclError:
+                pass
+            self.after_id = None
+
+# Main-thread UI dispatcher
+class UIDispatcher:
+    """Runs callables posted from background threads on the Tk main thread
+
+    Tk is not thread-safe, so services never touch widgets directly. They
+    post closures (or widget option updates, which are coalesced so only
+    the newest value per option is applied) to a lock-free deque that a
+    single ``after()`` pump drains within a per-tick time budget.
+    """
+    
+    def __init__(self, root, budget_ms=8, interval_ms=16, idle_interval_ms=50, report_interval=60):
+        self.root = root
+        self.budget = budget_ms / 1000.0
+        self.interval_ms = interval_ms
+        self.idle_interval_ms = idle_interval_ms
+        self.report_interval = report_interval
+        self.last_report = time.monotonic()
+        self.main_thread = threading.current_thread()
+        self.running = True
+        
+        # deque.append/popleft are atomic, so producers never take a lock
+        self.queue = collections.deque()
+        
+        # Latest value per (id(widget), option); tk.Variable is not hashable
+        self.latest = {}
+        
+        self.stats_data = {
+            "executed": 0,
+            "coalesced": 0,
+            "errors": 0,
+            "max_latency_ms": 0.0,
+            "avg_latency_ms": 0.0,
+            "max_depth": 0,
+            "overruns": 0
+        }
+        
+        self.root.after(self.interval_ms, self.pump)
+    
+    def in_main_thread(self):
+        """Whether the caller runs on the Tk thread"""
+        return threading.current_thread() is self.main_thread
+    
+    def post(self, func, *args, **kwargs):
+        """Queue func(*args, **kwargs) to run on the Tk thread"""
+        self.queue.append((time.monotonic(), func, args, kwargs))
+    
+    def call(self, func, *args, **kwargs):
+        """Run func now if on the Tk thread, otherwise post it"""
+        if self.in_main_thread():
+            func(*args, **kwargs)
+        else:
+            self.post(func, *args, **kwargs)
+    
+    def post_config(self, widget, **options):
+        """Queue widget option changes; only the newest value per option is applied"""
+        now = time.monotonic()
+        for option, value in options.items():
+            key = (id(widget), option)
+            if key in self.latest:
+                self.stats_data["coalesced"] += 1
+            self.latest[key] = (widget, value, now)
+            self.queue.append((now, None, key, None))
+    
+    def post_set(self, variable, value):
+        """Queue a Tk variable update, coalesced like post_config"""
+        now = time.monotonic()
+        key = (id(variable), "value")
+        if key in self.latest:
+            self.stats_data["coalesced"] += 1
+        self.latest[key] = (variable, value, now)
+        self.queue.append((now, None, key, None))
+    
+    def pump(self):
+        """Drain the queue on the Tk thread until the tick budget is spent"""
+        if not self.running:
+            return
+        
+        start = time.monotonic()
+        deadline = start + self.budget
+        depth = len(self.queue)
+        if depth > self.stats_data["max_depth"]:
+            self.stats_data["max_depth"] = depth
+        
+        while self.queue:
+            if time.monotonic() >= deadline:
+                self.stats_data["overruns"] += 1
+                break
+            
+            posted_at, func, args, kwargs = self.queue.popleft()
+            try:
+                if func is None:
+                    # Coalesced update; a later entry may have applied it already
+                    entry = self.latest.pop(args, None)
+                    if entry is None:
+                        continue
+                    target, value, posted_at = entry
+                    if args[1] == "value":
+                        target.set(value)
+                    else:
+                        target.configure(**{args[1]: value})
+                else:
+                    func(*args, **kwargs)
+            except tk.TclError:
+                # Widget destroyed while the update was queued
+                pass
+            except Exception as e:
+                self.stats_data["errors"] += 1
+                logger.error(f"UI dispatcher callback error: {e}")
+            
+            self.record_latency(time.monotonic() - posted_at)
+        
+        if start - self.last_report >= self.report_interval:
+            self.last_report = start
+            self.report()
+        
+        try:
+            self.root.after(self.interval_ms if self.queue else self.idle_interval_ms, self.pump)
+        except tk.TclError:
+            self.running = False
+    
+    def record_latency(self, latency):
+        """Update post-to-run latency statistics"""
+        stats = self.stats_data
+        latency_ms = latency * 1000.0
+        stats["executed"] += 1
+        stats["avg_latency_ms"] += (latency_ms - stats["avg_latency_ms"]) * 0.05
+        if latency_ms > stats["max_latency_ms"]:
+            stats["max_latency_ms"] = latency_ms
+    
+    def report(self):
+        """Log latency and queue depth; warn when the UI thread falls behind"""
+        stats = self.stats()
+        message = (f"UI dispatcher: {stats['executed']} run, {stats['coalesced']} coalesced, "
+                   f"latency avg {stats['avg_latency_ms']:.1f} ms / max {stats['max_latency_ms']:.1f} ms, "
+                   f"queue {stats['queue_depth']} (max {stats['max_depth']})")
+        if stats["max_latency_ms"] > 250:
+            logger.warning(message)
+        else:
+            logger.debug(message)
+    
+    def stats(self):
+        """Snapshot of dispatcher statistics"""
+        data = dict(self.stats_data)
+        data["queue_depth"] = len(self.queue)
+        return data
+    
+    def stop(self):
+        """Stop pumping (queued work is dropped)"""
+        self.running = False
+        self.queue.clear()
+        self.latest.clear()
+
+# Persistent notification history
+class NotificationHistoryStore:
+    """SQLite-backed notification history with keyset-paged queries
+
+    Writes are queued and committed in batches by a background thread so
+    sending a notification never waits on the disk. Reads share the same
+    connection under a lock and only ever fetch one page of rows.
+    """
+    
+    def __init__(self, db_path=DATABASE_FILE, max_rows=5000, prune_every=100):
+        self.db_path = db_path
+        self.max_rows = max_rows
+        self.prune_every = prune_every
+        self.inserts_since_prune = 0
+        self.lock = threading.Lock()
+        self.write_queue = queue.Queue()
+        self.conn = None
+        self.next_id = 1
+        
+        try:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            row = self.conn.execute("SELECT MAX(id) FROM notification_history").fetchone()
+            self.next_id = (row[0] or 0) + 1
+            self.prune()
+        except Exception as e:
+            logger.error(f"Notification history store error: {e}")
+            self.conn = None
+        
+        self.writer = threading.Thread(target=self.writer_loop, daemon=True, name="Notification History")
+        self.writer.start()
+    
+    def add(self, notification):
+        """Queue a notification for storage and return its history id"""
+        history_id = self.next_id
+        self.next_id += 1
+        timestamp = notification["timestamp"]
+        self.write_queue.put(("insert", (
+            history_id,
+            notification["title"],
+            notification["message"],
+            notification["type"],
+            notification.get("source") or notification["title"],
+            notification.get("count", 1),
+            timestamp.timestamp() if isinstance(timestamp, datetime.datetime) else timestamp
+        )))
+        return history_id
+    
+    def update_count(self, history_id, count, timestamp):
+        """Queue a duplicate-count update; the row moves to ``timestamp``"""
+        self.write_queue.put(("count", (
+            count,
+            timestamp.timestamp() if isinstance(timestamp, datetime.datetime) else timestamp,
+            history_id
+        )))
+    
+    def clear(self):
+        """Queue deletion of the whole history"""
+        self.write_queue.put(("clear", None))
+    
+    def writer_loop(self):
+        """Commit queued writes in batches until close()"""
+        stopping = False
+        while not stopping:
+            batch = [self.write_queue.get()]
+            try:
+                while len(batch) < 500:
+                    batch.append(self.write_queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            try:
+                if self.conn:
+                    with self.lock:
+                        for op, params in batch:
+                            if op == "insert":
+                                self.conn.execute(
+                                    "INSERT OR REPLACE INTO notification_history "
+                                    "(id, title, message, type, source, count, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                                    params
+                                )
+                                self.inserts_since_prune += 1
+                            elif op == "count":
+                                self.conn.execute(
+                                    "UPDATE notification_history SET count = ?, timestamp = ? WHERE id = ?", params)
+                            elif op == "clear":
+                                self.conn.execute("DELETE FROM notification_history")
+                            elif op == "stop":
+                                stopping = True
+                        self.conn.commit()
+                    # Long sessions keep inserting, so max_rows is enforced here too
+                    if self.inserts_since_prune >= self.prune_every:
+                        self.inserts_since_prune = 0
+                        self.prune()
+            except Exception as e:
+                logger.error(f"Notification history write error: {e}")
+            finally:
+                for _ in batch:
+                    self.write_queue.task_done()
+        
+        with self.lock:
+            if self.conn:
+                self.conn.close()
+                self.conn = None
+    
+    def flush(self):
+        """Block until every queued write is committed"""
+        self.write_queue.join()
+    
+    def close(self, timeout=5):
+        """Commit what is queued and close the database (shutdown)"""
+        if self.writer.is_alive():
+            self.write_queue.put(("stop", None))
+            self.writer.join(timeout)
+    
+    def prune(self):
+        """Drop the oldest rows beyond max_rows"""
+        with self.lock:
+            self.conn.execute(
+                "DELETE FROM notification_history WHERE id <= "
+                "(SELECT id FROM notification_history ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                (self.max_rows,)
+            )
+            self.conn.commit()
+    
+    def query_page(self, limit=50, before=None, notification_type=None, source=None):
+        """Fetch one page, newest first
+
+        ``before`` is the (timestamp, id) of the last row of the previous
+        page, so every page is an index range scan instead of an OFFSET.
+        """
+        if not self.conn:
+            return []
+        
+        where = []
+        params = []
+        if notification_type:
+            where.append("type = ?")
+            params.append(notification_type)
+        if source:
+            where.append("source = ?")
+            params.append(source)
+        if before:
+            where.append("(timestamp < ? OR (timestamp = ? AND id < ?))")
+            params.extend([before[0], before[0], before[1]])
+        
+        sql = "SELECT id, title, message, type, source, count, timestamp FROM notification_history"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY timestamp DESC, id DESC LIMIT ?"
+        params.append(limit)
+        
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        
+        return [
+            {
+                "id": row[0], "title": row[1], "message": row[2], "type": row[3],
+                "source": row[4], "count": row[5], "timestamp": row[6]
+            }
+            for row in rows
+        ]
+    
+    def distinct_values(self, column):
+        """Distinct types or sources for the filter menus"""
+        if not self.conn or column not in ("type", "source"):
+            return []
+        with self.lock:
+            rows = self.conn.execute(
+                f"SELECT DISTINCT {column} FROM notification_history ORDER BY {column}").fetchall()
+        return [row[0] for row in rows if row[0]]
+
 # Enhanced Notification System (keeping existing implementation)
 class NotificationSystem:
-    """Advanced notification system with rich features"""
+    """Advanced notification system with rich features
+
+    Notification windows come from a small pool of pre-built Toplevels that
+    are re-filled instead of re-created. Identical title/message pairs are
+    merged into a count badge, each source is rate limited, and at most
+    ``max_visible`` windows are on screen with the rest queued.
+    """
     
     def __init__(self, wm):
         self.wm = wm
         self.notifications = []
         self.notification_id = 0
-        self.notification_history = []
         self.max_history = 100
+        self.notification_history = collections.deque(maxlen=self.max_history)
+        self.history_page_size = 50
+        self.window_pool = []
+        self.pending = collections.deque()
+        self.rate_limits = {}
         
-    def send(self, title, message, timeout=5000, notification_type="info", actions=None, icon=None):
-        """Send a rich notification"""
+        settings = wm.config.get("notifications", {}) if hasattr(wm, 'config') else {}
+        self.max_visible = settings.get("max_visible", 4)
+        self.max_pending = settings.get("max_pending", 20)
+        self.rate_burst = settings.get("rate_burst", 3)
+        self.rate_interval = settings.get("rate_interval", 300)
+        
+        # Full history lives in SQLite; the deque only backs the in-memory fallback
+        self.history_store = None
+        if os.path.exists(DATABASE_FILE):
+            self.history_store = NotificationHistoryStore(max_rows=settings.get("history_limit", 5000))
+            if not self.history_store.conn:
+                self.history_store = None
+        
+    def send(self, title, message, timeout=5000, notification_type="info", actions=None, icon=None, source=None):
+        """Send a rich notification (safe to call from any thread)"""
         try:
             if not hasattr(self.wm, 'root') or not self.wm.root:
                 return
+            
+            # Background services hand the call over to the Tk thread
+            dispatcher = getattr(self.wm, 'dispatcher', None)
+            if dispatcher and not dispatcher.in_main_thread():
+                dispatcher.post(self.send, title, message, timeout, notification_type, actions, icon, source)
+                return
+            
+            # Merge with an identical notification on screen or waiting
+            key = (title, message)
+            for notification in list(self.notifications) + list(self.pending):
+                if notification["key"] == key:
+                    self.bump_notification(notification)
+                    return
+            
+            # Only background services name a source; saves, errors and
+            # user actions are never rate limited
+            suppressed = self.check_rate_limit(source) if source else 0
+            if suppressed is None:
+                return
                 
             self.notification_id += 1
             
             # Store in history
             notification_data = {
                 "id": self.notification_id,
+                "key": key,
                 "title": title,
                 "message": message,
                 "type": notification_type,
+                "source": source or title,
                 "timestamp": datetime.datetime.now(),
-                "actions": actions or []
+                "actions": actions or [],
+                "icon": icon,
+                "timeout": timeout,
+                "count": 1 + suppressed
             }
             self.notification_history.append(notification_data)
+            if self.history_store:
+                notification_data["history_id"] = self.history_store.add(notification_data)
             
-            # Limit history size
-            if len(self.notification_history) > self.max_history:
-                self.notification_history.pop(0)
-            
-            # Create notification window
-            notif = tk.Toplevel(self.wm.root)
-            notif.withdraw()
-            notif.overrideredirect(True)
-            notif.attributes('-topmost', True)
-            notif.configure(bg='#1a1a1a')
-            
-            # Enhanced positioning
-            screen_width = self.wm.root.winfo_screenwidth()
-            screen_height = self.wm.root.winfo_screenheight()
-            
-            notif_width = 400
-            notif_height = 100 + (len(actions) * 30 if actions else 0)
-            
-            position = self.wm.config.get("notifications", {}).get("position", "top-right")
+            if len(self.notifications) < self.max_visible:
+                self.display_notification(notification_data)
+            else:
+                # Bound the backlog; dropped entries stay in history
+                self.pending.append(notification_data)
+                while len(self.pending) > self.max_pending:
+                    self.pending.popleft()
+                
+        except Exception as e:
+            logger.error(f"Notification error: {e}")
+    
+    def check_rate_limit(self, source):
+        """Token-bucket rate limit per source with hysteresis
+
+        Returns the number of notifications suppressed since the source was
+        last shown, or None if this one should be dropped. Once a source runs
+        out of tokens it stays quiet until its bucket has fully refilled, so
+        a value hovering around a threshold does not flap.
+        """
+        now = time.monotonic()
+        state = self.rate_limits.setdefault(source, {
+            "tokens": float(self.rate_burst), "last": now, "throttled": False, "dropped": 0
+        })
+        
+        state["tokens"] = min(float(self.rate_burst),
+                              state["tokens"] + (now - state["last"]) * self.rate_burst / self.rate_interval)
+        state["last"] = now
+        
+        if state["throttled"]:
+            if state["tokens"] < self.rate_burst:
+                state["dropped"] += 1
+                return None
+            state["throttled"] = False
+            
+        if state["tokens"] < 1:
+            state["throttled"] = True
+            state["dropped"] += 1
+            return None
+        
+        state["tokens"] -= 1
+        dropped, state["dropped"] = state["dropped"], 0
+        return dropped
+    
+    def bump_notification(self, notification):
+        """Fold a duplicate into an existing notification"""
+        try:
+            notification["count"] += 1
+            notification["timestamp"] = datetime.datetime.now()
+            if self.history_store and "history_id" in notification:
+                self.history_store.update_count(notification["history_id"], notification["count"],
+                                                notification["timestamp"])
             
-            if position == "top-right":
-                x = screen_width - notif_width - 20
-                y = 20 + len(self.notifications) * (notif_height + 10)
-            elif position == "top-left":
-                x = 20
-                y = 20 + len(self.notifications) * (notif_height + 10)
-            elif position == "bottom-right":
-                x = screen_width - notif_width - 20
-                y = screen_height - notif_height - 20 - len(self.notifications) * (notif_height + 10)
-            else:  # bottom-left
-                x = 20
-                y = screen_height - notif_height - 20 - len(self.notifications) * (notif_height + 10)
+            slot = notification.get("slot")
+            if slot:
+                self.update_count_badge(slot, notification["count"])
+                self.schedule_auto_close(notification)
+                
+        except Exception as e:
+            logger.error(f"Notification merge error: {e}")
+    
+    def prebuild_pool(self):
+        """Create the notification windows ahead of the first notification"""
+        try:
+            while len(self.window_pool) + len(self.notifications) < self.max_visible:
+                self.window_pool.append(self.create_notification_slot())
+        except Exception as e:
+            logger.error(f"Notification pool error: {e}")
+    
+    def acquire_slot(self):
+        """Take a window from the pool, building one if it is empty"""
+        if self.window_pool:
+            return self.window_pool.pop()
+        return self.create_notification_slot()
+    
+    def release_slot(self, slot):
+        """Hide a notification window and return it to the pool"""
+        try:
+            slot["notification"] = None
+            slot["window"].withdraw()
+            if len(self.window_pool) < self.max_visible:
+                self.window_pool.append(slot)
+            else:
+                slot["window"].destroy()
+        except Exception as e:
+            logger.error(f"Notification release error: {e}")
+        
+        self.show_pending()
+    
+    def show_pending(self):
+        """Fill free screen positions from the queue"""
+        while self.pending and len(self.notifications) < self.max_visible:
+            self.display_notification(self.pending.popleft())
+    
+    def notification_height(self, notification):
+        """Window height for a notification"""
+        return 100 + len(notification.get("actions") or []) * 30
+    
+    def notification_position(self, index, height):
+        """Screen position of the ``index``-th visible notification"""
+        notif_width = 400
+        screen_width = self.wm.root.winfo_screenwidth()
+        screen_height = self.wm.root.winfo_screenheight()
+        
+        # Stack below/above the windows already shown
+        offset = 20 + sum(self.notification_height(n) + 10 for n in self.notifications[:index])
+        
+        position = self.wm.config.get("notifications", {}).get("position", "top-right")
+        
+        if position == "top-right":
+            return screen_width - notif_width - 20, offset
+        elif position == "top-left":
+            return 20, offset
+        elif position == "bottom-right":
+            return screen_width - notif_width - 20, screen_height - height - offset
+        else:  # bottom-left
+            return 20, screen_height - height - offset
+    
+    def display_notification(self, notification):
+        """Put a notification on screen in a pooled window"""
+        try:
+            slot = self.acquire_slot()
+            slot["notification"] = notification
+            notification["slot"] = slot
+            notification["window"] = slot["window"]
             
-            notif.geometry(f"{notif_width}x{notif_height}+{x}+{y}")
+            self.fill_notification_slot(slot, notification)
             
-            # Create notification content
-            self.create_notification_content(notif, title, message, notification_type, actions, icon)
+            height = self.notification_height(notification)
+            x, y = self.notification_position(len(self.notifications), height)
+            slot["window"].geometry(f"400x{height}+{x}+{y}")
             
-            # Store notification
-            notification_data["window"] = notif
-            self.notifications.append(notification_data)
+            self.notifications.append(notification)
             
             # Show with animation
-            self.animate_notification(notif, "show")
+            self.animate_notification(slot["window"], "show")
             
             # Auto close
-            if timeout > 0:
-                self.wm.root.after(timeout, lambda: self.close_notification(notification_data))
-                
+            self.schedule_auto_close(notification)
+            
         except Exception as e:
-            logger.error(f"Notification error: {e}")
+            logger.error(f"Notification display error: {e}")
+    
+    def schedule_auto_close(self, notification):
+        """(Re)start the auto-close timer of a visible notification"""
+        if notification.get("timer"):
+            self.wm.root.after_cancel(notification["timer"])
+            notification["timer"] = None
+        
+        if notification.get("timeout", 0) > 0:
+            notification["timer"] = self.wm.root.after(
+                notification["timeout"], lambda: self.close_notification(notification))
+            
+    def create_notification_slot(self):
+        """Build a reusable notification window with empty content widgets"""
+        notif = tk.Toplevel(self.wm.root)
+        notif.withdraw()
+        notif.overrideredirect(True)
+        notif.attributes('-topmost', True)
+        notif.configure(bg='#1a1a1a')
+        
+        slot = {"window": notif, "notification": None, "action_buttons": []}
+        
+        # Main container
+        main_frame = tk.Frame(notif, bg='#2a2a2a', relief=tk.RAISED, bd=2)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=3, pady=3)
+        
+        # Header with colored stripe
+        slot["header"] = tk.Frame(main_frame, height=30)
+        slot["header"].pack(fill=tk.X)
+        slot["header"].pack_propagate(False)
+        
+        # Icon and title
+        slot["title_frame"] = tk.Frame(slot["header"])
+        slot["title_frame"].pack(fill=tk.X, padx=10, pady=5)
+        
+        slot["icon"] = tk.Label(slot["title_frame"], font=('Arial', 12))
+        slot["icon"].pack(side=tk.LEFT)
+        
+        slot["title"] = tk.Label(slot["title_frame"], font=('Arial', 10, 'bold'))
+        slot["title"].pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Close button
+        slot["close"] = tk.Label(slot["title_frame"], text="✕", font=('Arial', 8), cursor='hand2')
+        slot["close"].pack(side=tk.RIGHT)
+        slot["close"].bind('<Button-1>', lambda e: self.close_slot(slot))
+        
+        # Duplicate counter, packed only when count > 1
+        slot["badge"] = tk.Label(slot["title_frame"], bg='#1a1a1a', fg='white',
+                                 font=('Arial', 8, 'bold'), padx=4)
+        
+        # Message content
+        slot["content"] = tk.Frame(main_frame, bg='#3a3a3a')
+        slot["content"].pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        slot["message"] = tk.Label(slot["content"], bg='#3a3a3a', fg='white',
+                                   font=('Arial', 9), wraplength=360, justify=tk.LEFT, anchor='nw')
+        slot["message"].pack(fill=tk.X, pady=(0, 5))
+        
+        # Action buttons are created on demand and kept for reuse
+        slot["action_frame"] = tk.Frame(slot["content"], bg='#3a3a3a')
+        
+        # Progress bar for timed notifications
+        slot["progress_frame"] = tk.Frame(slot["content"], bg='#3a3a3a', height=3)
+        slot["progress_bar"] = tk.Frame(slot["progress_frame"], height=3)
+        slot["progress_bar"].pack(side=tk.LEFT, fill=tk.Y)
+        
+        return slot
             
-    def create_notification_content(self, notif, title, message, notif_type, actions, icon):
-        """Create enhanced notification content"""
+    def fill_notification_slot(self, slot, notification):
+        """Configure a pooled window for a notification"""
         try:
             # Color scheme based on type
             colors = {
@@ -3353,68 +5545,68 @@ class NotificationSystem:
                 "system": {"icon": "🔧", "color": "#6c757d", "text_color": "white"}
             }
             
+            notif_type = notification["type"]
             config = colors.get(notif_type, colors["info"])
             
-            # Main container
-            main_frame = tk.Frame(notif, bg='#2a2a2a', relief=tk.RAISED, bd=2)
-            main_frame.pack(fill=tk.BOTH, expand=True, padx=3, pady=3)
-            
-            # Header with colored stripe
-            header_frame = tk.Frame(main_frame, bg=config["color"], height=30)
-            header_frame.pack(fill=tk.X)
-            header_frame.pack_propagate(False)
-            
-            # Icon and title
-            title_frame = tk.Frame(header_frame, bg=config["color"])
-            title_frame.pack(fill=tk.X, padx=10, pady=5)
-            
-            # Icon
-            icon_text = icon if icon else config["icon"]
-            tk.Label(title_frame, text=icon_text, bg=config["color"], 
-                    fg=config["text_color"], font=('Arial', 12)).pack(side=tk.LEFT)
-            
-            # Title
-            tk.Label(title_frame, text=title, bg=config["color"], 
-                    fg=config["text_color"], font=('Arial', 10, 'bold')).pack(side=tk.LEFT, padx=(10, 0))
-            
-            # Close button
-            close_btn = tk.Label(title_frame, text="✕", bg=config["color"], 
-                               fg=config["text_color"], font=('Arial', 8), cursor='hand2')
-            close_btn.pack(side=tk.RIGHT)
-            close_btn.bind('<Button-1>', lambda e: self.close_notification_by_window(notif))
-            
-            # Message content
-            content_frame = tk.Frame(main_frame, bg='#3a3a3a')
-            content_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+            for name in ("header", "title_frame"):
+                slot[name].configure(bg=config["color"])
+            for name in ("icon", "title", "close"):
+                slot[name].configure(bg=config["color"], fg=config["text_color"])
             
-            # Message text
-            msg_label = tk.Label(content_frame, text=message, bg='#3a3a3a', fg='white', 
-                               font=('Arial', 9), wraplength=360, justify=tk.LEFT, anchor='nw')
-            msg_label.pack(fill=tk.X, pady=(0, 5))
+            slot["icon"].configure(text=notification["icon"] or config["icon"])
+            slot["title"].configure(text=notification["title"])
+            slot["message"].configure(text=notification["message"])
+            self.update_count_badge(slot, notification["count"])
             
             # Action buttons
-            if actions:
-                action_frame = tk.Frame(content_frame, bg='#3a3a3a')
-                action_frame.pack(fill=tk.X)
-                
-                for action in actions:
-                    btn = tk.Button(action_frame, text=action.get("text", "Action"),
-                                   command=lambda a=action: self.handle_notification_action(notif, a),
-                                   bg=config["color"], fg=config["text_color"],
-                                   font=('Arial', 8), relief=tk.FLAT, padx=10, pady=2)
+            actions = notification["actions"]
+            while len(slot["action_buttons"]) < len(actions):
+                index = len(slot["action_buttons"])
+                btn = tk.Button(slot["action_frame"], font=('Arial', 8), relief=tk.FLAT, padx=10, pady=2,
+                                command=lambda i=index: self.handle_slot_action(slot, i))
+                slot["action_buttons"].append(btn)
+            
+            for index, btn in enumerate(slot["action_buttons"]):
+                if index < len(actions):
+                    btn.configure(text=actions[index].get("text", "Action"),
+                                  bg=config["color"], fg=config["text_color"])
                     btn.pack(side=tk.LEFT, padx=(0, 5))
+                else:
+                    btn.pack_forget()
+            
+            if actions:
+                slot["action_frame"].pack(fill=tk.X)
+            else:
+                slot["action_frame"].pack_forget()
             
-            # Progress bar for timed notifications
             if notif_type in ["info", "system"]:
-                progress_frame = tk.Frame(content_frame, bg='#3a3a3a', height=3)
-                progress_frame.pack(fill=tk.X, side=tk.BOTTOM)
-                
-                progress_bar = tk.Frame(progress_frame, bg=config["color"], height=3)
-                progress_bar.pack(side=tk.LEFT, fill=tk.Y)
+                slot["progress_bar"].configure(bg=config["color"])
+                slot["progress_frame"].pack(fill=tk.X, side=tk.BOTTOM)
+            else:
+                slot["progress_frame"].pack_forget()
                 
         except Exception as e:
             logger.error(f"Notification content creation error: {e}")
     
+    def update_count_badge(self, slot, count):
+        """Show or hide the ×N badge of a pooled window"""
+        if count > 1:
+            slot["badge"].configure(text=f"×{count}")
+            slot["badge"].pack(side=tk.RIGHT, padx=(0, 6), before=slot["close"])
+        else:
+            slot["badge"].pack_forget()
+    
+    def handle_slot_action(self, slot, index):
+        """Dispatch an action button of a pooled window"""
+        notification = slot.get("notification")
+        if notification and index < len(notification["actions"]):
+            self.handle_notification_action(slot["window"], notification["actions"][index])
+    
+    def close_slot(self, slot):
+        """Close whatever notification a pooled window is showing"""
+        if slot.get("notification"):
+            self.close_notification(slot["notification"])
+    
     def handle_notification_action(self, notif, action):
         """Handle notification action button click"""
         try:
@@ -3434,9 +5626,11 @@ class NotificationSystem:
                 self.close_notification(notification)
                 break
     
-    def animate_notification(self, notif, action):
+    def animate_notification(self, notif, action, on_done=None):
         """Enhanced notification animation"""
         try:
+            animator = Animator.for_widget(self.wm.root)
+            
             if action == "show":
                 notif.deiconify()
                 notif.attributes('-alpha', 0)
@@ -3445,41 +5639,42 @@ class NotificationSystem:
                 start_x = notif.winfo_x() + 50
                 target_x = notif.winfo_x()
                 
-                def slide_in(step=0):
-                    if step <= 10:
-                        progress = step / 10
-                        current_x = start_x + (target_x - start_x) * progress
-                        alpha = progress * 0.95
+                def slide_in(progress):
+                    current_x = start_x + (target_x - start_x) * progress
+                    notif.geometry(f"{notif.winfo_width()}x{notif.winfo_height()}+{int(current_x)}+{notif.winfo_y()}")
+                    notif.attributes('-alpha', progress * 0.95)
                         
-                        notif.geometry(f"{notif.winfo_width()}x{notif.winfo_height()}+{int(current_x)}+{notif.winfo_y()}")
-                        notif.attributes('-alpha', alpha)
-                        
-                        self.wm.root.after(20, lambda: slide_in(step + 1))
-                        
-                slide_in()
+                animator.animate(slide_in, 220, key=("notification", str(notif)))
                 
             elif action == "hide":
-                def fade_out(alpha=0.95):
-                    if alpha >= 0:
-                        notif.attributes('-alpha', alpha)
-                        self.wm.root.after(50, lambda: fade_out(alpha - 0.1))
-                    else:
-                        notif.destroy()
-                        
-                fade_out()
+                def fade_out(progress):
+                    notif.attributes('-alpha', 0.95 * (1 - progress))
+                    
+                animator.animate(fade_out, 400, easing="ease_in", key=("notification", str(notif)),
+                                 on_done=on_done or notif.destroy)
                 
         except Exception as e:
             logger.error(f"Animation error: {e}")
             if action == "hide":
-                notif.destroy()
+                if on_done:
+                    on_done()
+                else:
+                    notif.destroy()
     
     def close_notification(self, notification):
         """Close a specific notification"""
         try:
             if notification in self.notifications:
                 self.notifications.remove(notification)
-                if "window" in notification:
-                    self.animate_notification(notification["window"], "hide")
+                if notification.get("timer"):
+                    self.wm.root.after_cancel(notification["timer"])
+                    notification["timer"] = None
+                
+                slot = notification.pop("slot", None)
+                notification.pop("window", None)
+                if slot:
+                    self.animate_notification(slot["window"], "hide",
+                                              on_done=lambda: self.release_slot(slot))
                 self.reposition_notifications()
         except Exception as e:
             logger.error(f"Close notification error: {e}")
@@ -3487,35 +5682,17 @@ class NotificationSystem:
     def reposition_notifications(self):
         """Reposition remaining notifications"""
         try:
-            position = self.wm.config.get("notifications", {}).get("position", "top-right")
-            screen_width = self.wm.root.winfo_screenwidth()
-            screen_height = self.wm.root.winfo_screenheight()
-            
             for i, notification in enumerate(self.notifications):
                 if "window" in notification:
-                    notif = notification["window"]
-                    width, height = 400, 100
-                    
-                    if position == "top-right":
-                        x = screen_width - width - 20
-                        y = 20 + i * (height + 10)
-                    elif position == "top-left":
-                        x = 20
-                        y = 20 + i * (height + 10)
-                    elif position == "bottom-right":
-                        x = screen_width - width - 20
-                        y = screen_height - height - 20 - i * (height + 10)
-                    else:  # bottom-left
-                        x = 20
-                        y = screen_height - height - 20 - i * (height + 10)
-                    
-                    notif.geometry(f"{width}x{height}+{x}+{y}")
+                    height = self.notification_height(notification)
+                    x, y = self.notification_position(i, height)
+                    notification["window"].geometry(f"400x{height}+{x}+{y}")
                     
         except Exception as e:
             logger.error(f"Reposition error: {e}")
     
     def show_notification_center(self):
-        """Show notification center with history"""
+        """Show notification center with persistent, paged history"""
         try:
             center = tk.Toplevel(self.wm.root)
             center.title("Notification Center")
@@ -3529,88 +5706,538 @@ class NotificationSystem:
             
             tk.Label(header, text="📢 Notification Center", 
                     bg=self.wm.get_theme_color("accent"), fg="white",
-                    font=('Arial', 14, 'bold')).pack(pady=15)
+                    font=('Arial', 14, 'bold')).pack(side=tk.LEFT, padx=10, pady=15)
             
-            # Clear all button
-            tk.Button(header, text="Clear All", command=self.clear_all_notifications,
-                     bg=self.wm.get_theme_color("error"), fg="white").pack(side=tk.RIGHT, padx=10, pady=10)
-            
-            # Notification list
-            list_frame = tk.Frame(center, bg=self.wm.get_theme_color("window"))
-            list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            # Filters
+            filter_frame = tk.Frame(center, bg=self.wm.get_theme_color("window"))
+            filter_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
             
-            # Scrollable list
-            canvas = tk.Canvas(list_frame, bg=self.wm.get_theme_color("window"))
-            scrollbar = tk.Scrollbar(list_frame, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas, bg=self.wm.get_theme_color("window"))
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
+            type_var = tk.StringVar(value="All")
+            source_var = tk.StringVar(value="All")
             
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
+            tk.Label(filter_frame, text="Type:", bg=self.wm.get_theme_color("window"),
+                    fg=self.wm.get_theme_color("fg")).pack(side=tk.LEFT)
+            type_combo = ttk.Combobox(filter_frame, textvariable=type_var, state="readonly", width=10)
+            type_combo.pack(side=tk.LEFT, padx=(5, 15))
             
-            # Display notification history
-            for notification in reversed(self.notification_history[-20:]):  # Show last 20
-                self.create_history_item(scrollable_frame, notification)
+            tk.Label(filter_frame, text="Source:", bg=self.wm.get_theme_color("window"),
+                    fg=self.wm.get_theme_color("fg")).pack(side=tk.LEFT)
+            source_combo = ttk.Combobox(filter_frame, textvariable=source_var, state="readonly", width=24)
+            source_combo.pack(side=tk.LEFT, padx=5)
             
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
+            # Notification list: one Treeview, rows fetched a page at a time
+            list_frame = tk.Frame(center, bg=self.wm.get_theme_color("window"))
+            list_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
             
-        except Exception as e:
-            logger.error(f"Notification center error: {e}")
-    
-    def create_history_item(self, parent, notification):
-        """Create a notification history item"""
-        try:
-            item_frame = tk.Frame(parent, bg=self.wm.get_theme_color("bg"), relief=tk.RAISED, bd=1)
-            item_frame.pack(fill=tk.X, pady=2, padx=5)
+            tree = ttk.Treeview(list_frame, columns=("time", "type", "source", "title"), show="headings")
+            for column, text, width in (("time", "Time", 110), ("type", "Type", 60),
+                                        ("source", "Source", 120), ("title", "Title", 190)):
+                tree.heading(column, text=text)
+                tree.column(column, width=width, stretch=(column == "title"))
             
-            # Header with type color
             colors = {
                 "info": "#4a9eff", "success": "#00ff88", 
                 "warning": "#ffb347", "error": "#ff6b6b"
             }
-            color = colors.get(notification["type"], "#4a9eff")
+            for notification_type, color in colors.items():
+                tree.tag_configure(notification_type, foreground=color)
             
-            header = tk.Frame(item_frame, bg=color, height=5)
-            header.pack(fill=tk.X)
+            scrollbar = tk.Scrollbar(list_frame, orient="vertical", command=tree.yview)
+            
+            # Message of the selected row
+            detail = tk.Label(center, text="", anchor='w', justify=tk.LEFT, wraplength=470,
+                             bg=self.wm.get_theme_color("bg"), fg=self.wm.get_theme_color("fg"),
+                             font=('Arial', 9))
+            detail.pack(fill=tk.X, padx=10, pady=(0, 10))
             
-            # Content
-            content = tk.Frame(item_frame, bg=self.wm.get_theme_color("bg"))
-            content.pack(fill=tk.X, padx=10, pady=5)
+            state = {"cursor": None, "exhausted": False, "messages": {}}
             
-            # Title and timestamp
-            title_frame = tk.Frame(content, bg=self.wm.get_theme_color("bg"))
-            title_frame.pack(fill=tk.X)
+            def current_filters():
+                notification_type = type_var.get()
+                source = source_var.get()
+                return (None if notification_type == "All" else notification_type,
+                        None if source == "All" else source)
             
-            tk.Label(title_frame, text=notification["title"], 
-                    bg=self.wm.get_theme_color("bg"), fg=self.wm.get_theme_color("fg"),
-                    font=('Arial', 10, 'bold')).pack(side=tk.LEFT)
+            def load_page():
+                if state["exhausted"]:
+                    return
+                notification_type, source = current_filters()
+                rows = self.load_history_page(before=state["cursor"],
+                                              notification_type=notification_type, source=source)
+                if len(rows) < self.history_page_size:
+                    state["exhausted"] = True
+                for row in rows:
+                    title = row["title"]
+                    if row.get("count", 1) > 1:
+                        title += f"  ×{row['count']}"
+                    timestamp = datetime.datetime.fromtimestamp(row["timestamp"]).strftime("%m-%d %H:%M:%S")
+                    iid = str(row["id"])
+                    tree.insert("", tk.END, iid=iid, values=(timestamp, row["type"], row["source"], title),
+                               tags=(row["type"],))
+                    state["messages"][iid] = row["message"]
+                    state["cursor"] = (row["timestamp"], row["id"])
+            
+            def reload(event=None):
+                tree.delete(*tree.get_children())
+                detail.configure(text="")
+                state.update(cursor=None, exhausted=False, messages={})
+                load_page()
+            
+            def on_scroll(first, last):
+                scrollbar.set(first, last)
+                # Fetch the next page before the user reaches the end
+                if float(last) > 0.9 and not state["exhausted"]:
+                    center.after_idle(load_page)
+            
+            def on_select(event):
+                selection = tree.selection()
+                if selection:
+                    detail.configure(text=state["messages"].get(selection[0], ""))
+            
+            def clear_all():
+                self.clear_all_notifications()
+                reload()
+            
+            tree.configure(yscrollcommand=on_scroll)
+            tree.bind("<<TreeviewSelect>>", on_select)
+            type_combo.bind("<<ComboboxSelected>>", reload)
+            source_combo.bind("<<ComboboxSelected>>", reload)
+            
+            types = {n["type"] for n in self.notification_history}
+            sources = {n["source"] for n in self.notification_history}
+            if self.history_store:
+                types.update(self.history_store.distinct_values("type"))
+                sources.update(self.history_store.distinct_values("source"))
+            type_combo["values"] = ["All"] + sorted(types)
+            source_combo["values"] = ["All"] + sorted(sources)
             
-            timestamp = notification["timestamp"].strftime("%H:%M")
-            tk.Label(title_frame, text=timestamp, 
-                    bg=self.wm.get_theme_color("bg"), fg=self.wm.get_theme_color("fg"),
-                    font=('Arial', 8)).pack(side=tk.RIGHT)
+            # Clear all button
+            tk.Button(header, text="Clear All", command=clear_all,
+                     bg=self.wm.get_theme_color("error"), fg="white").pack(side=tk.RIGHT, padx=10, pady=10)
+            
+            tree.pack(side="left", fill="both", expand=True)
+            scrollbar.pack(side="right", fill="y")
             
-            # Message
-            tk.Label(content, text=notification["message"], 
-                    bg=self.wm.get_theme_color("bg"), fg=self.wm.get_theme_color("fg"),
-                    font=('Arial', 9), wraplength=450, justify=tk.LEFT).pack(anchor='w')
+            load_page()
             
         except Exception as e:
-            logger.error(f"History item creation error: {e}")
+            logger.error(f"Notification center error: {e}")
+    
+    def load_history_page(self, before=None, notification_type=None, source=None):
+        """One page of history, newest first
+
+        Committed rows come from the database and the latest notifications
+        from memory, where they are current even if the writer has not
+        caught up, so opening the center never waits for the disk.
+        """
+        recent = self.recent_history_rows(notification_type, source)
+        if not self.history_store:
+            return [row for row in recent
+                    if not before or (row["timestamp"], row["id"]) < tuple(before)][:self.history_page_size]
+        
+        # The memory copy of a row wins; fetch extra so the page stays full
+        # after dropping the stored copies
+        recent_ids = {row["id"] for row in recent}
+        stored = self.history_store.query_page(self.history_page_size + len(recent_ids), before,
+                                               notification_type, source)
+        rows = [row for row in stored if row["id"] not in recent_ids]
+        rows.extend(row for row in recent if not before or (row["timestamp"], row["id"]) < tuple(before))
+        rows.sort(key=lambda row: (row["timestamp"], row["id"]), reverse=True)
+        return rows[:self.history_page_size]
+    
+    def recent_history_rows(self, notification_type=None, source=None):
+        """In-memory history as rows, newest first"""
+        rows = []
+        for notification in self.notification_history:
+            row = dict(notification, timestamp=notification["timestamp"].timestamp(),
+                       id=notification.get("history_id", notification["id"]))
+            if notification_type and row["type"] != notification_type:
+                continue
+            if source and row["source"] != source:
+                continue
+            rows.append(row)
+        # A merged duplicate moves to the time it was last seen
+        rows.sort(key=lambda row: (row["timestamp"], row["id"]), reverse=True)
+        return rows
+    
+    def close_history(self):
+        """Commit queued history writes and close the store (shutdown)"""
+        if self.history_store:
+            self.history_store.close()
     
     def clear_all_notifications(self):
         """Clear all notifications and history"""
+        # Drop queued notifications so closing doesn't pull them on screen
+        self.pending.clear()
+        
         # Close all active notifications
         for notification in self.notifications.copy():
             self.close_notification(notification)
         
-        # Clear history
-        self.notification_history.clear()
+        # Clear history
+        self.notification_history.clear()
+        if self.history_store:
+            self.history_store.clear()
+
+# Window registry and switcher
+class WindowRegistry:
+    """Focus-ordered window registry with per-desktop membership
+
+    Each desktop keeps its windows in a doubly linked MRU list (head = most
+    recently focused), so recording a focus change, moving a window between
+    desktops and stepping to the next/previous window are all O(1).
+    """
+    
+    def __init__(self):
+        self.desktop_of = {}
+        self.links = {}
+        self.heads = {}
+        self.tails = {}
+    
+    def add(self, window_id, desktop):
+        """Register a window as the most recent one on a desktop"""
+        if window_id in self.desktop_of:
+            self.remove(window_id)
+        self.desktop_of[window_id] = desktop
+        self.link_front(window_id, desktop)
+    
+    def remove(self, window_id):
+        """Forget a window"""
+        desktop = self.desktop_of.pop(window_id, None)
+        if desktop is not None:
+            self.unlink(window_id, desktop)
+    
+    def touch(self, window_id):
+        """Record that a window received focus"""
+        desktop = self.desktop_of.get(window_id)
+        if desktop is None or self.heads.get(desktop) == window_id:
+            return
+        self.unlink(window_id, desktop)
+        self.link_front(window_id, desktop)
+    
+    def move(self, window_id, desktop):
+        """Move a window to another desktop, keeping it most recent there"""
+        if window_id in self.desktop_of:
+            self.add(window_id, desktop)
+    
+    def desktop(self, window_id):
+        return self.desktop_of.get(window_id)
+    
+    def most_recent(self, desktop):
+        return self.heads.get(desktop)
+    
+    def next(self, window_id):
+        """Next less recently used window on the same desktop (wraps)"""
+        prev_id, next_id = self.links[window_id]
+        return next_id if next_id is not None else self.heads[self.desktop_of[window_id]]
+    
+    def previous(self, window_id):
+        """Next more recently used window on the same desktop (wraps)"""
+        prev_id, next_id = self.links[window_id]
+        return prev_id if prev_id is not None else self.tails[self.desktop_of[window_id]]
+    
+    def mru(self, desktop, limit=None):
+        """Window ids on a desktop, most recent first"""
+        result = []
+        window_id = self.heads.get(desktop)
+        while window_id is not None and (limit is None or len(result) < limit):
+            result.append(window_id)
+            window_id = self.links[window_id][1]
+        return result
+    
+    def link_front(self, window_id, desktop):
+        head = self.heads.get(desktop)
+        self.links[window_id] = [None, head]
+        if head is not None:
+            self.links[head][0] = window_id
+        else:
+            self.tails[desktop] = window_id
+        self.heads[desktop] = window_id
+    
+    def unlink(self, window_id, desktop):
+        prev_id, next_id = self.links.pop(window_id)
+        if prev_id is not None:
+            self.links[prev_id][1] = next_id
+        else:
+            self.heads[desktop] = next_id
+        if next_id is not None:
+            self.links[next_id][0] = prev_id
+        else:
+            self.tails[desktop] = prev_id
+
+class WindowSwitcher:
+    """Alt+Tab overlay that walks the current desktop's MRU list
+
+    Window thumbnails are grabbed when a window loses focus (at most every
+    ``thumbnail_interval`` seconds) and reused while switching, so opening
+    the overlay never captures the screen.
+    """
+    
+    def __init__(self, wm, max_tiles=8, thumbnail_size=(200, 125), thumbnail_interval=5):
+        self.wm = wm
+        self.max_tiles = max_tiles
+        self.thumbnail_size = thumbnail_size
+        self.thumbnail_interval = thumbnail_interval
+        self.thumbnails = {}
+        self.overlay = None
+        self.tiles = {}
+        self.photos = []
+        self.selected = None
+    
+    def active(self):
+        return self.overlay is not None
+    
+    def capture_thumbnail(self, window_id):
+        """Grab a scaled screenshot of a window if the cached one is stale"""
+        try:
+            if not PIL_AVAILABLE or window_id not in self.wm.windows:
+                return
+            cached = self.thumbnails.get(window_id)
+            if cached and time.monotonic() - cached[0] < self.thumbnail_interval:
+                return
+            
+            window = self.wm.windows[window_id]['window']
+            if not window.winfo_exists() or not window.winfo_viewable():
+                return
+            
+            x, y = window.winfo_rootx(), window.winfo_rooty()
+            image = ImageGrab.grab(bbox=(x, y, x + window.winfo_width(), y + window.winfo_height()))
+            image.thumbnail(self.thumbnail_size)
+            self.thumbnails[window_id] = (time.monotonic(), image)
+            
+        except Exception as e:
+            logger.debug(f"Thumbnail capture error: {e}")
+    
+    def forget(self, window_id):
+        """Drop cached data of a closed window"""
+        self.thumbnails.pop(window_id, None)
+        if self.selected == window_id:
+            self.cancel()
+    
+    def step(self, reverse=False):
+        """Select the next (or previous) window, opening the overlay on first press"""
+        registry = self.wm.window_registry
+        
+        if self.selected is None or registry.desktop(self.selected) is None:
+            current = registry.most_recent(self.wm.current_desktop)
+            if current is None:
+                return
+            self.selected = current
+            
+        self.selected = registry.previous(self.selected) if reverse else registry.next(self.selected)
+        
+        if self.overlay is None:
+            self.show_overlay()
+        self.highlight()
+    
+    def show_overlay(self):
+        """Build the switcher window for the current desktop"""
+        try:
+            window_ids = self.wm.window_registry.mru(self.wm.current_desktop, self.max_tiles)
+            if len(window_ids) < 2:
+                return
+            
+            overlay = tk.Toplevel(self.wm.root)
+            overlay.overrideredirect(True)
+            overlay.attributes('-topmost', True)
+            overlay.configure(bg=self.wm.get_theme_color("bg"), bd=1, relief=tk.SOLID)
+            self.overlay = overlay
+            
+            tile_width, tile_height = self.thumbnail_size
+            for window_id in window_ids:
+                tile = tk.Frame(overlay, bg=self.wm.get_theme_color("bg"), padx=6, pady=6)
+                tile.pack(side=tk.LEFT, padx=4, pady=8)
+                
+                cached = self.thumbnails.get(window_id)
+                if cached:
+                    photo = ImageTk.PhotoImage(cached[1])
+                    self.photos.append(photo)
+                    preview = tk.Label(tile, image=photo, bg=self.wm.get_theme_color("bg"))
+                else:
+                    preview = tk.Label(tile, text="🗔", font=('Arial', 36),
+                                       width=tile_width // 30, height=tile_height // 60,
+                                       bg=self.wm.get_theme_color("window"), fg=self.wm.get_theme_color("fg"))
+                preview.pack()
+                
+                title = self.wm.windows.get(window_id, {}).get("title", "")
+                tk.Label(tile, text=title[:24], bg=self.wm.get_theme_color("bg"),
+                         fg=self.wm.get_theme_color("fg"), font=('Arial', 9)).pack(pady=(4, 0))
+                
+                self.tiles[window_id] = tile
+            
+            overlay.update_idletasks()
+            x = (overlay.winfo_screenwidth() - overlay.winfo_reqwidth()) // 2
+            y = (overlay.winfo_screenheight() - overlay.winfo_reqheight()) // 2
+            overlay.geometry(f"+{x}+{y}")
+            
+        except Exception as e:
+            logger.error(f"Window switcher error: {e}")
+            self.close_overlay()
+    
+    def highlight(self):
+        """Mark the selected tile"""
+        for window_id, tile in self.tiles.items():
+            color = self.wm.get_theme_color("accent") if window_id == self.selected else self.wm.get_theme_color("bg")
+            tile.configure(bg=color)
+    
+    def commit(self, event=None):
+        """Focus the selected window (on Alt release)"""
+        selected = self.selected
+        self.cancel()
+        if selected is not None:
+            self.wm.focus_window(selected)
+    
+    def cancel(self, event=None):
+        """Close the overlay without switching"""
+        self.selected = None
+        self.close_overlay()
+    
+    def close_overlay(self):
+        if self.overlay is not None:
+            try:
+                self.overlay.destroy()
+            except tk.TclError:
+                pass
+        self.overlay = None
+        self.tiles = {}
+        self.photos = []
+
+# Boot pipeline
+class BootPipeline:
+    """Runs boot stages as a dependency graph
+
+    Worker stages run concurrently on a thread pool as soon as their
+    dependencies finish; main-thread stages (anything touching Tk) run in
+    the calling thread. A failing stage is logged and counts as finished so
+    the rest of the desktop still comes up. Durations are logged and
+    compared with previous boots stored in BOOT_TIMES_FILE.
+    """
+    
+    def __init__(self, max_workers=4, history=20):
+        self.stages = {}
+        self.timings = {}
+        self.max_workers = max_workers
+        self.history = history
+    
+    def add(self, name, func, deps=(), main_thread=False):
+        self.stages[name] = {"func": func, "deps": tuple(deps), "main_thread": main_thread}
+    
+    def validate(self):
+        """Reject unknown dependencies and cycles"""
+        for name, stage in self.stages.items():
+            for dep in stage["deps"]:
+                if dep not in self.stages:
+                    raise ValueError(f"Boot stage {name} depends on unknown stage {dep}")
+        
+        visiting, visited = set(), set()
+        def visit(name):
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Boot stage dependency cycle at {name}")
+            visiting.add(name)
+            for dep in self.stages[name]["deps"]:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+        for name in self.stages:
+            visit(name)
+    
+    def run_stage(self, name, started):
+        """Run one stage and record its timing"""
+        start = time.perf_counter()
+        error = None
+        try:
+            self.stages[name]["func"]()
+        except Exception as e:
+            error = str(e)
+            logger.error(f"Boot stage {name} failed: {e}")
+        duration = time.perf_counter() - start
+        self.timings[name] = {
+            "start": start - started,
+            "duration": duration,
+            "thread": threading.current_thread().name,
+            "error": error
+        }
+        STARTUP_PROFILER.add_span(f"boot:{name}", start, duration)
+    
+    def run(self):
+        """Run every stage, returning once all have finished"""
+        self.validate()
+        started = time.perf_counter()
+        pending = list(self.stages)
+        finished = set()
+        running = 0
+        completed = queue.Queue()
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers,
+                                                         thread_name_prefix="Boot")
+        
+        def worker(name):
+            try:
+                self.run_stage(name, started)
+            finally:
+                completed.put(name)
+        
+        try:
+            while pending or running:
+                ready = [name for name in pending if all(dep in finished for dep in self.stages[name]["deps"])]
+                
+                for name in ready:
+                    if not self.stages[name]["main_thread"]:
+                        pending.remove(name)
+                        running += 1
+                        executor.submit(worker, name)
+                
+                main_ready = [name for name in ready if self.stages[name]["main_thread"]]
+                if main_ready:
+                    name = main_ready[0]
+                    pending.remove(name)
+                    self.run_stage(name, started)
+                    finished.add(name)
+                    continue
+                
+                if running:
+                    finished.add(completed.get())
+                    running -= 1
+                    # Collect everything that finished meanwhile before rescheduling
+                    while True:
+                        try:
+                            finished.add(completed.get_nowait())
+                            running -= 1
+                        except queue.Empty:
+                            break
+        finally:
+            executor.shutdown(wait=False)
+        
+        self.report(time.perf_counter() - started)
+    
+    def report(self, total):
+        """Log per-stage timings and flag stages slower than usual"""
+        logger.info(f"Boot finished in {total * 1000:.0f} ms")
+        history = {}
+        try:
+            if os.path.exists(BOOT_TIMES_FILE):
+                with open(BOOT_TIMES_FILE, 'r') as f:
+                    history = json.load(f)
+        except Exception as e:
+            logger.debug(f"Boot timing history unreadable: {e}")
+        
+        for name, timing in sorted(self.timings.items(), key=lambda item: item[1]["start"]):
+            duration_ms = timing["duration"] * 1000
+            logger.info(f"  boot stage {name:<24} {duration_ms:8.1f} ms  "
+                        f"(+{timing['start'] * 1000:.0f} ms, {timing['thread']})")
+            
+            previous = history.get(name, [])
+            if len(previous) >= 3:
+                median = sorted(previous)[len(previous) // 2]
+                if duration_ms > 50 and duration_ms > median * 2:
+                    logger.warning(f"Boot stage {name} regressed: {duration_ms:.0f} ms (median {median:.0f} ms)")
+            history[name] = (previous + [round(duration_ms, 1)])[-self.history:]
+        
+        try:
+            atomic_write(BOOT_TIMES_FILE, json.dumps(history))
+        except Exception as e:
+            logger.debug(f"Boot timing history not saved: {e}")
 
 # Enhanced Window Manager with improved display management
 class WindowManager:
@@ -3619,32 +6246,109 @@ class WindowManager:
     def __init__(self):
         self.root = None
         self.windows = {}
-        self.config = self.load_config()
-        self.notifications = NotificationSystem(self)
+        self.config_store = JsonFileStore(CONFIG_FILE, lambda: self.config)
+        self.session_store = JsonFileStore(SESSION_FILE, self.collect_session, ignore_keys=("timestamp",))
+        self.config = ObservableDict(DEFAULT_CONFIG, self.config_store.mark_dirty)
+        self.notifications = None
         self.current_user = None
         self.desktop = None
         self.taskbar = None
         self.start_menu = None
         self.wallpaper_image = None
-        self.themes = self.load_themes()
+        self.wallpaper_item = None
+        self.wallpaper_cache = None
+        self.wallpaper_request = None
+        self.themes = {}
         self.shortcuts = {}
         self.running_apps = {}
         self.virtual_desktops = []
         self.current_desktop = 0
+        self.window_registry = WindowRegistry()
+        self.window_switcher = WindowSwitcher(self)
         self.workspace_manager = None
         self.plugin_manager = None
         self.performance_monitor = None
+        self.stall_monitor = None
+        self.dispatcher = None
+        self.animator = None
         self.display_manager = DisplayManager()
         
-        # Initialize enhanced features
-        self.init_virtual_desktops()
-        self.init_plugin_system()
-        self.init_performance_monitoring()
+        self.boot()
+    
+    def boot(self):
+        """Bring the desktop up as a staged dependency graph
+
+        Display probing (often the slowest step) overlaps with theme
+        loading, database warm-up and the application table sync; the UI is
+        built as soon as the stages it reads from are done.
+        """
+        pipeline = BootPipeline()
+        
+        def load_config():
+            self.config = self.load_config()
+        
+        def load_themes():
+            self.themes = self.load_themes()
+        
+        def create_notifications():
+            self.notifications = NotificationSystem(self)
+        
+        pipeline.add("config", load_config)
+        pipeline.add("themes", load_themes)
+        pipeline.add("database", self.warm_up_database)
+        pipeline.add("applications", self.sync_application_table, deps=["database"])
+        pipeline.add("display", self.setup_display_system, deps=["config"])
+        pipeline.add("notifications", create_notifications, deps=["config", "database"])
+        pipeline.add("virtual_desktops", self.init_virtual_desktops, deps=["config"], main_thread=True)
+        pipeline.add("plugins", self.init_plugin_system, deps=["config"])
+        pipeline.add("performance", self.init_performance_monitoring, deps=["config"])
+        pipeline.add("ui", self.setup_ui, main_thread=True,
+                     deps=["config", "themes", "display", "notifications", "virtual_desktops"])
+        
+        pipeline.run()
+    
+    def warm_up_database(self):
+        """Open the database once so later queries hit a warm page cache"""
+        conn = sqlite3.connect(DATABASE_FILE)
+        try:
+            # WAL lets the UI read while background writers commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("SELECT name FROM sqlite_master").fetchall()
+            conn.execute("SELECT COUNT(*) FROM applications").fetchone()
+            conn.execute("PRAGMA optimize")
+        finally:
+            conn.close()
+    
+    def sync_application_table(self):
+        """Add application descriptors from APPS_DIR missing in the applications table"""
+        descriptors = []
+        for name in sorted(os.listdir(APPS_DIR)):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(APPS_DIR, name), 'r') as f:
+                    app = json.load(f)
+                descriptors.append((app["name"], app.get("command", ""), app.get("icon", "📱"),
+                                    app.get("category", "Other"), app.get("description", "")))
+            except Exception as e:
+                logger.warning(f"Invalid application descriptor {name}: {e}")
         
-        # Initialize display with enhanced management
-        self.setup_display_system()
+        if not descriptors:
+            return
         
-        self.setup_ui()
+        conn = sqlite3.connect(DATABASE_FILE)
+        try:
+            known = {row[0] for row in conn.execute("SELECT name FROM applications")}
+            new_apps = [app for app in descriptors if app[0] not in known]
+            if new_apps:
+                conn.executemany(
+                    "INSERT INTO applications (name, command, icon, category, description) VALUES (?, ?, ?, ?, ?)",
+                    new_apps
+                )
+                conn.commit()
+                logger.info(f"Registered {len(new_apps)} applications from {APPS_DIR}")
+        finally:
+            conn.close()
     
     def setup_display_system(self):
         """Setup display system with enhanced management"""
@@ -3718,6 +6422,19 @@ class WindowManager:
         except Exception as e:
             logger.error(f"Plugin system initialization failed: {e}")
     
+    def start_stall_monitor(self):
+        """Record event-loop stalls (with the blocking stack) in the ui_stalls table"""
+        settings = self.config.get("diagnostics", {})
+        if not settings.get("stall_monitor", True):
+            return
+        try:
+            self.stall_monitor = StallMonitor(self.root, StallStore(),
+                                              threshold_ms=settings.get("stall_threshold_ms", 100),
+                                              heartbeat_ms=settings.get("heartbeat_ms", 50))
+            self.stall_monitor.start()
+        except Exception as e:
+            logger.error(f"Stall monitor error: {e}")
+    
     def init_performance_monitoring(self):
         """Initialize performance monitoring"""
         try:
@@ -3741,19 +6458,22 @@ class WindowManager:
                             merge_configs(value, loaded[key])
                     return loaded
                 
-                return merge_configs(DEFAULT_CONFIG.copy(), config)
-            return DEFAULT_CONFIG.copy()
+                config = merge_configs(DEFAULT_CONFIG, config)
+            else:
+                config = DEFAULT_CONFIG
         except Exception as e:
             logger.error(f"Config load error: {e}")
-            return DEFAULT_CONFIG.copy()
+            config = DEFAULT_CONFIG
+        
+        # Nested dicts are copied, so DEFAULT_CONFIG itself is never mutated;
+        # every change schedules a debounced save
+        return ObservableDict(config, self.config_store.mark_dirty)
             
     def save_config(self):
-        """Save enhanced configuration"""
+        """Save enhanced configuration (skipped when nothing changed)"""
         try:
-            os.makedirs(CONFIG_DIR, exist_ok=True)
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=4)
-            logger.info("Configuration saved successfully")
+            if self.config_store.flush():
+                logger.info("Configuration saved successfully")
         except Exception as e:
             logger.error(f"Config save error: {e}")
     
@@ -3838,8 +6558,12 @@ def setup_ui(self):
 
         logger.info("[UI] Tk ana pencere oluşturuluyor...")
         print("[UI] Tk ana pencere oluşturuluyor...")
-        self.root = tk.Tk()
+        with STARTUP_PROFILER.span("tk.Tk"):
+            self.root = tk.Tk()
         self.root.title("Berke0S 3.0 V2 - Ultimate Desktop")
+        self.dispatcher = UIDispatcher(self.root)
+        self.start_stall_monitor()
+        self.animator = Animator.for_widget(self.root)
         try:
             self.root.attributes('-fullscreen', True)
             self.root.state('zoomed')
@@ -3858,49 +6582,57 @@ def setup_ui(self):
 
         logger.info("[UI] Tema uygulanıyor...")
         print("[UI] Tema uygulanıyor...")
-        self.apply_theme()
+        with STARTUP_PROFILER.span("apply_theme"):
+            self.apply_theme()
         logger.info("[UI] Tema uygulandı.")
         print("[UI] Tema uygulandı.")
 
         logger.info("[UI] Masaüstü oluşturuluyor...")
         print("[UI] Masaüstü oluşturuluyor...")
-        self.create_desktop()
+        with STARTUP_PROFILER.span("create_desktop"):
+            self.create_desktop()
         logger.info("[UI] Masaüstü oluşturuldu.")
         print("[UI] Masaüstü oluşturuldu.")
 
         logger.info("[UI] Görev çubuğu oluşturuluyor...")
         print("[UI] Görev çubuğu oluşturuluyor...")
-        self.create_taskbar()
+        with STARTUP_PROFILER.span("create_taskbar"):
+            self.create_taskbar()
         logger.info("[UI] Görev çubuğu oluşturuldu.")
         print("[UI] Görev çubuğu oluşturuldu.")
 
         logger.info("[UI] Dock oluşturuluyor...")
         print("[UI] Dock oluşturuluyor...")
-        self.create_dock()
+        with STARTUP_PROFILER.span("create_dock"):
+            self.create_dock()
         logger.info("[UI] Dock oluşturuldu.")
         print("[UI] Dock oluşturuldu.")
 
         logger.info("[UI] Duvar kağıdı yükleniyor...")
         print("[UI] Duvar kağıdı yükleniyor...")
-        self.load_wallpaper()
+        with STARTUP_PROFILER.span("load_wallpaper"):
+            self.load_wallpaper()
         logger.info("[UI] Duvar kağıdı yüklendi.")
         print("[UI] Duvar kağıdı yüklendi.")
 
         logger.info("[UI] Masaüstü ikonları oluşturuluyor...")
         print("[UI] Masaüstü ikonları oluşturuluyor...")
-        self.create_desktop_icons()
+        with STARTUP_PROFILER.span("create_desktop_icons"):
+            self.create_desktop_icons()
         logger.info("[UI] Masaüstü ikonları oluşturuldu.")
         print("[UI] Masaüstü ikonları oluşturuldu.")
 
         logger.info("[UI] Olaylar bağlanıyor...")
         print("[UI] Olaylar bağlanıyor...")
-        self.bind_events()
+        with STARTUP_PROFILER.span("bind_events"):
+            self.bind_events()
         logger.info("[UI] Olaylar bağlandı.")
         print("[UI] Olaylar bağlandı.")
 
         logger.info("[UI] Sistem servisleri başlatılıyor...")
         print("[UI] Sistem servisleri başlatılıyor...")
-        self.start_services()
+        with STARTUP_PROFILER.span("start_services"):
+            self.start_services()
         logger.info("[UI] Sistem servisleri başlatıldı.")
         print("[UI] Sistem servisleri başlatıldı.")
 
@@ -3917,6 +6649,8 @@ def setup_ui(self):
             self.root.lift(),
             self.root.focus_force()
         ))
+        # Fill the notification window pool once the desktop is up
+        self.root.after(2000, self.notifications.prebuild_pool)
         logger.info("[UI] Tüm adımlar başarıyla tamamlandı.")
         print("[UI] Tüm adımlar başarıyla tamamlandı.")
     except Exception as e:
@@ -3951,6 +6685,8 @@ def setup_ui(self):
             # Create minimal root for services
             self.root = tk.Tk()
             self.root.withdraw()  # Hide the window
+            self.dispatcher = UIDispatcher(self.root)
+            self.animator = Animator.for_widget(self.root)
             
             # Start essential services only
             self.start_headless_services()
@@ -4587,53 +7323,80 @@ def setup_ui(self):
             if wallpaper_path and os.path.exists(wallpaper_path) and PIL_AVAILABLE:
                 self.load_custom_wallpaper(wallpaper_path, wallpaper_mode)
             else:
+                self.wallpaper_request = None
                 self.create_default_wallpaper()
+            
+            # Warm the cache for desktops with their own wallpaper
+            self.root.after(3000, self.prefetch_desktop_wallpapers)
                 
         except Exception as e:
             logger.error(f"Wallpaper load error: {e}")
             self.create_default_wallpaper()
     
+    def wallpaper_settings(self):
+        """Screen size and blur radius that determine the rendered wallpaper"""
+        size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+        blur_radius = 0
+        if self.config.get("desktop", {}).get("effects", True):
+            blur_radius = self.config.get("desktop", {}).get("blur_radius", 0)
+        return size, blur_radius
+    
     def load_custom_wallpaper(self, wallpaper_path, mode):
-        """Load custom wallpaper with different modes"""
+        """Load custom wallpaper with different modes
+
+        Decoding and scaling happen on the wallpaper worker; the current
+        wallpaper stays up until the new one is ready.
+        """
         try:
-            img = Image.open(wallpaper_path)
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
+            if self.wallpaper_cache is None:
+                self.wallpaper_cache = WallpaperCache(self.dispatcher)
             
-            if mode == "stretch":
-                img = img.resize((screen_width, screen_height), Image.LANCZOS)
-            elif mode == "fit":
-                img.thumbnail((screen_width, screen_height), Image.LANCZOS)
-            elif mode == "center":
-                # Center the image
-                bg = Image.new('RGB', (screen_width, screen_height), (0, 0, 0))
-                x = (screen_width - img.width) // 2
-                y = (screen_height - img.height) // 2
-                bg.paste(img, (x, y))
-                img = bg
-            elif mode == "tile":
-                # Tile the image
-                bg = Image.new('RGB', (screen_width, screen_height))
-                for x in range(0, screen_width, img.width):
-                    for y in range(0, screen_height, img.height):
-                        bg.paste(img, (x, y))
-                img = bg
-            
-            # Apply effects if enabled
-            if self.config.get("desktop", {}).get("effects", True):
-                blur_radius = self.config.get("desktop", {}).get("blur_radius", 0)
-                if blur_radius > 0:
-                    img = img.filter(ImageFilter.GaussianBlur(radius=blur_radius))
+            size, blur_radius = self.wallpaper_settings()
             
-            self.wallpaper_image = ImageTk.PhotoImage(img)
-            self.desktop.create_image(0, 0, anchor=tk.NW, image=self.wallpaper_image)
+            def loaded(key, photo):
+                if key != self.wallpaper_request:
+                    return  # superseded by a later request
+                if photo is None:
+                    self.wallpaper_request = None
+                    self.create_default_wallpaper()
+                    return
+                self.show_wallpaper(photo)
+                logger.info(f"Custom wallpaper loaded: {wallpaper_path}")
             
-            logger.info(f"Custom wallpaper loaded: {wallpaper_path}")
+            self.wallpaper_request = WallpaperCache.key(wallpaper_path, mode, size, blur_radius)
+            self.wallpaper_cache.request(wallpaper_path, mode, size, blur_radius, loaded)
             
         except Exception as e:
             logger.error(f"Custom wallpaper load error: {e}")
+            self.wallpaper_request = None
             self.create_default_wallpaper()
     
+    def prefetch_desktop_wallpapers(self):
+        """Render per-desktop wallpapers in the background ahead of a switch"""
+        try:
+            if not PIL_AVAILABLE:
+                return
+            if self.wallpaper_cache is None:
+                self.wallpaper_cache = WallpaperCache(self.dispatcher)
+            
+            size, blur_radius = self.wallpaper_settings()
+            for desktop in self.virtual_desktops:
+                wallpaper = desktop.get("wallpaper")
+                if wallpaper and os.path.exists(wallpaper):
+                    self.wallpaper_cache.request(wallpaper, "stretch", size, blur_radius, lambda key, photo: None)
+                    
+        except Exception as e:
+            logger.error(f"Wallpaper prefetch error: {e}")
+    
+    def show_wallpaper(self, photo):
+        """Swap the desktop background image"""
+        self.wallpaper_image = photo
+        if self.wallpaper_item and self.desktop.find_withtag(self.wallpaper_item):
+            self.desktop.itemconfigure(self.wallpaper_item, image=photo)
+        else:
+            self.wallpaper_item = self.desktop.create_image(0, 0, anchor=tk.NW, image=photo)
+            self.desktop.tag_lower(self.wallpaper_item)
+    
     def create_default_wallpaper(self):
         """Create enhanced default gradient wallpaper"""
         try:
@@ -4643,60 +7406,35 @@ def setup_ui(self):
             screen_width = self.root.winfo_screenwidth()
             screen_height = self.root.winfo_screenheight()
             
-            # Create gradient image
-            img = Image.new('RGB', (screen_width, screen_height))
-            draw = ImageDraw.Draw(img)
-            
             # Enhanced gradient based on theme
             theme_name = self.config.get("theme", "berke_dark")
+            colors = DEFAULT_WALLPAPER_GRADIENTS.get(theme_name, DEFAULT_WALLPAPER_GRADIENTS["berke_dark"])
             
-            gradients = {
-                "berke_dark": [(15, 15, 35), (26, 26, 26), (40, 40, 60)],
-                "berke_light": [(240, 240, 240), (220, 220, 220), (200, 200, 200)],
-                "ocean": [(13, 27, 42), (3, 4, 94), (0, 119, 190)],
-                "forest": [(27, 67, 50), (45, 145, 108), (82, 183, 136)],
-                "tinycore": [(46, 52, 54), (85, 87, 83), (136, 138, 133)]
-            }
-            
-            colors = gradients.get(theme_name, gradients["berke_dark"])
+            # Subtle geometric pattern only with effects on
+            pattern = bool(self.config.get("desktop", {}).get("effects", True))
             
-            # Create multi-color gradient
-            for y in range(screen_height):
-                progress = y / screen_height
-                
-                if progress < 0.5:
-                    # First half
-                    ratio = progress * 2
-                    r = int(colors[0][0] + (colors[1][0] - colors[0][0]) * ratio)
-                    g = int(colors[0][1] + (colors[1][1] - colors[0][1]) * ratio)
-                    b = int(colors[0][2] + (colors[1][2] - colors[0][2]) * ratio)
-                else:
-                    # Second half
-                    ratio = (progress - 0.5) * 2
-                    r = int(colors[1][0] + (colors[2][0] - colors[1][0]) * ratio)
-                    g = int(colors[1][1] + (colors[2][1] - colors[1][1]) * ratio)
-                    b = int(colors[1][2] + (colors[2][2] - colors[1][2]) * ratio)
-                
-                draw.line([(0, y), (screen_width, y)], fill=(r, g, b))
+            cache_path = default_wallpaper_cache_path(theme_name, colors, screen_width, screen_height, pattern)
+            img = None
+            if os.path.exists(cache_path):
+                try:
+                    img = Image.open(cache_path)
+                    img.load()
+                    os.utime(cache_path)
+                except Exception as e:
+                    logger.warning(f"Cached wallpaper unreadable, regenerating: {e}")
+                    img = None
             
-            # Add some texture/pattern
-            if self.config.get("desktop", {}).get("effects", True):
-                # Add subtle geometric pattern
-                pattern_color = (255, 255, 255, 20)  # Very transparent white
-                pattern_img = Image.new('RGBA', (screen_width, screen_height), (0, 0, 0, 0))
-                pattern_draw = ImageDraw.Draw(pattern_img)
-                
-                # Draw subtle lines
-                for x in range(0, screen_width, 100):
-                    pattern_draw.line([(x, 0), (x, screen_height)], fill=pattern_color, width=1)
-                for y in range(0, screen_height, 100):
-                    pattern_draw.line([(0, y), (screen_width, y)], fill=pattern_color, width=1)
-                
-                # Composite pattern onto background
-                img = Image.alpha_composite(img.convert('RGBA'), pattern_img).convert('RGB')
+            if img is None:
+                img = render_default_wallpaper(screen_width, screen_height, colors, pattern)
+                try:
+                    buffer = BytesIO()
+                    img.save(buffer, format='PNG', compress_level=1)
+                    atomic_write(cache_path, buffer.getvalue())
+                    prune_wallpaper_cache()
+                except Exception as e:
+                    logger.warning(f"Wallpaper cache write error: {e}")
             
-            self.wallpaper_image = ImageTk.PhotoImage(img)
-            self.desktop.create_image(0, 0, anchor=tk.NW, image=self.wallpaper_image)
+            self.show_wallpaper(ImageTk.PhotoImage(img))
             
             logger.info("Default gradient wallpaper created")
             
@@ -4731,6 +7469,8 @@ def setup_ui(self):
             # Window management
             self.root.bind('<Alt-Tab>', self.cycle_windows)
             self.root.bind('<Alt-Shift-Tab>', lambda e: self.cycle_windows(reverse=True))
+            self.root.bind('<KeyRelease-Alt_L>', self.window_switcher.commit)
+            self.root.bind('<KeyRelease-Alt_R>', self.window_switcher.commit)
             
             # Virtual desktop switching
             for i in range(1, 5):
@@ -4785,7 +7525,8 @@ def setup_ui(self):
                             self.notifications.send(
                                 "Display Warning",
                                 "Display connection issues detected",
-                                notification_type="warning"
+                                notification_type="warning",
+                                source="monitor.display"
                             )
                     except:
                         pass
@@ -4811,6 +7552,7 @@ def setup_ui(self):
                         "System Warning",
                         f"High CPU usage: {cpu_percent:.1f}%",
                         notification_type="warning",
+                        source="monitor.cpu",
                         actions=[
                             {"text": "Open Monitor", "callback": lambda: SystemMonitor(self).show()},
                             {"text": "Dismiss", "callback": lambda: None}
@@ -4824,6 +7566,7 @@ def setup_ui(self):
                         "System Warning", 
                         f"High memory usage: {memory.percent:.1f}%",
                         notification_type="warning",
+                        source="monitor.memory",
                         actions=[
                             {"text": "Free Memory", "callback": self.free_memory},
                             {"text": "Open Monitor", "callback": lambda: SystemMonitor(self).show()}
@@ -4837,6 +7580,7 @@ def setup_ui(self):
                         "System Warning",
                         f"Low disk space: {disk.percent:.1f}% used",
                         notification_type="error",
+                        source="monitor.disk",
                         actions=[
                             {"text": "Clean Temp", "callback": self.clean_temp_files},
                             {"text": "Open Disk", "callback": self.launch_file_manager}
@@ -4853,7 +7597,8 @@ def setup_ui(self):
                                     self.notifications.send(
                                         "Temperature Warning",
                                         f"{name}: {entry.current:.1f}°C",
-                                        notification_type="warning"
+                                        notification_type="warning",
+                                        source="monitor.temperature"
                                     )
                 except:
                     pass
@@ -4869,9 +7614,17 @@ def setup_ui(self):
         while True:
             try:
                 time.sleep(300)  # Save every 5 minutes
-                self.save_session()
+                # Session capture reads widget geometry, so it runs on the Tk thread;
+                # both stores skip the write when nothing changed
+                if self.dispatcher:
+                    self.dispatcher.post(self.save_session)
+                else:
+                    self.save_session()
                 self.save_config()
                 
+                # Editor journals flush themselves; this bounds the worst case
+                EditJournal.flush_all()
+                
                 # Save plugin states
                 if self.plugin_manager:
                     self.plugin_manager.save_plugin_states()
@@ -5241,25 +7994,16 @@ def setup_ui(self):
     def animate_start_menu(self, action):
         """Animate start menu appearance/disappearance"""
         try:
+            menu = self.start_menu_window
+            
             if action == "show":
-                self.start_menu_window.attributes('-alpha', 0)
-                
-                def fade_in(alpha=0):
-                    if alpha <= 0.98:
-                        self.start_menu_window.attributes('-alpha', alpha)
-                        self.root.after(20, lambda: fade_in(alpha + 0.1))
-                        
-                fade_in()
+                menu.attributes('-alpha', 0)
+                self.animator.animate(lambda progress: menu.attributes('-alpha', progress * 0.98),
+                                      200, key=("alpha", str(menu)))
                 
             elif action == "hide":
-                def fade_out(alpha=0.98):
-                    if alpha >= 0:
-                        self.start_menu_window.attributes('-alpha', alpha)
-                        self.root.after(20, lambda: fade_out(alpha - 0.1))
-                    else:
-                        self.start_menu_window.destroy()
-                        
-                fade_out()
+                self.animator.animate(lambda progress: menu.attributes('-alpha', 0.98 * (1 - progress)),
+                                      200, easing="ease_in", key=("alpha", str(menu)), on_done=menu.destroy)
                 
         except Exception as e:
             logger.error(f"Start menu animation error: {e}")
@@ -5667,6 +8411,19 @@ def setup_ui(self):
                 "created_at": datetime.datetime.now()
             }
             
+            # Track focus order and desktop membership
+            self.window_registry.add(window_id, self.current_desktop)
+            if 0 <= self.current_desktop < len(self.virtual_desktops):
+                self.virtual_desktops[self.current_desktop].setdefault("windows", []).append(window_id)
+            window.bind("<FocusIn>", lambda e: self.window_registry.touch(window_id), add="+")
+            window.bind("<FocusOut>", lambda e: self.window_switcher.capture_thumbnail(window_id), add="+")
+            
+            # Alt+Tab also works while an application window has focus
+            window.bind('<Alt-Tab>', self.cycle_windows, add="+")
+            window.bind('<Alt-Shift-Tab>', lambda e: self.cycle_windows(reverse=True), add="+")
+            window.bind('<KeyRelease-Alt_L>', self.window_switcher.commit, add="+")
+            window.bind('<KeyRelease-Alt_R>', self.window_switcher.commit, add="+")
+            
             # Bind close event
             window.protocol("WM_DELETE_WINDOW", lambda: self.close_window(window_id))
             
@@ -5688,14 +8445,8 @@ def setup_ui(self):
         """Animate window opening"""
         try:
             window.attributes('-alpha', 0)
-            window.update()
-            
-            def fade_in(alpha=0):
-                if alpha <= 0.95:
-                    window.attributes('-alpha', alpha)
-                    self.root.after(30, lambda: fade_in(alpha + 0.1))
-                    
-            fade_in()
+            self.animator.animate(lambda progress: window.attributes('-alpha', progress * 0.95),
+                                  300, key=("alpha", str(window)))
             
         except Exception as e:
             logger.error(f"Window animation error: {e}")
@@ -5754,14 +8505,12 @@ def setup_ui(self):
                 if window.winfo_exists():
                     # Animate close
                     if self.config.get("desktop", {}).get("effects", True):
-                        def fade_out(alpha=0.95):
-                            if alpha >= 0:
-                                window.attributes('-alpha', alpha)
-                                self.root.after(30, lambda: fade_out(alpha - 0.1))
-                            else:
-                                window.destroy()
-                                self.cleanup_window(window_id)
-                        fade_out()
+                        def closed():
+                            window.destroy()
+                            self.cleanup_window(window_id)
+                        
+                        self.animator.animate(lambda progress: window.attributes('-alpha', 0.95 * (1 - progress)),
+                                              300, easing="ease_in", key=("alpha", str(window)), on_done=closed)
                     else:
                         window.destroy()
                         self.cleanup_window(window_id)
@@ -5780,6 +8529,14 @@ def setup_ui(self):
             if window_id in self.windows:
                 del self.windows[window_id]
             
+            desktop = self.window_registry.desktop(window_id)
+            self.window_registry.remove(window_id)
+            self.window_switcher.forget(window_id)
+            if desktop is not None and 0 <= desktop < len(self.virtual_desktops):
+                windows = self.virtual_desktops[desktop].get("windows", [])
+                if window_id in windows:
+                    windows.remove(window_id)
+            
             # Remove taskbar button
             if hasattr(self, 'window_buttons') and window_id in self.window_buttons:
                 self.window_buttons[window_id].destroy()
@@ -5789,44 +8546,47 @@ def setup_ui(self):
             logger.error(f"Window cleanup error: {e}")
     
     def save_session(self):
-        """Save enhanced session data"""
+        """Save enhanced session data (skipped when nothing but the timestamp changed)"""
         try:
-            session_data = {
-                "timestamp": datetime.datetime.now().isoformat(),
-                "version": "3.0-v2",
-                "windows": [],
-                "virtual_desktops": self.virtual_desktops,
-                "current_desktop": self.current_desktop,
-                "shortcuts": self.shortcuts,
-                "current_user": self.current_user,
-                "running_apps": list(self.running_apps.keys()),
-                "display_info": self.display_manager.get_display_info()
-            }
-            
-            # Save window states
-            for window_id, window_data in self.windows.items():
-                if 'window' in window_data and window_data['window'].winfo_exists():
-                    try:
-                        window = window_data['window']
-                        session_data["windows"].append({
-                            "id": window_id,
-                            "title": window_data.get("title", ""),
-                            "app": window_data.get("app", ""),
-                            "geometry": window.geometry(),
-                            "state": window.state(),
-                            "created_at": window_data.get("created_at", "").isoformat() if isinstance(window_data.get("created_at"), datetime.datetime) else ""
-                        })
-                    except Exception as e:
-                        logger.warning(f"Failed to save window {window_id}: {e}")
-            
-            with open(SESSION_FILE, 'w') as f:
-                json.dump(session_data, f, indent=4)
-                
-            logger.debug("Session saved successfully")
+            if self.session_store.flush():
+                logger.debug("Session saved successfully")
                 
         except Exception as e:
             logger.error(f"Session save error: {e}")
     
+    def collect_session(self):
+        """Snapshot of the session; reads Tk state, so call on the Tk thread"""
+        session_data = {
+            "timestamp": datetime.datetime.now().isoformat(),
+            "version": "3.0-v2",
+            "windows": [],
+            "virtual_desktops": self.virtual_desktops,
+            "current_desktop": self.current_desktop,
+            "shortcuts": self.shortcuts,
+            "current_user": self.current_user,
+            "running_apps": list(self.running_apps.keys()),
+            # xdpyinfo forks; the layout rarely changes within an hour
+            "display_info": self.display_manager.get_display_info(max_age=3600)
+        }
+        
+        # Save window states
+        for window_id, window_data in self.windows.items():
+            if 'window' in window_data and window_data['window'].winfo_exists():
+                try:
+                    window = window_data['window']
+                    session_data["windows"].append({
+                        "id": window_id,
+                        "title": window_data.get("title", ""),
+                        "app": window_data.get("app", ""),
+                        "geometry": window.geometry(),
+                        "state": window.state(),
+                        "created_at": window_data.get("created_at", "").isoformat() if isinstance(window_data.get("created_at"), datetime.datetime) else ""
+                    })
+                except Exception as e:
+                    logger.warning(f"Failed to save window {window_id}: {e}")
+        
+        return session_data
+    
     def restore_session(self):
         """Restore previous session"""
         try:
@@ -5851,6 +8611,33 @@ def setup_ui(self):
             
         except Exception as e:
             logger.error(f"Session restore error: {e}")
+        
+        self.recover_editor_journals()
+    
+    def recover_editor_journals(self):
+        """Offer to recover editor buffers left unsaved by a previous session"""
+        try:
+            def discard(journal_path):
+                try:
+                    os.remove(journal_path)
+                except OSError:
+                    pass
+            
+            for journal_path, header in EditJournal.find_recoverable():
+                name = os.path.basename(header.get("file") or "") or "Untitled"
+                self.notifications.send(
+                    "Unsaved Work Found",
+                    f"Text Editor has unsaved changes to {name} from a previous session",
+                    timeout=0,
+                    notification_type="warning",
+                    actions=[
+                        {"text": "Recover", "callback": lambda p=journal_path: TextEditor(self).show(recover_journal=p)},
+                        {"text": "Discard", "callback": lambda p=journal_path: discard(p)}
+                    ]
+                )
+                
+        except Exception as e:
+            logger.error(f"Editor journal recovery error: {e}")
     
     # Enhanced event handlers
     def desktop_click(self, event):
@@ -5910,40 +8697,12 @@ def setup_ui(self):
             logger.error(f"Desktop menu error: {e}")
     
     def cycle_windows(self, event=None, reverse=False):
-        """Cycle through open windows (Alt+Tab)"""
+        """Cycle through open windows in most-recently-used order (Alt+Tab)"""
         try:
-            if not self.windows:
-                return
-                
-            window_list = list(self.windows.keys())
-            if not window_list:
-                return
-            
-            # Find currently focused window
-            current_index = 0
-            try:
-                focused_window = self.root.focus_get()
-                for i, window_id in enumerate(window_list):
-                    if window_id in self.windows:
-                        window = self.windows[window_id]['window']
-                        if window.winfo_exists() and focused_window in window.winfo_children():
-                            current_index = i
-                            break
-            except:
-                pass
-            
-            # Calculate next window index
-            if reverse:
-                next_index = (current_index - 1) % len(window_list)
-            else:
-                next_index = (current_index + 1) % len(window_list)
-            
-            # Focus next window
-            next_window_id = window_list[next_index]
-            self.focus_window(next_window_id)
-            
+            self.window_switcher.step(reverse)
         except Exception as e:
             logger.error(f"Window cycling error: {e}")
+        return "break"
     
     def switch_virtual_desktop(self, desktop_index):
         """Switch to a different virtual desktop"""
@@ -5968,9 +8727,16 @@ def setup_ui(self):
                         if window.winfo_exists():
                             window.deiconify()
                 
-                # Update wallpaper if different
+                # Give focus back to the window last used on that desktop
+                recent = self.window_registry.most_recent(desktop_index)
+                if recent is not None:
+                    self.focus_window(recent)
+                
+                # Update wallpaper if different (cached renders swap instantly)
                 if new_desktop.get("wallpaper"):
                     self.load_custom_wallpaper(new_desktop["wallpaper"], "stretch")
+                elif current_desktop.get("wallpaper"):
+                    self.load_wallpaper()
                 
                 self.notifications.send(
                     "Virtual Desktop",
@@ -6182,6 +8948,11 @@ def setup_ui(self):
     def perform_shutdown(self):
         """Perform actual system shutdown"""
         try:
+            # The shutdown commands kill us before cleanup runs
+            if self.notifications:
+                self.notifications.close_history()
+            STAGED_STORAGE.flush()
+            
             # Try different shutdown methods
             shutdown_commands = [
                 ['sudo', 'shutdown', '-h', 'now'],
@@ -6218,6 +8989,9 @@ def setup_ui(self):
             if result:
                 self.save_session()
                 self.save_config()
+                if self.notifications:
+                    self.notifications.close_history()
+                STAGED_STORAGE.flush()
                 
                 # Try restart commands
                 restart_commands = [
@@ -6245,10 +9019,12 @@ def setup_ui(self):
             logger.info("Starting Berke0S V2 main loop...")
             
             # Restore previous session if available
-            self.restore_session()
+            with STARTUP_PROFILER.span("restore_session"):
+                self.restore_session()
             
             # Start main loop
             if self.root:
+                self.root.after_idle(STARTUP_PROFILER.finish)
                 self.root.mainloop()
             else:
                 # Fallback to console mode
@@ -6267,14 +9043,27 @@ def setup_ui(self):
             # Save current state
             self.save_session()
             self.save_config()
+            EditJournal.flush_all()
             
             # Stop services
+            if self.dispatcher:
+                self.dispatcher.stop()
+            
+            if self.animator:
+                self.animator.stop()
+            
             if self.performance_monitor:
                 self.performance_monitor.stop()
             
+            if self.stall_monitor:
+                self.stall_monitor.stop()
+            
             if self.plugin_manager:
                 self.plugin_manager.cleanup()
             
+            if self.notifications:
+                self.notifications.close_history()
+            
             # Shutdown display system
             if self.display_manager:
                 self.display_manager.shutdown_display()
@@ -6288,6 +9077,9 @@ def setup_ui(self):
             
             logger.info("Cleanup completed")
             
+            # Last batch from the RAM staging area to persistent storage
+            STAGED_STORAGE.stop()
+            
         except Exception as e:
             logger.error(f"Cleanup error: {e}")
 
@@ -7271,6 +10063,201 @@ class FileManager:
 
 # Additional Application Classes
 
+class EditJournal:
+    """Append-only crash-recovery journal of TextEditor edits
+
+    Every insert/delete is queued as a small JSON record and appended to
+    ``JOURNAL_DIR/<id>.journal`` by a background writer thread, so the UI
+    thread never touches the disk and the buffer is never copied per tick.
+    """
+
+    instances = weakref.WeakSet()
+
+    def __init__(self, journal_path=None, flush_interval=2, compact_size=4 * 1024 * 1024):
+        self.journal_path = journal_path or os.path.join(JOURNAL_DIR, f"{uuid.uuid4().hex}.journal")
+        self.flush_interval = flush_interval
+        self.compact_size = compact_size
+        self.pending = collections.deque()
+        self.journal_bytes = 0
+        self.snapshot_bytes = 0
+        self.ops_since_start = 0
+        self.closed = False
+        self.wake_event = threading.Event()
+        self.write_lock = threading.Lock()
+        self.writer = threading.Thread(target=self.writer_loop, daemon=True, name="Edit Journal")
+        self.writer.start()
+        EditJournal.instances.add(self)
+
+    @classmethod
+    def flush_all(cls):
+        """Flush every open journal (used by auto-save and shutdown)"""
+        for journal in list(cls.instances):
+            if not journal.closed:
+                journal.flush()
+
+    @staticmethod
+    def fingerprint(file_path):
+        """Identify the on-disk base a journal applies to"""
+        try:
+            st = os.stat(file_path)
+            return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        except OSError:
+            return {"size": None, "mtime_ns": None}
+
+    def start(self, file_path=None):
+        """Start a fresh journal on top of the file (or empty buffer) just loaded"""
+        header = {
+            "op": "header",
+            "file": file_path,
+            "created": datetime.datetime.now().isoformat()
+        }
+        if file_path:
+            header.update(self.fingerprint(file_path))
+
+        self.ops_since_start = 0
+        self.journal_bytes = 0
+        self.snapshot_bytes = 0
+        self.pending.append(("reset", header))
+        self.wake_event.set()
+
+    def record_insert(self, index, text):
+        """Queue an insert of ``text`` at resolved index ``index``"""
+        if text:
+            self.queue_record({"op": "i", "at": index, "text": text}, len(text))
+
+    def record_delete(self, start, end):
+        """Queue a delete of the resolved range ``start``-``end``"""
+        if start != end:
+            self.queue_record({"op": "d", "from": start, "to": end}, 0)
+
+    def record_snapshot(self, text):
+        """Queue a full-buffer checkpoint that supersedes earlier records"""
+        self.queue_record({"op": "s", "text": text}, 0)
+        self.snapshot_bytes = len(text)
+
+    def queue_record(self, record, size):
+        """Append a record to the in-memory queue (UI thread, no I/O)"""
+        if self.closed:
+            return
+        self.pending.append(("append", record))
+        self.journal_bytes += size + 32
+        self.ops_since_start += 1
+
+    def needs_compaction(self):
+        """Whether the journal has grown enough to warrant a snapshot
+
+        Only records since the last snapshot count, against at least the
+        snapshot's own size, so a checkpoint of a large buffer never makes
+        the next edit checkpoint again.
+        """
+        return self.journal_bytes >= max(self.compact_size, self.snapshot_bytes)
+
+    def has_changes(self):
+        """Whether any edit was recorded since the last start()"""
+        return self.ops_since_start > 0
+
+    def writer_loop(self):
+        """Background loop appending queued records to disk"""
+        while not self.closed:
+            self.wake_event.wait(self.flush_interval)
+            self.wake_event.clear()
+            self.flush()
+
+    def flush(self):
+        """Write all queued records to the journal file"""
+        if not self.pending:
+            return
+
+        with self.write_lock:
+            try:
+                lines = []
+                truncate = False
+                while self.pending:
+                    action, record = self.pending.popleft()
+                    if action == "reset":
+                        # Everything before a reset is obsolete
+                        lines = []
+                        truncate = True
+                    lines.append(json.dumps(record, ensure_ascii=False))
+
+                if not lines and not truncate:
+                    return
+
+                with open(self.journal_path, 'w' if truncate else 'a', encoding='utf-8') as f:
+                    if lines:
+                        f.write('\n'.join(lines) + '\n')
+                    f.flush()
+                    os.fsync(f.fileno())
+
+            except Exception as e:
+                logger.error(f"Edit journal flush error: {e}")
+
+    def close(self, discard=False):
+        """Stop the writer, flushing or deleting the journal"""
+        if self.closed:
+            return
+        if discard:
+            self.pending.clear()
+        else:
+            self.flush()
+        self.closed = True
+        self.wake_event.set()
+
+        if discard:
+            self.discard()
+
+    def discard(self):
+        """Delete the journal file"""
+        with self.write_lock:
+            try:
+                if os.path.exists(self.journal_path):
+                    os.remove(self.journal_path)
+            except Exception as e:
+                logger.error(f"Edit journal discard error: {e}")
+
+    @staticmethod
+    def read(journal_path):
+        """Read a journal, returning (header, records) with torn tail lines skipped"""
+        header = None
+        records = []
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Last line may be torn by a crash mid-write
+                    break
+                if record.get("op") == "header":
+                    header = record
+                    records = []
+                elif record.get("op") == "s":
+                    records = [record]
+                else:
+                    records.append(record)
+        return header, records
+
+    @staticmethod
+    def find_recoverable():
+        """List journals left behind by a previous session that hold edits"""
+        recoverable = []
+        try:
+            for name in sorted(os.listdir(JOURNAL_DIR)):
+                if not name.endswith('.journal'):
+                    continue
+                path = os.path.join(JOURNAL_DIR, name)
+                try:
+                    header, records = EditJournal.read(path)
+                except Exception as e:
+                    logger.warning(f"Unreadable edit journal {name}: {e}")
+                    continue
+                if header and records:
+                    recoverable.append((path, header))
+                else:
+                    os.remove(path)
+        except Exception as e:
+            logger.error(f"Edit journal scan error: {e}")
+        return recoverable
+
 class TextEditor:
     """Advanced text editor with syntax highlighting and modern features"""
     
@@ -7281,8 +10268,11 @@ class TextEditor:
         self.find_dialog = None
         self.replace_dialog = None
         self.syntax_highlighting = True
+        self.journal = None
+        self.journal_suspended = False
+        self.journal_checkpoint_scheduled = False
         
-    def show(self, file_path=None):
+    def show(self, file_path=None, recover_journal=None):
         """Show text editor window"""
         try:
             self.window = self.wm.create_window(
@@ -7291,7 +10281,9 @@ class TextEditor:
                 900, 700,
                 resizable=True
             )
-            if file_path:
+            if recover_journal:
+                self.recover_from_journal(recover_journal)
+            elif file_path:
                 self.open_file(file_path)
         except Exception as e:
             logger.error(f"Text editor show error: {e}")
@@ -7354,6 +10346,9 @@ class TextEditor:
             # Configure syntax highlighting
             self.setup_syntax_highlighting()
             
+            # Crash-recovery journal
+            self.setup_journal()
+            
         except Exception as e:
             logger.error(f"Text editor content creation error: {e}")
     
@@ -7544,6 +10539,155 @@ class TextEditor:
         except Exception as e:
             logger.error(f"Event binding error: {e}")
     
+    def setup_journal(self):
+        """Route text widget edits through the crash-recovery journal"""
+        try:
+            editor_config = self.wm.config.get("editor", {})
+            if not editor_config.get("journal_enabled", True):
+                return
+            
+            self.journal = EditJournal(
+                flush_interval=editor_config.get("journal_flush_interval", 2),
+                compact_size=editor_config.get("journal_compact_size", 4 * 1024 * 1024)
+            )
+            self.journal.start(None)
+            
+            # Rename the Tk widget command and put a proxy in its place so every
+            # insert/delete (keyboard, paste, code) is seen with resolved indices
+            widget = self.text_area
+            self.text_command = widget._w + "_journaled"
+            widget.tk.call("rename", widget._w, self.text_command)
+            widget.tk.createcommand(widget._w, self.journal_dispatch)
+            widget.bind('<Destroy>', self.on_editor_destroy, add='+')
+            
+        except Exception as e:
+            logger.error(f"Edit journal setup error: {e}")
+            self.journal = None
+    
+    def journal_dispatch(self, operation, *args):
+        """Proxy for the text widget command that journals buffer edits"""
+        tk_call = self.text_area.tk.call
+        command = self.text_command
+        try:
+            if not self.journal or self.journal_suspended:
+                return tk_call((command, operation) + args)
+            
+            if operation == "insert" and args:
+                index = tk_call(command, "index", args[0])
+                result = tk_call((command, operation) + args)
+                self.journal.record_insert(index, "".join(args[1::2]))
+                
+            elif operation == "delete" and len(args) in (1, 2):
+                start = tk_call(command, "index", args[0])
+                end = tk_call(command, "index", args[1] if len(args) == 2 else f"{args[0]} +1c")
+                result = tk_call((command, operation) + args)
+                self.journal.record_delete(start, end)
+                
+            elif operation == "replace" and len(args) >= 3:
+                start = tk_call(command, "index", args[0])
+                end = tk_call(command, "index", args[1])
+                result = tk_call((command, operation) + args)
+                self.journal.record_delete(start, end)
+                self.journal.record_insert(start, "".join(args[2::2]))
+                
+            else:
+                result = tk_call((command, operation) + args)
+                
+                # Undo/redo and multi-range deletes change the buffer without
+                # telling us how, so fall back to a checkpoint
+                if operation == "edit" and args and args[0] in ("undo", "redo"):
+                    self.schedule_journal_checkpoint()
+                elif operation == "delete":
+                    self.schedule_journal_checkpoint()
+                return result
+            
+            if self.journal.needs_compaction():
+                self.schedule_journal_checkpoint()
+            return result
+            
+        except tk.TclError:
+            return ""
+    
+    def schedule_journal_checkpoint(self):
+        """Checkpoint the journal once the current event is handled"""
+        if not self.journal_checkpoint_scheduled:
+            self.journal_checkpoint_scheduled = True
+            self.text_area.after_idle(self.checkpoint_journal)
+    
+    def checkpoint_journal(self):
+        """Restart the journal from a snapshot of the current buffer"""
+        try:
+            self.journal_checkpoint_scheduled = False
+            if self.journal:
+                self.journal.start(self.current_file)
+                self.journal.record_snapshot(self.text_area.get('1.0', 'end-1c'))
+        except Exception as e:
+            logger.error(f"Edit journal checkpoint error: {e}")
+    
+    def on_editor_destroy(self, event=None):
+        """Close the journal when the editor goes away"""
+        try:
+            if self.journal:
+                # Keep unsaved work recoverable; drop the journal otherwise
+                self.journal.close(discard=not self.modified)
+                self.journal = None
+            self.text_area.tk.deletecommand(self.text_area._w)
+        except Exception as e:
+            logger.error(f"Edit journal close error: {e}")
+    
+    def recover_from_journal(self, journal_path):
+        """Rebuild an unsaved buffer by replaying a previous session's journal"""
+        try:
+            header, records = EditJournal.read(journal_path)
+            if not header:
+                raise ValueError("journal has no header")
+            
+            file_path = header.get("file")
+            base_content = ""
+            if file_path and not (records and records[0].get("op") == "s"):
+                base = {"size": header.get("size"), "mtime_ns": header.get("mtime_ns")}
+                if EditJournal.fingerprint(file_path) != base:
+                    raise ValueError(f"{os.path.basename(file_path)} changed on disk since the journal was written")
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    base_content = f.read()
+            
+            self.journal_suspended = True
+            try:
+                self.text_area.delete('1.0', tk.END)
+                self.text_area.insert('1.0', base_content)
+                for record in records:
+                    op = record.get("op")
+                    if op == "i":
+                        self.text_area.insert(record["at"], record["text"])
+                    elif op == "d":
+                        self.text_area.delete(record["from"], record["to"])
+                    elif op == "s":
+                        self.text_area.delete('1.0', tk.END)
+                        self.text_area.insert('1.0', record["text"])
+            finally:
+                self.journal_suspended = False
+            
+            self.current_file = file_path
+            self.modified = True
+            self.update_title()
+            self.update_line_numbers()
+            self.file_status.config(text=f"Recovered: {os.path.basename(file_path) if file_path else 'Untitled'}")
+            self.apply_syntax_highlighting()
+            
+            # Continue in this editor's own journal, then drop the old one
+            self.checkpoint_journal()
+            os.remove(journal_path)
+            
+            logger.info(f"Recovered editor buffer from {journal_path}")
+            
+        except Exception as e:
+            logger.error(f"Journal recovery error: {e}")
+            self.wm.notifications.send(
+                "Text Editor",
+                f"Failed to recover unsaved work: {str(e)}",
+                notification_type="error"
+            )
+    
     def setup_syntax_highlighting(self):
         """Setup syntax highlighting for different file types"""
         try:
@@ -7727,12 +10871,19 @@ class TextEditor:
                 elif result is None:
                     return
             
-            self.text_area.delete('1.0', tk.END)
+            self.journal_suspended = True
+            try:
+                self.text_area.delete('1.0', tk.END)
+            finally:
+                self.journal_suspended = False
             self.current_file = None
             self.modified = False
             self.update_title()
             self.file_status.config(text="New File")
             
+            if self.journal:
+                self.journal.start(None)
+            
         except Exception as e:
             logger.error(f"New file error: {e}")
     
@@ -7764,14 +10915,22 @@ class TextEditor:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            self.text_area.delete('1.0', tk.END)
-            self.text_area.insert('1.0', content)
+            # The file on disk is the journal base, so loading isn't journaled
+            self.journal_suspended = True
+            try:
+                self.text_area.delete('1.0', tk.END)
+                self.text_area.insert('1.0', content)
+            finally:
+                self.journal_suspended = False
             
             self.current_file = file_path
             self.modified = False
             self.update_title()
             self.file_status.config(text=os.path.basename(file_path))
             
+            if self.journal:
+                self.journal.start(file_path)
+            
             # Apply syntax highlighting
             self.apply_syntax_highlighting()
             
@@ -7790,11 +10949,13 @@ class TextEditor:
                 return self.save_as_file()
             
             content = self.text_area.get('1.0', 'end-1c')
-            with open(self.current_file, 'w', encoding='utf-8') as f:
-                f.write(content)
+            atomic_write(self.current_file, content)
             
             self.modified = False
             self.update_title()
+            
+            if self.journal:
+                self.journal.start(self.current_file)
             self.wm.notifications.send(
                 "Text Editor",
                 f"File saved: {os.path.basename(self.current_file)}",
@@ -7828,14 +10989,16 @@ class TextEditor:
             
             if file_path:
                 content = self.text_area.get('1.0', 'end-1c')
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(content)
+                atomic_write(file_path, content)
                 
                 self.current_file = file_path
                 self.modified = False
                 self.update_title()
                 self.file_status.config(text=os.path.basename(file_path))
                 
+                if self.journal:
+                    self.journal.start(file_path)
+                
                 self.wm.notifications.send(
                     "Text Editor",
                     f"File saved as: {os.path.basename(file_path)}",
@@ -8968,14 +12131,15 @@ Last Updated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
                     except Exception as e:
                         f.write(f"Error reading display logs: {e}\n")
                     
-                    # Include system logs
+                    # Include the last day of display records from the structured log
                     try:
-                        if os.path.exists(DISPLAY_LOG):
-                            f.write("\nDisplay Log File:\n")
-                            with open(DISPLAY_LOG, 'r') as log_file_handle:
-                                f.write(log_file_handle.read())
+                        records = LOG_STORE.query(start=time.time() - 86400, components=["Display"],
+                                                  limit=2000, newest_first=True)
+                        f.write(f"\nDisplay Log (last 24 hours, {len(records)} records):\n")
+                        for entry in reversed(records):
+                            f.write(format_log_record(entry) + "\n")
                     except Exception as e:
-                        f.write(f"Error reading display log file: {e}\n")
+                        f.write(f"Error reading display log: {e}\n")
                 
                 self.wm.notifications.send(
                     "Display Settings",
@@ -9109,6 +12273,183 @@ class PluginManager:
                     logger.error(f"Plugin cleanup error: {e}")
 
 # Performance Monitor
+# Frames from these directories are skipped when naming a stall's location
+LIBRARY_DIRS = tuple({os.path.realpath(sysconfig.get_paths()[name]) + os.sep
+                      for name in ("stdlib", "platstdlib", "purelib", "platlib")})
+
+def stack_location(stack):
+    """Innermost frame outside the standard library / site-packages"""
+    for frame in reversed(stack):
+        if not os.path.realpath(frame.filename).startswith(LIBRARY_DIRS):
+            return f"{os.path.basename(frame.filename)}:{frame.lineno} {frame.name}"
+    if stack:
+        frame = stack[-1]
+        return f"{os.path.basename(frame.filename)}:{frame.lineno} {frame.name}"
+    return "?"
+
+class StallStore:
+    """Batched background writes to the ui_stalls table"""
+    
+    def __init__(self, db_path=DATABASE_FILE, max_rows=5000):
+        self.max_rows = max_rows
+        self.write_queue = queue.Queue()
+        self.conn = None
+        
+        try:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        except Exception as e:
+            logger.error(f"Stall store error: {e}")
+        
+        self.writer = threading.Thread(target=self.writer_loop, daemon=True, name="Stall Store")
+        self.writer.start()
+    
+    def add(self, timestamp, duration_ms, location, stack):
+        self.write_queue.put((timestamp, duration_ms, location, stack))
+    
+    def writer_loop(self):
+        while True:
+            batch = [self.write_queue.get()]
+            try:
+                while len(batch) < 100:
+                    batch.append(self.write_queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            try:
+                if self.conn:
+                    self.conn.executemany(
+                        "INSERT INTO ui_stalls (timestamp, duration_ms, location, stack) VALUES (?, ?, ?, ?)",
+                        batch
+                    )
+                    self.conn.execute(
+                        "DELETE FROM ui_stalls WHERE id <= "
+                        "(SELECT id FROM ui_stalls ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                        (self.max_rows,)
+                    )
+                    self.conn.commit()
+            except Exception as e:
+                logger.error(f"Stall store write error: {e}")
+            finally:
+                for _ in batch:
+                    self.write_queue.task_done()
+    
+    def flush(self):
+        """Block until every queued stall is committed"""
+        self.write_queue.join()
+
+class StallMonitor:
+    """Tk event-loop stall detector
+
+    A heartbeat after() callback records when it last ran; a watchdog
+    thread samples the main thread's stack with sys._current_frames()
+    while the loop is overdue by more than the threshold. When the
+    heartbeat runs again the stall is stored with its duration and the
+    stack seen most often during it.
+    """
+    
+    def __init__(self, root, store=None, threshold_ms=100, heartbeat_ms=50, hang_report_s=5.0, max_frames=40):
+        self.root = root
+        self.store = store
+        self.threshold = threshold_ms / 1000.0
+        self.heartbeat_ms = heartbeat_ms
+        self.hang_report = hang_report_s
+        self.max_frames = max_frames
+        self.main_ident = threading.get_ident()
+        
+        self.lock = threading.Lock()
+        self.expected = 0.0
+        self.samples = collections.Counter()
+        self.hang_reported = False
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        
+        self.running = False
+        self.after_id = None
+        self.stop_event = threading.Event()
+    
+    def start(self):
+        """Start the heartbeat and the watchdog; call from the Tk thread"""
+        if self.running:
+            return
+        self.running = True
+        self.main_ident = threading.get_ident()
+        self.expected = time.monotonic() + self.heartbeat_ms / 1000.0
+        self.after_id = self.root.after(self.heartbeat_ms, self.beat)
+        self.stop_event.clear()
+        threading.Thread(target=self.watch, daemon=True, name="Stall Watchdog").start()
+    
+    def stop(self):
+        self.running = False
+        self.stop_event.set()
+        if self.after_id:
+            try:
+                self.root.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
+        if self.store:
+            self.store.flush()
+        if self.count:
+            logger.info(f"UI stalls this session: {self.count}, {self.total_ms / 1000:.1f} s total, "
+                        f"longest {self.max_ms:.0f} ms")
+    
+    def beat(self):
+        now = time.monotonic()
+        with self.lock:
+            lag = now - self.expected
+            samples = self.samples
+            self.samples = collections.Counter()
+            self.hang_reported = False
+            self.expected = now + self.heartbeat_ms / 1000.0
+        
+        if lag >= self.threshold:
+            self.record(now - lag, lag * 1000, samples)
+        
+        if self.running:
+            self.after_id = self.root.after(self.heartbeat_ms, self.beat)
+    
+    def record(self, started, lag_ms, samples):
+        """Keep the stall; the stack is the one sampled most often while it lasted"""
+        if samples:
+            (location, stack), _ = samples.most_common(1)[0]
+        else:
+            # Shorter than one watchdog tick, or the watchdog itself was starved
+            location, stack = "?", ""
+        
+        self.count += 1
+        self.total_ms += lag_ms
+        self.max_ms = max(self.max_ms, lag_ms)
+        logger.debug(f"UI stall {lag_ms:.0f} ms at {location}")
+        if self.store:
+            self.store.add(time.time() - (time.monotonic() - started), round(lag_ms, 1), location, stack)
+    
+    def watch(self):
+        interval = max(self.threshold / 4, 0.01)
+        while not self.stop_event.wait(interval):
+            with self.lock:
+                overdue = time.monotonic() - self.expected
+            if overdue < self.threshold:
+                continue
+            
+            frame = sys._current_frames().get(self.main_ident)
+            if frame is None:
+                continue
+            summary = traceback.extract_stack(frame, limit=self.max_frames)
+            del frame
+            sample = (stack_location(summary), "".join(summary.format()))
+            
+            with self.lock:
+                if time.monotonic() - self.expected < self.threshold:
+                    # The heartbeat ran while the stack was being read
+                    continue
+                self.samples[sample] += 1
+                report = overdue >= self.hang_report and not self.hang_reported
+                if report:
+                    self.hang_reported = True
+            if report:
+                logger.warning(f"UI loop blocked for {overdue:.1f} s at {sample[0]}:\n{sample[1]}")
+
 class PerformanceMonitor:
     """System performance monitoring"""
     
@@ -9144,13 +12485,17 @@ def main():
     """Enhanced main entry point for V2"""
     try:
         logger.info("Starting Berke0S 3.0 V2 - Enhanced Display Management...")
+        STARTUP_PROFILER.mark("main")
+        STAGED_STORAGE.start()
         
         # Initialize database
-        init_database()
+        with STARTUP_PROFILER.span("init_database"):
+            init_database()
         
         # Check if installation is needed
         if not os.path.exists(INSTALL_FLAG) or "--install" in sys.argv:
             logger.info("Starting installation wizard...")
+            STARTUP_PROFILER.finish()
             installer = InstallationWizard()
             installer.start_installation()
             
@@ -9171,7 +12516,8 @@ def main():
         else:
             # Start desktop environment directly
             logger.info("Starting desktop environment...")
-            wm = WindowManager()
+            with STARTUP_PROFILER.span("WindowManager.__init__"):
+                wm = WindowManager()
             wm.run()
             
     except KeyboardInterrupt:
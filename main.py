@@ -26,18 +26,21 @@ from core.window_manager import UltimateWindowManager
 from core.installer import InstallationWizard
 from core.developer_mode import DeveloperMode
 from core.recovery_system import RecoverySystem
+from core.app_registry import AppRegistry
 
-# Sistem uygulamaları
-from apps.file_manager import UltimateFileManager
-from apps.web_browser import BerkeWebBrowser
-from apps.ide import BerkeIDE
-from apps.control_panel import ControlPanel
-from apps.minecraft_launcher import BerkeLauncher
-from apps.ai_workspace import AIWorkspace
-from apps.office_suite import BerkeOffice
-from apps.media_center import MediaCenter
-from apps.terminal import UltimateTerminal
-from apps.disk_manager import DiskManager
+# Sistem uygulamaları (ilk açılışta import edilir)
+APPLICATIONS = {
+    "file_manager": "apps.file_manager:UltimateFileManager",
+    "web_browser": "apps.web_browser:BerkeWebBrowser",
+    "ide": "apps.ide:BerkeIDE",
+    "control_panel": "apps.control_panel:ControlPanel",
+    "minecraft_launcher": "apps.minecraft_launcher:BerkeLauncher",
+    "ai_workspace": "apps.ai_workspace:AIWorkspace",
+    "office_suite": "apps.office_suite:BerkeOffice",
+    "media_center": "apps.media_center:MediaCenter",
+    "terminal": "apps.terminal:UltimateTerminal",
+    "disk_manager": "apps.disk_manager:DiskManager"
+}
 
 class BerkeOSUltimate:
     """BERKE0S Ultimate Ana Sistem Sınıfı"""
@@ -45,7 +48,7 @@ class BerkeOSUltimate:
     def __init__(self):
         self.version = "4.0-Ultimate"
         self.config_manager = ConfigManager()
-        self.logger = setup_logging()
+        self.logger = setup_logging(settings=self.config_manager.get("logging", {}))
         self.window_manager = None
         self.developer_mode = DeveloperMode()
         self.recovery_system = RecoverySystem()
@@ -64,7 +67,7 @@ class BerkeOSUltimate:
         }
         
         # Uygulamalar registry
-        self.applications = {}
+        self.applications = AppRegistry(os.path.join(BERKE0S_USER, "app_usage.json"))
         self.services = {}
         
         self.logger.info(f"BERKE0S Ultimate {self.version} başlatılıyor...")
@@ -92,6 +95,10 @@ class BerkeOSUltimate:
                           help='Headless modda çalıştır')
         parser.add_argument('--config-dir', 
                           help='Özel config dizini')
+        parser.add_argument('--eager-apps', action='store_true',
+                          help='Tüm uygulamaları başlangıçta yükle (ölçüm için)')
+        parser.add_argument('--no-app-warmup', action='store_true',
+                          help='Sık kullanılan uygulamaları boşta önceden yükleme')
         
         return parser.parse_args()
     
@@ -127,6 +134,14 @@ class BerkeOSUltimate:
             
             # Uygulamaları kaydet
             self.register_applications()
+            if args.eager_apps:
+                self.applications.load_all()
+            elif not args.no_app_warmup and not args.safe_mode:
+                # Masaüstü açıldıktan sonra en çok kullanılanları önceden yükle
+                self.applications.warm_up(
+                    delay=self.config_manager.get("system.app_warmup_delay", 10),
+                    should_continue=lambda: self.running
+                )
             
             # Window manager başlat
             if not args.headless:
@@ -163,29 +178,15 @@ class BerkeOSUltimate:
                 self.logger.error(f"Servis başlatma hatası {service_name}: {e}")
     
     def register_applications(self):
-        """Uygulamaları kaydet"""
-        apps = {
-            "file_manager": UltimateFileManager,
-            "web_browser": BerkeWebBrowser,
-            "ide": BerkeIDE,
-            "control_panel": ControlPanel,
-            "minecraft_launcher": BerkeLauncher,
-            "ai_workspace": AIWorkspace,
-            "office_suite": BerkeOffice,
-            "media_center": MediaCenter,
-            "terminal": UltimateTerminal,
-            "disk_manager": DiskManager
-        }
-        
-        for app_name, app_class in apps.items():
-            self.applications[app_name] = app_class
-            self.logger.debug(f"Uygulama kaydedildi: {app_name}")
+        """Uygulamaları kaydet (modüller ilk açılışta yüklenir)"""
+        for app_name, entry_point in APPLICATIONS.items():
+            self.applications.register(app_name, entry_point)
     
     def launch_application(self, app_name, *args, **kwargs):
         """Uygulama başlat"""
         try:
             if app_name in self.applications:
-                app_class = self.applications[app_name]
+                app_class = self.applications.get(app_name)
                 app_instance = app_class(self, *args, **kwargs)
                 app_instance.show()
                 
@@ -195,6 +196,7 @@ class BerkeOSUltimate:
                     "start_time": time.time()
                 })
                 
+                self.applications.record_launch(app_name)
                 self.logger.info(f"Uygulama başlatıldı: {app_name}")
                 return app_instance
             else:
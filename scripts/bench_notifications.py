@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+BERKE0S notification benchmark
+
+Sends a burst of notifications through NotificationSystem the way the
+background monitors do (repeated warnings, several sources, a few unique
+messages) and reports how many windows/widgets exist and how much memory
+was used. Needs a display (use xvfb-run on headless machines).
+
+    python3 scripts/bench_notifications.py --count 1000
+"""
+
+import os
+import sys
+import time
+import argparse
+import resource
+import tracemalloc
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import BERKE0S
+
+
+class BenchWindowManager:
+    """Just enough of WindowManager for NotificationSystem"""
+
+    def __init__(self):
+        self.root = tk.Tk()
+        self.root.withdraw()
+        self.config = BERKE0S.DEFAULT_CONFIG.copy()
+
+    def get_theme_color(self, color_name):
+        return "#1a1a1a"
+
+
+def count_widgets(widget):
+    """Count a widget and all of its descendants"""
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def count_toplevels(root):
+    """Count Toplevel windows under root"""
+    return sum(1 for child in root.winfo_children() if isinstance(child, tk.Toplevel))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BERKE0S notifications")
+    parser.add_argument("--count", type=int, default=1000, help="notifications to send")
+    parser.add_argument("--timeout", type=int, default=5000, help="per-notification timeout (ms)")
+    args = parser.parse_args()
+
+    BERKE0S.init_database()
+    wm = BenchWindowManager()
+    notifications = BERKE0S.NotificationSystem(wm)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    for i in range(args.count):
+        kind = i % 4
+        if kind == 0:
+            notifications.send("System Warning", "High CPU usage: 95.0%",
+                               timeout=args.timeout, notification_type="warning", source="monitor.cpu")
+        elif kind == 1:
+            notifications.send("Temperature Warning", f"sensor{i % 8}: 85.0°C",
+                               timeout=args.timeout, notification_type="warning", source="monitor.temperature")
+        elif kind == 2:
+            notifications.send("Network Status", "Internet connection lost",
+                               timeout=args.timeout, notification_type="error")
+        else:
+            notifications.send(f"Event {i}", f"Unique message {i}", timeout=args.timeout)
+
+        # Let Tk process the animations like the real event loop would
+        wm.root.update()
+
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"Notifications sent:   {args.count}")
+    print(f"Elapsed:              {elapsed:.2f} s ({elapsed / args.count * 1000:.2f} ms/notification)")
+    print(f"Visible:              {len(notifications.notifications)}")
+    print(f"Queued:               {len(notifications.pending)}")
+    print(f"Pooled windows:       {len(notifications.window_pool)}")
+    print(f"Toplevel windows:     {count_toplevels(wm.root)}")
+    print(f"Total widgets:        {count_widgets(wm.root)}")
+    print(f"Python memory:        {current / 1024:.1f} KiB current, {peak / 1024:.1f} KiB peak")
+    print(f"Max RSS:              {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+
+    wm.root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
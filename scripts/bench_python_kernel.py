@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+BERKE0S Python kernel benchmark
+
+Compares run latency of the AI Workspace's warm kernel with what code
+runs used to do (write ``temp_code.py`` and start ``sys.executable`` on
+it), then checks the limits: CPU, memory, wall time, cancel, streamed
+output, kept state and restart after a crash.
+
+    python3 scripts/bench_python_kernel.py
+    python3 scripts/bench_python_kernel.py --runs 50 --check
+"""
+
+import os
+import sys
+import time
+import signal
+import argparse
+import tempfile
+import threading
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from core.python_kernel import PythonKernel
+
+SNIPPETS = {
+    "print": "print('merhaba')",
+    "imports": "import json, re, datetime, collections, decimal, sqlite3\nprint(json.dumps({'a': 1}))",
+    "loop": "print(sum(i * i for i in range(200000)))"
+}
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def subprocess_run(code, workdir):
+    """The previous run_python_code"""
+    temp_file = os.path.join(workdir, "temp_code.py")
+    with open(temp_file, 'w') as f:
+        f.write(code)
+    result = subprocess.run([sys.executable, temp_file], capture_output=True, text=True, timeout=30)
+    os.remove(temp_file)
+    return result.stdout
+
+
+def benchmark(kernel, workdir, runs):
+    print(f"{'kod':<10} {'yeni süreç ms (medyan/p95)':>28} {'çekirdek ms (medyan/p95)':>26} "
+          f"{'durum koruyan ms':>18}")
+    for name, code in SNIPPETS.items():
+        timings = {"subprocess": [], "kernel": [], "state": []}
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess_run(code, workdir)
+            timings["subprocess"].append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            kernel.run(code)
+            timings["kernel"].append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            kernel.run(code, keep_state=True)
+            timings["state"].append((time.perf_counter() - start) * 1000)
+        columns = [f"{percentile(values, 0.5):.1f} / {percentile(values, 0.95):.1f}" for values in timings.values()]
+        print(f"{name:<10} {columns[0]:>28} {columns[1]:>26} {columns[2]:>18}")
+
+
+def check(kernel):
+    failures = []
+
+    def expect(label, result, status):
+        print(f"{label}: {result.describe()}")
+        if result.status != status:
+            failures.append(f"{label}: expected {status}, got {result.status}")
+
+    for keep_state in (False, True):
+        mode = "durum koruyan" if keep_state else "fork"
+        expect(f"{mode} CPU", kernel.run("while True: pass", keep_state=keep_state, cpu_seconds=1, timeout=10),
+               "cpu")
+        expect(f"{mode} bellek", kernel.run("x = bytearray(1024 * 1024 * 1024)", keep_state=keep_state,
+                                            memory_mb=256), "memory")
+        expect(f"{mode} süre", kernel.run("import time\ntime.sleep(5)", keep_state=keep_state, timeout=0.5),
+               "timeout")
+        threading.Timer(0.3, kernel.cancel).start()
+        expect(f"{mode} iptal", kernel.run("import time\ntime.sleep(5)", keep_state=keep_state), "cancelled")
+
+    arrivals = []
+    start = time.perf_counter()
+    result = kernel.run("import time\nfor i in range(5):\n    print(i, flush=True)\n    time.sleep(0.1)",
+                        on_output=lambda stream, text: arrivals.append(time.perf_counter() - start))
+    print(f"akış: {len(arrivals)} parça, ilk {arrivals[0] * 1000:.0f} ms, son {arrivals[-1] * 1000:.0f} ms")
+    if result.status != "ok":
+        failures.append(f"streaming run: expected ok, got {result.status}")
+    if len(arrivals) < 3 or arrivals[0] > 0.1:
+        failures.append("output was not streamed")
+
+    output = []
+    kernel.run("sayac = 41", keep_state=True)
+    kernel.run("sayac += 1\nprint(sayac)", keep_state=True, on_output=lambda stream, text: output.append(text))
+    print(f"durum: {''.join(output).strip()}")
+    if "".join(output).strip() != "42":
+        failures.append("state was not kept between runs")
+
+    errors = []
+    kernel.run("1 / 0", on_output=lambda stream, text: errors.append((stream, text)))
+    if not any(stream == "stderr" and "ZeroDivisionError" in text for stream, text in errors):
+        failures.append("traceback did not arrive on stderr")
+
+    restarts = kernel.restarts
+    expect("çökme", kernel.run("import os\nos._exit(9)", keep_state=True), "crashed")
+    expect("yeniden başlatma sonrası", kernel.run("print('tamam')"), "ok")
+    if kernel.restarts != restarts + 1:
+        failures.append("kernel was not restarted after the crash")
+
+    # Reset while a run is going: the run ends as cancelled, then the kernel is replaced
+    outcome = []
+    runner = threading.Thread(target=lambda: outcome.append(kernel.run("import time\ntime.sleep(5)")))
+    runner.start()
+    time.sleep(0.2)
+    kernel.cancel()
+    kernel.restart()
+    runner.join()
+    expect("çalışırken sıfırlama", outcome[0], "cancelled")
+    expect("sıfırlama sonrası", kernel.run("print('tamam')"), "ok")
+
+    # Killing the kernel mid-run must take the forked run's process group with it
+    outcome = []
+    runner = threading.Thread(target=lambda: outcome.append(kernel.run("import time\ntime.sleep(20)", timeout=60)))
+    runner.start()
+    time.sleep(0.3)
+    child = kernel.child_pgid
+    os.killpg(kernel.process.pid, signal.SIGKILL)
+    runner.join()
+    expect("çekirdek öldürüldü", outcome[0], "crashed")
+    # SIGKILL is asynchronous and the orphan is reaped by init, so give it a moment
+    deadline = time.monotonic() + 2
+    while True:
+        try:
+            os.killpg(child, 0)
+        except (ProcessLookupError, TypeError):
+            break
+        if time.monotonic() > deadline:
+            failures.append("forked run outlived the kernel")
+            break
+        time.sleep(0.05)
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the AI Workspace Python kernel")
+    parser.add_argument("--runs", type=int, default=20, help="runs per snippet (default 20)")
+    parser.add_argument("--check", action="store_true", help="also check limits, streaming, state and restart")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        kernel = PythonKernel(workdir)
+        start = time.perf_counter()
+        kernel.start()
+        print(f"çekirdek hazır: {(time.perf_counter() - start) * 1000:.0f} ms")
+        try:
+            benchmark(kernel, workdir, args.runs)
+            return check(kernel) if args.check else 0
+        finally:
+            kernel.stop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
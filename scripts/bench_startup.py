@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+BERKE0S startup benchmark
+
+Starts fresh interpreters that import main.py, build BerkeOSUltimate and
+register the applications, once with the lazy registry (default) and once
+with every app imported up front (--eager-apps behaviour). Reports median
+wall time and peak RSS for each.
+
+    python3 scripts/bench_startup.py --runs 5
+"""
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import sys, json, time, resource
+start = time.perf_counter()
+sys.path.insert(0, {src!r})
+sys.path.insert(0, {repo!r})
+import main
+berke_os = main.BerkeOSUltimate()
+berke_os.register_applications()
+if {eager!r}:
+    berke_os.applications.load_all()
+elapsed = time.perf_counter() - start
+loaded = sum(1 for name in berke_os.applications.names() if berke_os.applications.is_loaded(name))
+print(json.dumps({{
+    "wall": elapsed,
+    "rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "loaded": loaded,
+    "modules": len(sys.modules)
+}}))
+"""
+
+
+def measure(eager, runs):
+    """Run the child ``runs`` times and collect its reports"""
+    results = []
+    code = CHILD.format(src=os.path.join(REPO_DIR, "src"), repo=REPO_DIR, eager=eager)
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        results.append(json.loads(output.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def summarize(label, results):
+    wall = statistics.median(r["wall"] for r in results) * 1000
+    rss = statistics.median(r["rss_kib"] for r in results) / 1024
+    print(f"{label:<6} wall {wall:8.1f} ms   RSS {rss:7.1f} MiB   "
+          f"apps loaded {results[0]['loaded']:>2}   modules {results[0]['modules']}")
+    return wall, rss
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark BERKE0S startup with lazy vs eager app loading")
+    parser.add_argument("--runs", type=int, default=5, help="interpreter starts per mode")
+    args = parser.parse_args()
+
+    lazy_wall, lazy_rss = summarize("lazy", measure(False, args.runs))
+    eager_wall, eager_rss = summarize("eager", measure(True, args.runs))
+
+    print(f"saved  wall {eager_wall - lazy_wall:8.1f} ms   RSS {eager_rss - lazy_rss:7.1f} MiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+BERKE0S memory snapshot comparison
+
+Compares two snapshots exported from the developer tools memory tab
+(``~/.berke0s/profiles/memory-*.tracemalloc``, each with a ``.json``
+sidecar of object and widget counts) and prints the allocation sites,
+object types and widget classes that grew.
+
+    python3 scripts/compare_memory.py memory-0900.tracemalloc memory-1700.tracemalloc
+    python3 scripts/compare_memory.py old.tracemalloc new.tracemalloc --group traceback --limit 10
+"""
+
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from core.memory_inspector import MemorySnapshot, format_diff
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two BERKE0S memory snapshots")
+    parser.add_argument("before", help="older snapshot (.tracemalloc)")
+    parser.add_argument("after", help="newer snapshot (.tracemalloc)")
+    parser.add_argument("--group", choices=["lineno", "filename", "traceback"], default="lineno",
+                        help="group allocations by line, file or full traceback (default lineno)")
+    parser.add_argument("--limit", type=int, default=30, help="allocation sites to show (default 30)")
+    args = parser.parse_args()
+
+    before = MemorySnapshot.load(args.before)
+    after = MemorySnapshot.load(args.after)
+    print(format_diff(before, after, args.group, args.limit))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+BERKE0S Ollama stub server
+
+A local HTTP server speaking enough of the Ollama API for the AI
+Workspace: ``/api/tags``, ``/api/generate`` and ``/api/chat``, streamed
+(chunked NDJSON, one token per chunk, like Ollama) or not. Words stand in
+for tokens. Like Ollama it keeps one KV cache: only the prompt tokens
+after the prefix shared with the previous request are prefilled (at
+``--prefill`` seconds each), and prompts longer than ``num_ctx`` are cut
+at the front.
+
+Point the AI Workspace's Ollama host at it to try streaming without a
+model, run the built-in check of the streaming client, or compare time
+to first token over a conversation:
+
+    python3 scripts/ollama_stub.py --port 11434 --tokens 400 --delay 0.02
+    python3 scripts/ollama_stub.py --check
+    python3 scripts/ollama_stub.py --conversation 16 --tokens 150 --delay 0.001
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+WORDS = ("Merhaba", "bu", "BERKE0S", "için", "örnek", "bir", "yanıttır", "ve", "kod", "içerir", ":")
+MODEL = "stub:latest"
+
+
+def render_messages(messages):
+    tokens = []
+    for message in messages:
+        tokens += [f"<{message.get('role', 'user')}>"] + message.get("content", "").split()
+    return tokens + ["<assistant>"]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Go's net/http (Ollama) sets TCP_NODELAY; without it the separate header
+    # and body writes wait on delayed ACKs on a kept-alive connection
+    disable_nagle_algorithm = True
+    tokens = 200
+    delay = 0.02
+    prefill = 0.001
+    # One loaded model with one KV cache slot, like Ollama with OLLAMA_NUM_PARALLEL=1
+    cache = None
+    lock = None
+    vocab = None
+    counts = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def setup(self):
+        # One handler per TCP connection; requests on it are counted separately
+        super().setup()
+        with self.lock:
+            self.counts["connections"] += 1
+
+    def count(self):
+        with self.lock:
+            self.counts[self.path] = self.counts.get(self.path, 0) + 1
+
+    def send_json(self, data, status=200):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def write_chunk(self, data):
+        line = (json.dumps(data, ensure_ascii=False) + "\n").encode("utf-8")
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(line), line))
+        self.wfile.flush()
+
+    def do_GET(self):
+        self.count()
+        if self.path == "/api/tags":
+            self.send_json({"models": [{"name": MODEL, "size": 0, "details": {"family": "stub"}}]})
+        else:
+            self.send_json({"error": "not found"}, 404)
+
+    def prompt_tokens(self, request, num_ctx):
+        """Prompt as the model sees it, cut to num_ctx the way Ollama does"""
+        if self.path == "/api/chat":
+            messages = list(request.get("messages", []))
+            prompt = render_messages(messages)
+            # Oldest non-system messages are dropped until the prompt fits
+            while len(prompt) > num_ctx and len(messages) > 1:
+                drop = 1 if messages[0].get("role") == "system" and len(messages) > 2 else 0
+                del messages[drop]
+                prompt = render_messages(messages)
+            return prompt[-num_ctx:]
+        words_by_id = {index: word for word, index in self.vocab.items()}
+        words = [words_by_id.get(token, "<unk>") for token in request.get("context") or []]
+        prompt = words + ["<user>"] + request.get("prompt", "").split() + ["<assistant>"]
+        return prompt[-num_ctx:]
+
+    def evaluate(self, prompt):
+        """Sleep for the prompt tokens not already in the cache; returns how many"""
+        with self.lock:
+            cached = self.cache["tokens"]
+            common = 0
+            for a, b in zip(prompt, cached):
+                if a != b:
+                    break
+                common += 1
+            # The last prompt token is always evaluated to get the first logits
+            common = min(common, len(prompt) - 1)
+            evaluated = len(prompt) - common
+            time.sleep(self.prefill * evaluated)
+            self.cache["tokens"] = list(prompt)
+        return evaluated
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        self.count()
+        if self.path not in ("/api/generate", "/api/chat"):
+            self.send_json({"error": "not found"}, 404)
+            return
+        if request.get("model") != MODEL:
+            self.send_json({"error": f"model '{request.get('model')}' not found"}, 404)
+            return
+
+        options = request.get("options", {})
+        count = min(self.tokens, options.get("num_predict") or self.tokens)
+        tokens = [WORDS[i % len(WORDS)] + " " for i in range(count - 8)] + \
+                 ["\n```python\n", "print(", "'", "merhaba", "'", ")", "\n```", "\n"]
+        chat = self.path == "/api/chat"
+        start = time.monotonic_ns()
+        prompt = self.prompt_tokens(request, options.get("num_ctx", 2048))
+        evaluated = self.evaluate(prompt)
+        prompt_duration = time.monotonic_ns() - start
+        sequence = prompt + "".join(tokens).split()
+        with self.lock:
+            self.cache["tokens"] = sequence
+        final = {
+            "model": MODEL, "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ"), "done": True,
+            "done_reason": "stop", "prompt_eval_count": evaluated, "prompt_eval_duration": prompt_duration,
+            "eval_count": len(tokens)
+        }
+        if chat:
+            final["message"] = {"role": "assistant", "content": ""}
+        else:
+            final["response"] = ""
+            final["context"] = [self.vocab.setdefault(word, len(self.vocab)) for word in sequence]
+
+        def chunk(token):
+            if chat:
+                return {"model": MODEL, "created_at": final["created_at"],
+                        "message": {"role": "assistant", "content": token}, "done": False}
+            return {"model": MODEL, "created_at": final["created_at"], "response": token, "done": False}
+
+        if not request.get("stream", True):
+            time.sleep(self.delay * len(tokens))
+            final.update(total_duration=time.monotonic_ns() - start,
+                         eval_duration=time.monotonic_ns() - start - prompt_duration)
+            if chat:
+                final["message"]["content"] = "".join(tokens)
+            else:
+                final["response"] = "".join(tokens)
+            self.send_json(final)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for token in tokens:
+                time.sleep(self.delay)
+                self.write_chunk(chunk(token))
+            final.update(total_duration=time.monotonic_ns() - start,
+                         eval_duration=time.monotonic_ns() - start - prompt_duration)
+            self.write_chunk(final)
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client cancelled
+            pass
+
+
+def serve(port, tokens, delay, prefill=0.001):
+    handler = type("Handler", (StubHandler,), {
+        "tokens": tokens, "delay": delay, "prefill": prefill,
+        "cache": {"tokens": []}, "lock": threading.Lock(), "vocab": {}, "counts": {"connections": 0}
+    })
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def check(tokens, delay):
+    """Stream from the stub with OllamaClient: order, first-token time, cancel"""
+    from core.ollama_client import OllamaClient, OllamaError, chunk_text
+
+    server = serve(0, tokens, delay)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = OllamaClient(f"http://127.0.0.1:{server.server_address[1]}")
+    failures = []
+
+    start = time.perf_counter()
+    first = None
+    text = []
+    stream = client.generate_stream(MODEL, "merhaba")
+    for chunk in stream:
+        if first is None:
+            first = time.perf_counter() - start
+        text.append(chunk["response"])
+    total = time.perf_counter() - start
+    print(f"stream: {len(text) - 1} tokens, first after {first * 1000:.0f} ms, all after {total * 1000:.0f} ms")
+    if stream.final.get("eval_count") != len(text) - 1:
+        failures.append("final chunk eval_count does not match the streamed tokens")
+    if first > delay * 5:
+        failures.append("first token arrived late (response buffered?)")
+    if "```python" not in "".join(text):
+        failures.append("streamed text is incomplete")
+
+    stream = client.generate_stream(MODEL, "merhaba")
+    received = 0
+    start = time.perf_counter()
+    for chunk in stream:
+        received += 1
+        if received == 10:
+            threading.Timer(0, stream.cancel).start()
+    elapsed = time.perf_counter() - start
+    print(f"cancel: stopped after {received} chunks, {elapsed * 1000:.0f} ms")
+    if received >= tokens:
+        failures.append("cancel did not stop the stream")
+
+    try:
+        list(client.generate_stream("missing:latest", "merhaba"))
+        failures.append("unknown model did not raise")
+    except OllamaError as e:
+        print(f"error: {e}")
+
+    stream = client.chat_stream(MODEL, [{"role": "user", "content": "merhaba"}])
+    text = "".join(chunk_text(chunk) for chunk in stream)
+    print(f"chat: {stream.final.get('eval_count')} tokens, {stream.final.get('prompt_eval_count')} prompt tokens evaluated")
+    if "```python" not in text:
+        failures.append("chat stream text is incomplete")
+
+    pooled(server, failures)
+
+    server.shutdown()
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+def pooled(server, failures):
+    """Model list requests: new connection each vs the shared session; cache and dedupe"""
+    import requests
+    from core.ollama_client import OllamaClient, OllamaError
+
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    counts = server.RequestHandlerClass.counts
+    calls = 200
+
+    connections = counts["connections"]
+    start = time.perf_counter()
+    for _ in range(calls):
+        requests.get(f"{url}/api/tags", timeout=5).json()
+    fresh = (time.perf_counter() - start) * 1000 / calls
+    fresh_connections = counts["connections"] - connections
+
+    client = OllamaClient(url)
+    connections = counts["connections"]
+    start = time.perf_counter()
+    for _ in range(calls):
+        client.fetch_models()
+    session = (time.perf_counter() - start) * 1000 / calls
+    print(f"/api/tags: {fresh:.2f} ms with a new connection ({fresh_connections} connections), "
+          f"{session:.2f} ms on the session ({counts['connections'] - connections} connections)")
+    if counts["connections"] - connections > 1:
+        failures.append("session did not reuse its connection")
+
+    client = OllamaClient(url, models_ttl=0.2)
+    requests_before = counts["/api/tags"]
+    threads = [threading.Thread(target=client.list_models) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    concurrent = counts["/api/tags"] - requests_before
+    for _ in range(50):
+        client.list_models()
+    cached = counts["/api/tags"] - requests_before - concurrent
+    time.sleep(0.3)
+    start = time.perf_counter()
+    client.list_models()
+    stale = (time.perf_counter() - start) * 1000
+    time.sleep(0.1)
+    print(f"model list: 10 concurrent calls -> {concurrent} request, 50 cached calls -> {cached} requests, "
+          f"stale call returned in {stale:.2f} ms and refreshed in the background "
+          f"({counts['/api/tags'] - requests_before - concurrent - cached} request)")
+    if concurrent != 1 or cached != 0:
+        failures.append("model list requests were not shared or cached")
+
+    stream = client.chat_stream(MODEL, [{"role": "user", "content": "çift tık"}])
+    duplicate = client.chat_stream(MODEL, [{"role": "user", "content": "çift tık"}])
+    chunks = iter(stream)
+    next(chunks)
+    try:
+        next(iter(duplicate))
+        failures.append("duplicate stream was not refused")
+    except OllamaError:
+        print("duplicate send: refused while the first is streaming")
+    stream.cancel()
+
+
+def first_token(stream):
+    """(milliseconds to the first token, reply text) of a stream"""
+    from core.ollama_client import chunk_text
+
+    start = time.perf_counter()
+    first = None
+    text = []
+    for chunk in stream:
+        if first is None:
+            first = (time.perf_counter() - start) * 1000
+        text.append(chunk_text(chunk))
+    return first, "".join(text)
+
+
+def conversation(turns, tokens, delay, prefill, num_ctx):
+    """Time to first token per turn: full history resent vs ChatMemory"""
+    from core.ollama_client import OllamaClient
+    from core.conversation import ChatMemory
+
+    question = " ".join(WORDS * 6)
+    options = {"num_predict": tokens, "num_ctx": num_ctx}
+    results = {}
+    for name in ("naive", "memory"):
+        server = serve(0, tokens, delay, prefill)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        client = OllamaClient(f"http://127.0.0.1:{server.server_address[1]}")
+        history = []
+        memory = ChatMemory(budget_tokens=num_ctx - tokens)
+        rows = []
+        for turn in range(turns):
+            user = f"{turn}. soru: {question}"
+            if name == "naive":
+                # What resending chat_history as one prompt would do
+                prompt = "\n".join(f"{sender}: {text}" for sender, text in history + [("Kullanıcı", user)])
+                stream = client.generate_stream(MODEL, prompt, options)
+                ttft, reply = first_token(stream)
+                history += [("Kullanıcı", user), ("AI", reply)]
+            else:
+                stream = client.chat_stream(MODEL, memory.build(user), options)
+                ttft, reply = first_token(stream)
+                memory.add_turn(user, reply, stream.final.get("eval_count"))
+                if memory.needs_compaction():
+                    memory.compact(lambda text: client.generate(MODEL, text, {"num_predict": 60, "num_ctx": num_ctx})["response"])
+            rows.append((ttft, stream.final.get("prompt_eval_count", 0)))
+        results[name] = rows
+        server.shutdown()
+
+    print(f"{'tur':>4} {'tam geçmiş ms':>14} {'değerlendirilen':>16} {'ChatMemory ms':>14} {'değerlendirilen':>16}")
+    for turn in range(turns):
+        naive, memory = results["naive"][turn], results["memory"][turn]
+        print(f"{turn + 1:>4} {naive[0]:>14.0f} {naive[1]:>16} {memory[0]:>14.0f} {memory[1]:>16}")
+    for name in ("naive", "memory"):
+        values = sorted(row[0] for row in results[name])
+        print(f"{name}: median {values[len(values) // 2]:.0f} ms, max {values[-1]:.0f} ms, "
+              f"total prompt tokens evaluated {sum(row[1] for row in results[name])}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ollama API stub for BERKE0S")
+    parser.add_argument("--port", type=int, default=11434, help="port to listen on (default 11434)")
+    parser.add_argument("--tokens", type=int, default=200, help="tokens per response (default 200)")
+    parser.add_argument("--delay", type=float, default=0.02, help="seconds between tokens (default 0.02)")
+    parser.add_argument("--prefill", type=float, default=0.001,
+                        help="seconds per prompt token not in the cache (default 0.001)")
+    parser.add_argument("--check", action="store_true", help="run the streaming client against the stub and exit")
+    parser.add_argument("--conversation", type=int, metavar="TURNS",
+                        help="compare time to first token over TURNS turns: full history vs ChatMemory")
+    parser.add_argument("--num-ctx", type=int, default=2048, help="context length for --conversation (default 2048)")
+    args = parser.parse_args()
+
+    if args.check:
+        return check(args.tokens, args.delay)
+    if args.conversation:
+        return conversation(args.conversation, args.tokens, args.delay, args.prefill, args.num_ctx)
+
+    server = serve(args.port, args.tokens, args.delay, args.prefill)
+    print(f"Ollama stub on http://127.0.0.1:{args.port} ({MODEL})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+BERKE0S structured log query
+
+Reads the hourly JSON-lines segments under ~/.berke0s/logs (or the RAM
+staging copy when staging is active) using their sidecar indexes, so only
+segments overlapping the time range are opened.
+
+    python3 scripts/query_logs.py --since 2h --component Display --level warning
+    python3 scripts/query_logs.py --since 2026-10-19T08:00 --until 2026-10-19T09:00 --grep xrandr
+    python3 scripts/query_logs.py --since 1d --level error --json | jq .m
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from core.log_store import StructuredLogStore, default_log_dir, format_record
+
+UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_time(value):
+    """Relative ("90m", "2h", "1d") or ISO 8601 local time to a timestamp"""
+    if value is None:
+        return None
+    match = re.fullmatch(r"(\d+(?:\.\d+)?)([smhd])", value.strip())
+    if match:
+        return time.time() - float(match.group(1)) * UNITS[match.group(2)]
+    return datetime.datetime.fromisoformat(value).timestamp()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query BERKE0S structured logs")
+    parser.add_argument("--since", default="1h", help="start: 30m, 2h, 1d or ISO time (default 1h)")
+    parser.add_argument("--until", help="end: relative or ISO time (default now)")
+    parser.add_argument("--component", action="append", help="logger name, children included (repeatable)")
+    parser.add_argument("--level", help="minimum level (debug, info, warning, error, critical)")
+    parser.add_argument("--grep", help="case-insensitive text in the message")
+    parser.add_argument("--limit", type=int, default=1000, help="maximum records (default 1000)")
+    parser.add_argument("--newest-first", action="store_true", help="latest records first")
+    parser.add_argument("--json", action="store_true", help="print raw JSON records")
+    parser.add_argument("--stats", action="store_true", help="print store size and exit")
+    parser.add_argument("--dir", default=default_log_dir(), help="structured log directory")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.dir):
+        print(f"No structured logs in {args.dir}", file=sys.stderr)
+        return 1
+
+    store = StructuredLogStore(args.dir)
+    if args.stats:
+        print(json.dumps(store.stats(), indent=2))
+        return 0
+
+    start = time.perf_counter()
+    records = store.query(start=parse_time(args.since), end=parse_time(args.until),
+                          components=args.component, level=args.level, text=args.grep,
+                          limit=args.limit, newest_first=args.newest_first)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    for entry in records:
+        print(json.dumps(entry, ensure_ascii=False) if args.json else format_record(entry))
+    print(f"{len(records)} records in {elapsed:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
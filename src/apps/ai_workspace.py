@@ -4,7 +4,6 @@ Ollama entegrasyonu ile yerel AI asistan ve geliştirme ortamı
 """
 
 import os
-import sys
 import json
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
@@ -14,16 +13,32 @@ import requests
 import time
 import re
 
+from core.dispatcher import UIDispatcher
+from core.ollama_client import OllamaClient, DuplicateRequest, OllamaError, chunk_text
+from core.conversation import ChatMemory
+from core.python_kernel import PythonKernel
+
 class AIWorkspace:
     """BERKE0S AI Workspace - Yerel AI Asistan"""
     
     def __init__(self, berke_os):
         self.berke_os = berke_os
         self.window = None
+        self.ui = None
         self.ollama_running = False
         self.current_model = None
         self.chat_history = []
         self.available_models = []
+        
+        # Streaming state; tokens are buffered by the worker and drawn in batches
+        self.generation = None
+        self.stream_lock = threading.Lock()
+        self.stream_buffer = []
+        self.stream_flush_pending = False
+        self.stream_last_flush = 0.0
+        self.stream_tokens = 0
+        self.stream_first_token = None
+        self.stream_started = 0.0
         self.workspace_dir = os.path.join(os.path.expanduser("~/.berke0s"), "AI_Workspace")
         
         # AI settings
@@ -34,9 +49,35 @@ class AIWorkspace:
             "max_tokens": 2048,
             "auto_save_chat": True,
             "code_highlighting": True,
-            "voice_enabled": False
+            "voice_enabled": False,
+            # Seconds without a new token before giving up on a generation
+            "stream_timeout": 120,
+            # Chat display redraws per second while streaming
+            "stream_fps": 30,
+            # Model context length; the history gets what max_tokens leaves, less room for the next message
+            "context_tokens": 4096,
+            # How long Ollama keeps the model and its prompt cache loaded
+            "keep_alive": "30m",
+            # Limits of one code run
+            "run_timeout": 30,
+            "run_cpu_seconds": 20,
+            "run_memory_mb": 512,
+            # Characters of run output shown in the chat
+            "run_output_limit": 200000
         }
         
+        # Conversation sent with each message, older turns summarised
+        self.memory = ChatMemory()
+        
+        # Python runs go to one warm kernel process instead of a new interpreter each
+        self.kernel = PythonKernel(os.path.join(self.workspace_dir, "runs"))
+        self.code_running = False
+        self.run_lock = threading.Lock()
+        self.run_buffer = []
+        self.run_flush_pending = False
+        self.run_output_size = 0
+        self.output_parts = []
+        
         self.setup_workspace()
     
     def setup_workspace(self):
@@ -46,7 +87,8 @@ class AIWorkspace:
             os.path.join(self.workspace_dir, "chats"),
             os.path.join(self.workspace_dir, "projects"),
             os.path.join(self.workspace_dir, "models"),
-            os.path.join(self.workspace_dir, "exports")
+            os.path.join(self.workspace_dir, "exports"),
+            os.path.join(self.workspace_dir, "runs")
         ]
         
         for directory in directories:
@@ -59,10 +101,18 @@ class AIWorkspace:
             self.window.title("🤖 BERKE0S AI Workspace")
             self.window.geometry("1200x800")
             self.window.configure(bg='#1a1a1a')
+            # The title-bar close button also stops the stream and the kernel
+            self.window.protocol("WM_DELETE_WINDOW", self.close)
+            
+            # Background threads update widgets only through this
+            self.ui = UIDispatcher.for_widget(self.window)
             
             self.create_ai_interface()
             self.check_ollama_status()
             
+            # Warm the kernel now so the first run does not wait for it
+            threading.Thread(target=self.start_kernel, daemon=True, name="Kernel Start").start()
+            
         except Exception as e:
             print(f"AI Workspace hatası: {e}")
     
@@ -94,7 +144,7 @@ class AIWorkspace:
         file_menu.add_separator()
         file_menu.add_command(label="Dışa Aktar", command=self.export_chat)
         file_menu.add_separator()
-        file_menu.add_command(label="Çıkış", command=self.window.destroy)
+        file_menu.add_command(label="Çıkış", command=self.close)
         
         # Models menu
         models_menu = tk.Menu(menubar, tearoff=0)
@@ -312,8 +362,9 @@ class AIWorkspace:
         code_controls = tk.Frame(code_frame, bg='#2a2a2a')
         code_controls.pack(fill=tk.X, padx=5, pady=5)
         
-        tk.Button(code_controls, text="▶️ Çalıştır", command=self.run_code,
-                 bg='#4CAF50', fg='white', relief=tk.FLAT, width=8).pack(side=tk.LEFT, padx=2)
+        self.run_button = tk.Button(code_controls, text="▶️ Çalıştır", command=self.run_code,
+                                   bg='#4CAF50', fg='white', relief=tk.FLAT, width=8)
+        self.run_button.pack(side=tk.LEFT, padx=2)
         
         tk.Button(code_controls, text="💾 Kaydet", command=self.save_code,
                  bg='#2196F3', fg='white', relief=tk.FLAT, width=8).pack(side=tk.LEFT, padx=2)
@@ -321,6 +372,15 @@ class AIWorkspace:
         tk.Button(code_controls, text="📋 Kopyala", command=self.copy_code,
                  bg='#FF9800', fg='white', relief=tk.FLAT, width=8).pack(side=tk.LEFT, padx=2)
         
+        tk.Button(code_controls, text="🔄 Sıfırla", command=self.reset_kernel,
+                 bg='#9C27B0', fg='white', relief=tk.FLAT, width=8).pack(side=tk.LEFT, padx=2)
+        
+        # Kept state: variables and imports of one run are there for the next
+        self.keep_state_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(code_controls, text="Durumu koru", variable=self.keep_state_var,
+                      bg='#2a2a2a', fg='white', selectcolor='#1a1a1a',
+                      activebackground='#2a2a2a').pack(side=tk.LEFT, padx=5)
+        
         # Project explorer
         project_frame = tk.LabelFrame(parent, text="Proje Gezgini",
                                      bg='#2a2a2a', fg='white',
@@ -348,41 +408,45 @@ class AIWorkspace:
                                    font=('Arial', 9))
         self.token_label.pack(side=tk.RIGHT, padx=10, pady=3)
     
-    def check_ollama_status(self):
+    @property
+    def client(self):
+        """Ayarlardaki host için paylaşılan Ollama istemcisi"""
+        return OllamaClient.for_host(self.settings["ollama_host"])
+    
+    def check_ollama_status(self, force=False):
         """Ollama durumunu kontrol et"""
-        def check():
-            try:
-                response = requests.get(f"{self.settings['ollama_host']}/api/tags", timeout=5)
-                if response.status_code == 200:
-                    self.ollama_running = True
-                    self.status_indicator.config(fg='green')
-                    self.status_text.config(text="Ollama Bağlı")
-                    
-                    # Load available models
-                    models_data = response.json()
-                    self.available_models = [model['name'] for model in models_data.get('models', [])]
-                    self.model_combo['values'] = self.available_models
-                    
-                    if self.available_models and not self.current_model:
-                        self.current_model = self.available_models[0]
-                        self.model_var.set(self.current_model)
-                else:
-                    self.ollama_running = False
-                    self.status_indicator.config(fg='red')
-                    self.status_text.config(text="Ollama Bağlantı Hatası")
-                    
-            except requests.exceptions.RequestException:
-                self.ollama_running = False
-                self.status_indicator.config(fg='red')
-                self.status_text.config(text="Ollama Çalışmıyor")
-        
-        threading.Thread(target=check, daemon=True).start()
+        threading.Thread(target=self.update_ollama_status, args=(force,), daemon=True).start()
+    
+    def update_ollama_status(self, force=False):
+        """Model listesini al ve durumu güncelle (arka plan thread'i)"""
+        try:
+            # Served from the cache when fresh; force asks the server
+            models = self.client.list_models(force=force)
+            self.ollama_running = True
+            self.ui.post_config(self.status_indicator, fg='green')
+            self.ui.post_config(self.status_text, text="Ollama Bağlı")
+            
+            # Load available models
+            self.available_models = [model['name'] for model in models]
+            self.ui.post_config(self.model_combo, values=self.available_models)
+            
+            if self.available_models and not self.current_model:
+                self.current_model = self.available_models[0]
+                self.ui.post_set(self.model_var, self.current_model)
+        except OllamaError:
+            self.ollama_running = False
+            self.ui.post_config(self.status_indicator, fg='red')
+            self.ui.post_config(self.status_text, text="Ollama Bağlantı Hatası")
+        except requests.exceptions.RequestException:
+            self.ollama_running = False
+            self.ui.post_config(self.status_indicator, fg='red')
+            self.ui.post_config(self.status_text, text="Ollama Çalışmıyor")
     
     def start_ollama(self):
         """Ollama'yı başlat"""
         def start():
             try:
-                self.status_label.config(text="Ollama başlatılıyor...")
+                self.ui.post_config(self.status_label, text="Ollama başlatılıyor...")
                 
                 # Try to start Ollama
                 process = subprocess.Popen(['ollama', 'serve'], 
@@ -392,19 +456,19 @@ class AIWorkspace:
                 # Wait a moment for startup
                 time.sleep(3)
                 
-                # Check if it's running
-                self.check_ollama_status()
+                # Check if it's running; on this thread, so ollama_running is current below
+                self.update_ollama_status(force=True)
                 
                 if self.ollama_running:
-                    self.status_label.config(text="Ollama başarıyla başlatıldı")
+                    self.ui.post_config(self.status_label, text="Ollama başarıyla başlatıldı")
                 else:
-                    self.status_label.config(text="Ollama başlatılamadı")
+                    self.ui.post_config(self.status_label, text="Ollama başlatılamadı")
                     
             except FileNotFoundError:
-                self.status_label.config(text="Ollama bulunamadı - Kurulum gerekli")
-                self.install_ollama()
+                self.ui.post_config(self.status_label, text="Ollama bulunamadı - Kurulum gerekli")
+                self.ui.post(self.install_ollama)
             except Exception as e:
-                self.status_label.config(text=f"Hata: {str(e)}")
+                self.ui.post_config(self.status_label, text=f"Hata: {str(e)}")
         
         threading.Thread(target=start, daemon=True).start()
     
@@ -416,28 +480,40 @@ class AIWorkspace:
         if result:
             def install():
                 try:
-                    self.status_label.config(text="Ollama kuruluyor...")
+                    self.ui.post_config(self.status_label, text="Ollama kuruluyor...")
                     
                     # Download and install Ollama
                     subprocess.run(['curl', '-fsSL', 'https://ollama.ai/install.sh'], 
                                  capture_output=True, check=True)
                     
-                    self.status_label.config(text="Ollama kurulumu tamamlandı")
+                    self.ui.post_config(self.status_label, text="Ollama kurulumu tamamlandı")
                     
                     # Try to start after installation
                     self.start_ollama()
                     
                 except Exception as e:
-                    self.status_label.config(text=f"Kurulum hatası: {str(e)}")
+                    self.ui.post_config(self.status_label, text=f"Kurulum hatası: {str(e)}")
             
             threading.Thread(target=install, daemon=True).start()
     
     def send_message(self):
         """Mesaj gönder"""
+        # The send button doubles as stop while a response is streaming;
+        # the second click of a double-click is not taken as stop
+        if self.generation:
+            if time.monotonic() - self.stream_started > 0.5:
+                self.cancel_generation()
+            return
+        
         message = self.input_text.get('1.0', tk.END).strip()
         if not message:
             return
         
+        # Run output and a reply would interleave in the chat
+        if self.code_running:
+            self.status_label.config(text="Kod çalışırken mesaj gönderilemez")
+            return
+        
         if not self.ollama_running:
             messagebox.showwarning("Uyarı", "Ollama çalışmıyor. Lütfen önce Ollama'yı başlatın.")
             return
@@ -464,8 +540,21 @@ class AIWorkspace:
         
         # Add sender and message
         self.chat_display.insert(tk.END, f"\n[{timestamp}] {sender}:\n", tag)
+        self.insert_message_body(message)
+        
+        self.chat_display.insert(tk.END, "\n")
+        self.chat_display.config(state='disabled')
+        self.chat_display.see(tk.END)
         
-        # Process message for code blocks
+        # Add to history
+        self.chat_history.append({
+            "sender": sender,
+            "message": message,
+            "timestamp": time.time()
+        })
+    
+    def insert_message_body(self, message):
+        """Mesaj metnini ekle; ``` blokları kod olarak işaretlenir"""
         if "```" in message:
             parts = message.split("```")
             for i, part in enumerate(parts):
@@ -477,68 +566,176 @@ class AIWorkspace:
                     self.chat_display.insert(tk.END, part, "code")
         else:
             self.chat_display.insert(tk.END, message)
-        
-        self.chat_display.insert(tk.END, "\n")
-        self.chat_display.config(state='disabled')
-        self.chat_display.see(tk.END)
-        
-        # Add to history
-        self.chat_history.append({
-            "sender": sender,
-            "message": message,
-            "timestamp": time.time()
-        })
+    
+    def memory_budget(self):
+        """History tokens: the context minus the reply and room for the next message"""
+        return max(1024, self.settings["context_tokens"] - self.settings["max_tokens"] - 512)
     
     def send_to_ai(self, message):
-        """AI'ya mesaj gönder"""
+        """AI'ya mesaj gönder; yanıt token token akar"""
+        client = self.client
+        model = self.current_model
+        context_tokens = self.settings["context_tokens"]
+        self.memory.budget_tokens = self.memory_budget()
+        stream = client.chat_stream(
+            model, self.memory.build(message),
+            options={
+                "temperature": self.settings["temperature"],
+                "num_predict": self.settings["max_tokens"],
+                "num_ctx": context_tokens
+            },
+            read_timeout=self.settings["stream_timeout"],
+            keep_alive=self.settings["keep_alive"]
+        )
+        self.begin_stream(stream)
+        
+        def summarize(prompt):
+            result = client.generate(model, prompt, {"num_predict": 400, "num_ctx": context_tokens},
+                                     timeout=self.settings["stream_timeout"])
+            return result.get("response", "")
+        
         def ai_request():
+            parts = []
+            error = None
             try:
-                self.send_button.config(state='disabled', text="🤔 Düşünüyor...")
-                self.status_label.config(text="AI yanıt oluşturuyor...")
-                
-                # Prepare request
-                data = {
-                    "model": self.current_model,
-                    "prompt": message,
-                    "stream": False,
-                    "options": {
-                        "temperature": self.settings["temperature"],
-                        "num_predict": self.settings["max_tokens"]
-                    }
-                }
-                
-                # Send request to Ollama
-                response = requests.post(
-                    f"{self.settings['ollama_host']}/api/generate",
-                    json=data,
-                    timeout=60
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    ai_response = result.get('response', 'Yanıt alınamadı')
-                    
-                    # Add AI response to chat
-                    self.add_message("AI", ai_response, "ai")
-                    
-                    # Extract code if present
-                    self.extract_code_from_response(ai_response)
-                    
-                    self.status_label.config(text="Yanıt alındı")
-                else:
-                    self.add_message("Sistem", f"Hata: {response.status_code}", "error")
-                    self.status_label.config(text="AI yanıt hatası")
-                
+                for chunk in stream:
+                    token = chunk_text(chunk)
+                    if not token:
+                        continue
+                    parts.append(token)
+                    with self.stream_lock:
+                        self.stream_buffer.append(token)
+                        self.stream_tokens += 1
+                        if self.stream_first_token is None:
+                            self.stream_first_token = time.monotonic()
+                        post = not self.stream_flush_pending
+                        self.stream_flush_pending = True
+                    if post:
+                        self.ui.post(self.flush_stream)
+            except DuplicateRequest:
+                error = "Aynı mesaj zaten yanıtlanıyor"
             except requests.exceptions.Timeout:
-                self.add_message("Sistem", "Zaman aşımı - AI yanıt veremedi", "error")
-                self.status_label.config(text="Zaman aşımı")
+                error = "Zaman aşımı - AI yanıt vermeyi bıraktı"
             except Exception as e:
-                self.add_message("Sistem", f"Hata: {str(e)}", "error")
-                self.status_label.config(text="Bağlantı hatası")
-            finally:
-                self.send_button.config(state='normal', text="📤 Gönder")
+                error = f"Hata: {str(e)}"
+            
+            response = "".join(parts)
+            if response:
+                self.memory.add_turn(message, response, stream.final.get("eval_count"))
+            self.ui.post(self.finish_stream, stream, response, error)
+            
+            # Fold old turns into the summary now rather than when the next message waits on it
+            if self.memory.needs_compaction():
+                folded = self.memory.compact(summarize)
+                if folded:
+                    self.ui.post_config(self.status_label, text=f"{folded} eski mesaj özetlendi")
         
-        threading.Thread(target=ai_request, daemon=True).start()
+        threading.Thread(target=ai_request, daemon=True, name="AI Stream").start()
+    
+    def begin_stream(self, stream):
+        """Yanıt başlığını ekle ve akış durumunu sıfırla (Tk thread'i)"""
+        self.generation = stream
+        with self.stream_lock:
+            self.stream_buffer = []
+            self.stream_flush_pending = False
+            self.stream_tokens = 0
+            self.stream_first_token = None
+        self.stream_started = time.monotonic()
+        
+        self.chat_display.config(state='normal')
+        self.chat_display.insert(tk.END, f"\n[{time.strftime('%H:%M')}] AI:\n", "ai")
+        # Streamed text lands after this mark; it is re-rendered with code tags at the end
+        self.chat_display.mark_set("stream_start", "end-1c")
+        self.chat_display.mark_gravity("stream_start", tk.LEFT)
+        self.chat_display.config(state='disabled')
+        self.chat_display.see(tk.END)
+        
+        self.send_button.config(text="⏹️ Durdur", bg='#f44336')
+        self.status_label.config(text="AI yanıt oluşturuyor...")
+        self.token_label.config(text="Tokens: 0")
+    
+    def flush_stream(self):
+        """Biriken token'ları tek seferde ekle; saniyede en fazla stream_fps kez"""
+        if not self.chat_display.winfo_exists():
+            return
+        
+        interval = 1.0 / self.settings["stream_fps"]
+        wait = self.stream_last_flush + interval - time.monotonic()
+        if wait > 0:
+            self.chat_display.after(int(wait * 1000) + 1, self.flush_stream)
+            return
+        
+        with self.stream_lock:
+            text = "".join(self.stream_buffer)
+            self.stream_buffer = []
+            self.stream_flush_pending = False
+            tokens = self.stream_tokens
+            first = self.stream_first_token
+        self.stream_last_flush = time.monotonic()
+        if not text or self.generation is None:
+            return
+        
+        at_bottom = self.chat_display.yview()[1] >= 0.999
+        self.chat_display.config(state='normal')
+        self.chat_display.insert(tk.END, text)
+        self.chat_display.config(state='disabled')
+        if at_bottom:
+            self.chat_display.see(tk.END)
+        
+        elapsed = time.monotonic() - first if first else 0
+        rate = f" ({tokens / elapsed:.1f}/sn)" if elapsed > 0.5 else ""
+        self.token_label.config(text=f"Tokens: {tokens}{rate}")
+    
+    def finish_stream(self, stream, response, error):
+        """Akış bitti: metni kod etiketleriyle yeniden çiz, geçmişe ekle"""
+        if stream is not self.generation or not self.chat_display.winfo_exists():
+            return
+        self.generation = None
+        
+        cancelled = stream.cancelled.is_set()
+        self.chat_display.config(state='normal')
+        self.chat_display.delete("stream_start", tk.END)
+        self.insert_message_body(response)
+        if cancelled:
+            self.chat_display.insert(tk.END, " [durduruldu]", "error")
+        self.chat_display.insert(tk.END, "\n")
+        if error:
+            self.chat_display.insert(tk.END, f"{error}\n", "error")
+        self.chat_display.config(state='disabled')
+        self.chat_display.see(tk.END)
+        
+        if response:
+            self.chat_history.append({
+                "sender": "AI",
+                "message": response,
+                "timestamp": time.time()
+            })
+            self.extract_code_from_response(response)
+        
+        final = stream.final
+        if final.get("eval_count") and final.get("eval_duration"):
+            rate = final["eval_count"] / (final["eval_duration"] / 1e9)
+            self.token_label.config(text=f"Tokens: {final['eval_count']} ({rate:.1f}/sn)")
+        else:
+            self.token_label.config(text=f"Tokens: {self.stream_tokens}")
+        
+        if error:
+            self.status_label.config(text="AI yanıt hatası")
+        elif cancelled:
+            self.status_label.config(text="Yanıt durduruldu")
+        else:
+            first = self.stream_first_token
+            ttft = f"ilk token {(first - self.stream_started) * 1000:.0f} ms, " if first else ""
+            self.status_label.config(
+                text=f"Yanıt alındı ({ttft}toplam {time.monotonic() - self.stream_started:.1f} sn, "
+                     f"bellek {self.memory.total_tokens()}/{self.memory.budget_tokens} token)")
+        self.send_button.config(text="📤 Gönder", bg='#4CAF50')
+    
+    def cancel_generation(self):
+        """Süren yanıtı durdur"""
+        if self.generation:
+            self.status_label.config(text="Durduruluyor...")
+            self.generation.cancel()
     
     def extract_code_from_response(self, response):
         """AI yanıtından kodu çıkar ve editöre ekle"""
@@ -557,7 +754,7 @@ class AIWorkspace:
     
     def refresh_models(self):
         """Model listesini yenile"""
-        self.check_ollama_status()
+        self.check_ollama_status(force=True)
     
     def new_chat(self):
         """Yeni sohbet başlat"""
@@ -575,6 +772,7 @@ class AIWorkspace:
         self.chat_display.delete('1.0', tk.END)
         self.chat_display.config(state='disabled')
         self.chat_history.clear()
+        self.memory.clear()
     
     def save_chat(self):
         """Sohbeti kaydet"""
@@ -617,12 +815,22 @@ class AIWorkspace:
                     chat_data = json.load(f)
                 
                 self.clear_chat()
-                self.chat_history = chat_data.get('history', [])
                 
-                # Restore chat display
-                for item in self.chat_history:
+                # Restore chat display; add_message rebuilds chat_history
+                user = None
+                for item in chat_data.get('history', []):
                     tag = "user" if item['sender'] == "Kullanıcı" else "ai"
                     self.add_message(item['sender'], item['message'], tag)
+                    if tag == "user":
+                        user = item['message']
+                    elif item['sender'] == "AI" and user is not None:
+                        # Run output ("Çıktı") and system lines were never model replies
+                        self.memory.add_turn(user, item['message'])
+                        user = None
+                self.memory.budget_tokens = self.memory_budget()
+                if self.memory.needs_compaction():
+                    # Oldest turns of a long saved chat are kept as a clipped transcript, without a model call
+                    self.memory.compact()
                 
                 messagebox.showinfo("Başarılı", "Sohbet yüklendi!")
                 
@@ -631,6 +839,15 @@ class AIWorkspace:
     
     def run_code(self):
         """Kod editöründeki kodu çalıştır"""
+        # The run button doubles as stop while code runs
+        if self.code_running:
+            self.status_label.config(text="Durduruluyor...")
+            self.kernel.cancel()
+            return
+        if self.generation:
+            self.status_label.config(text="AI yanıtı bitince çalıştırın")
+            return
+        
         code = self.code_editor.get('1.0', tk.END).strip()
         if not code:
             messagebox.showinfo("Bilgi", "Çalıştırılacak kod yok.")
@@ -645,34 +862,116 @@ class AIWorkspace:
             # Default to Python
             self.run_python_code(code)
     
+    def start_kernel(self):
+        """Python çekirdeğini başlat (arka plan thread'i)"""
+        try:
+            self.kernel.start()
+        except Exception as e:
+            print(f"Python çekirdeği başlatılamadı: {e}")
+    
+    def reset_kernel(self):
+        """Korunan durumu sil ve çekirdeği yeniden başlat"""
+        if self.code_running:
+            self.kernel.cancel()
+        
+        def reset():
+            # Waits for the cancelled run to finish before the kernel is replaced
+            self.kernel.restart()
+            self.ui.post_config(self.status_label, text="Python çekirdeği sıfırlandı")
+        
+        threading.Thread(target=reset, daemon=True, name="Kernel Reset").start()
+    
     def run_python_code(self, code):
-        """Python kodunu çalıştır"""
+        """Python kodunu çalıştır; çıktı yazıldıkça sohbete akar"""
+        self.code_running = True
+        with self.run_lock:
+            self.run_buffer = []
+            self.run_flush_pending = False
+        self.run_output_size = 0
+        self.output_parts = []
+        
+        self.chat_display.config(state='normal')
+        self.chat_display.insert(tk.END, f"\n[{time.strftime('%H:%M')}] Çıktı:\n", "ai")
+        self.chat_display.config(state='disabled')
+        self.chat_display.see(tk.END)
+        self.run_button.config(text="⏹️ Durdur", bg='#f44336')
+        self.status_label.config(text="Kod çalışıyor...")
+        keep_state = self.keep_state_var.get()
+        
+        def on_output(stream, text):
+            with self.run_lock:
+                self.run_buffer.append((stream, text))
+                post = not self.run_flush_pending
+                self.run_flush_pending = True
+            if post:
+                self.ui.post(self.flush_run_output)
+        
         def run():
-            try:
-                # Create temporary file
-                temp_file = os.path.join(self.workspace_dir, "temp_code.py")
-                with open(temp_file, 'w') as f:
-                    f.write(code)
-                
-                # Run the code
-                result = subprocess.run([sys.executable, temp_file], 
-                                      capture_output=True, text=True, timeout=30)
-                
-                # Show result
-                if result.stdout:
-                    self.add_message("Çıktı", result.stdout, "ai")
-                if result.stderr:
-                    self.add_message("Hata", result.stderr, "error")
-                
-                # Clean up
-                os.remove(temp_file)
-                
-            except subprocess.TimeoutExpired:
-                self.add_message("Sistem", "Kod çalıştırma zaman aşımına uğradı", "error")
-            except Exception as e:
-                self.add_message("Sistem", f"Kod çalıştırma hatası: {str(e)}", "error")
+            result = self.kernel.run(
+                code, on_output, keep_state=keep_state,
+                timeout=self.settings["run_timeout"],
+                cpu_seconds=self.settings["run_cpu_seconds"],
+                memory_mb=self.settings["run_memory_mb"]
+            )
+            self.ui.post(self.flush_run_output)
+            self.ui.post(self.finish_run, result)
+        
+        threading.Thread(target=run, daemon=True, name="Code Run").start()
+    
+    def flush_run_output(self):
+        """Biriken çıktıyı tek seferde ekle; sınırdan sonrası gösterilmez"""
+        if not self.chat_display.winfo_exists():
+            return
+        with self.run_lock:
+            parts = self.run_buffer
+            self.run_buffer = []
+            self.run_flush_pending = False
+        
+        # Consecutive pieces of one stream go in as one insert
+        merged = []
+        for stream, text in parts:
+            if merged and merged[-1][0] == stream:
+                merged[-1][1].append(text)
+            else:
+                merged.append((stream, [text]))
+        parts = [(stream, "".join(texts)) for stream, texts in merged]
+        
+        limit = self.settings["run_output_limit"]
+        at_bottom = self.chat_display.yview()[1] >= 0.999
+        self.chat_display.config(state='normal')
+        for stream, text in parts:
+            if self.run_output_size >= limit:
+                break
+            text = text[:limit - self.run_output_size]
+            self.run_output_size += len(text)
+            self.output_parts.append(text)
+            self.chat_display.insert(tk.END, text, "error" if stream == "stderr" else ())
+            if self.run_output_size >= limit:
+                self.chat_display.insert(tk.END, "\n[çıktı kısaltıldı]", "error")
+        self.chat_display.config(state='disabled')
+        if at_bottom:
+            self.chat_display.see(tk.END)
+    
+    def finish_run(self, result):
+        """Çalıştırma bitti: özeti göster, geçmişe ekle"""
+        self.code_running = False
+        if not self.chat_display.winfo_exists():
+            return
         
-        threading.Thread(target=run, daemon=True).start()
+        self.chat_display.config(state='normal')
+        if self.output_parts and not self.output_parts[-1].endswith("\n"):
+            self.chat_display.insert(tk.END, "\n")
+        self.chat_display.insert(tk.END, f"[{result.describe()}]\n", "ai" if result.status == "ok" else "error")
+        self.chat_display.config(state='disabled')
+        self.chat_display.see(tk.END)
+        
+        self.chat_history.append({
+            "sender": "Çıktı",
+            "message": "".join(self.output_parts),
+            "timestamp": time.time()
+        })
+        self.run_button.config(text="▶️ Çalıştır", bg='#4CAF50')
+        self.status_label.config(text=f"Kod {result.describe()}")
     
     def run_javascript_code(self, code):
         """JavaScript kodunu çalıştır"""
@@ -849,5 +1148,9 @@ class AIWorkspace:
     
     def close(self):
         """AI Workspace'i kapat"""
+        if self.generation:
+            self.generation.cancel()
+            self.generation = None
+        threading.Thread(target=self.kernel.shutdown, daemon=True, name="Kernel Stop").start()
         if self.window:
             self.window.destroy()
\ No newline at end of file
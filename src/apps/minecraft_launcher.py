@@ -16,12 +16,15 @@ import zipfile
 import shutil
 import time
 
+from core.dispatcher import UIDispatcher
+
 class BerkeLauncher:
     """BERKE0S Minecraft Launcher"""
     
     def __init__(self, berke_os):
         self.berke_os = berke_os
         self.window = None
+        self.ui = None
         self.minecraft_dir = os.path.join(os.path.expanduser("~/.berke0s"), "Minecraft")
         self.versions_dir = os.path.join(self.minecraft_dir, "versions")
         self.mods_dir = os.path.join(self.minecraft_dir, "mods")
@@ -99,6 +102,9 @@ class BerkeLauncher:
             self.window.geometry("900x600")
             self.window.configure(bg='#2b2b2b')
             
+            # Background threads update widgets only through this
+            self.ui = UIDispatcher.for_widget(self.window)
+            
             self.create_launcher_interface()
             self.load_versions()
             
@@ -532,12 +538,12 @@ Minecraft oynamaya başlamak için sol panelden bir profil seçin ve "Oyunu Baş
         # Simulate download
         def download_thread():
             for i in range(101):
-                self.progress_var.set(i)
-                self.progress_label.config(text=f"İndiriliyor... %{i}")
+                self.ui.post_set(self.progress_var, i)
+                self.ui.post_config(self.progress_label, text=f"İndiriliyor... %{i}")
                 time.sleep(0.05)
             
-            self.hide_progress()
-            messagebox.showinfo("Başarılı", f"Minecraft {version} başarıyla indirildi!")
+            self.ui.post(self.hide_progress)
+            self.ui.post(messagebox.showinfo, "Başarılı", f"Minecraft {version} başarıyla indirildi!")
         
         threading.Thread(target=download_thread, daemon=True).start()
     
@@ -582,11 +588,11 @@ Minecraft oynamaya başlamak için sol panelden bir profil seçin ve "Oyunu Baş
                 time.sleep(2)  # Simulate launch time
                 
                 # In real implementation, this would launch Minecraft
-                messagebox.showinfo("Oyun Başlatıldı", 
-                                   f"Minecraft {version} başlatıldı!\n\n"
-                                   "Gerçek uygulamada, burada Minecraft oyunu açılacaktır.")
+                self.ui.post(messagebox.showinfo, "Oyun Başlatıldı", 
+                             f"Minecraft {version} başlatıldı!\n\n"
+                             "Gerçek uygulamada, burada Minecraft oyunu açılacaktır.")
                 
-                self.launch_button.config(text="🚀 Oyunu Başlat", state='normal')
+                self.ui.post_config(self.launch_button, text="🚀 Oyunu Başlat", state='normal')
             
             threading.Thread(target=launch_thread, daemon=True).start()
             
@@ -0,0 +1,147 @@
+"""
+Lazy application registry for BERKE0S
+
+Applications are registered by module path and class name; the module is
+imported the first time the app is launched (or by the idle warm-up), so
+startup does not pay for apps that are never opened.
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+import importlib
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class AppRegistry:
+    """Maps app names to ``module:Class`` entry points and imports them on demand"""
+
+    def __init__(self, usage_file: Optional[str] = None):
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.lock = threading.RLock()
+        self.usage_file = usage_file
+        self.usage: Dict[str, int] = self._load_usage()
+        self.warmup_thread: Optional[threading.Thread] = None
+
+    def register(self, name: str, entry_point: str) -> None:
+        """Register an app as ``"package.module:ClassName"`` without importing it"""
+        module_path, _, class_name = entry_point.partition(":")
+        with self.lock:
+            self.entries[name] = {
+                "module": module_path,
+                "class_name": class_name,
+                "class": None,
+                "load_time": None,
+                "error": None
+            }
+        logger.debug(f"Application registered: {name} -> {entry_point}")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def names(self) -> List[str]:
+        return list(self.entries)
+
+    def is_loaded(self, name: str) -> bool:
+        entry = self.entries.get(name)
+        return bool(entry and entry["class"] is not None)
+
+    def get(self, name: str) -> Any:
+        """Return the app class, importing its module on first use"""
+        entry = self.entries[name]
+        if entry["class"] is not None:
+            return entry["class"]
+
+        with self.lock:
+            if entry["class"] is None:
+                start = time.perf_counter()
+                try:
+                    module = importlib.import_module(entry["module"])
+                    entry["class"] = getattr(module, entry["class_name"])
+                    entry["error"] = None
+                except Exception as e:
+                    entry["error"] = str(e)
+                    raise
+                finally:
+                    entry["load_time"] = time.perf_counter() - start
+                logger.info(f"Application loaded: {name} ({entry['load_time'] * 1000:.1f} ms)")
+        return entry["class"]
+
+    def load_all(self) -> None:
+        """Import every registered app (eager behaviour, used for comparison)"""
+        for name in self.names():
+            try:
+                self.get(name)
+            except Exception as e:
+                logger.error(f"Application load error {name}: {e}")
+
+    def record_launch(self, name: str) -> None:
+        """Count a launch; the counts choose what the warm-up preloads"""
+        self.usage[name] = self.usage.get(name, 0) + 1
+        self._save_usage()
+
+    def most_used(self, limit: int = 3) -> List[str]:
+        ranked = sorted((name for name in self.usage if name in self.entries),
+                        key=lambda name: self.usage[name], reverse=True)
+        return ranked[:limit]
+
+    def warm_up(self, names: Optional[List[str]] = None, delay: float = 10.0,
+                should_continue: Callable[[], bool] = lambda: True) -> None:
+        """Preload apps on a background thread once startup has settled"""
+        names = self.most_used() if names is None else names
+        if not names:
+            return
+
+        def worker():
+            time.sleep(delay)
+            for name in names:
+                if not should_continue():
+                    return
+                if self.is_loaded(name):
+                    continue
+                try:
+                    self.get(name)
+                except Exception as e:
+                    logger.warning(f"Application warm-up failed {name}: {e}")
+                # Yield between imports so the UI thread keeps the GIL most of the time
+                time.sleep(0.5)
+
+        self.warmup_thread = threading.Thread(target=worker, daemon=True, name="AppWarmup")
+        self.warmup_thread.start()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Load state and import time per app"""
+        return {
+            name: {
+                "loaded": entry["class"] is not None,
+                "load_time_ms": None if entry["load_time"] is None else entry["load_time"] * 1000,
+                "error": entry["error"],
+                "launches": self.usage.get(name, 0)
+            }
+            for name, entry in self.entries.items()
+        }
+
+    def _load_usage(self) -> Dict[str, int]:
+        if not self.usage_file or not os.path.exists(self.usage_file):
+            return {}
+        try:
+            with open(self.usage_file, 'r') as f:
+                return {str(k): int(v) for k, v in json.load(f).items()}
+        except Exception as e:
+            logger.warning(f"App usage load error: {e}")
+            return {}
+
+    def _save_usage(self) -> None:
+        if not self.usage_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.usage_file), exist_ok=True)
+            temp_path = f"{self.usage_file}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(self.usage, f)
+            os.replace(temp_path, self.usage_file)
+        except Exception as e:
+            logger.warning(f"App usage save error: {e}")
@@ -105,6 +105,22 @@ DEFAULT_CONFIG = {
         "auto_backup": False,
         "backup_interval": 24,
         "24_hour_format": True
+    },
+    "logging": {
+        "level": "INFO",
+        "console_level": "INFO",
+        "max_bytes": 10485760,
+        "backup_count": 5,
+        "repeat_window": 60,
+        "structured": True,
+        "retention_hours": 168,
+        "structured_max_bytes": 67108864,
+        "components": {}
+    },
+    "diagnostics": {
+        "stall_monitor": True,
+        "stall_threshold_ms": 100,
+        "heartbeat_ms": 50
     }
 }
 
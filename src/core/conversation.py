@@ -0,0 +1,127 @@
+"""
+Conversation memory for the BERKE0S AI Workspace
+
+Keeps the turns of a chat as ``/api/chat`` messages within a token
+budget. Ollama reuses the KV cache for the longest unchanged prefix of
+the prompt, so a turn only prefills what is new as long as earlier
+messages stay exactly as they were sent. The history is therefore never
+trimmed one message at a time (that would shift the prefix every turn);
+once it passes the budget the oldest turns are folded into a summary in
+one step, down to half the budget, and the prompt is stable again for
+the turns that follow.
+
+Token counts come from Ollama's ``eval_count`` for replies; other text
+is estimated with a characters-per-token ratio calibrated from those
+replies.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+SUMMARY_PROMPT = (
+    "Aşağıdaki konuşmayı, sonraki yanıtlar için gereken bilgileri (isimler, kararlar, "
+    "kod ve dosya adları, açık sorular) koruyarak en fazla {words} kelimeyle özetle.\n\n"
+    "{text}"
+)
+
+class ChatMemory:
+    """Token-budgeted chat history with a running summary of older turns"""
+
+    def __init__(self, budget_tokens: int = 2048, keep_recent: int = 2, system_prompt: str = ""):
+        self.budget_tokens = budget_tokens
+        self.keep_recent = keep_recent
+        self.system_prompt = system_prompt
+        self.messages: List[Dict[str, Any]] = []
+        self.summary = ""
+        self.chars_per_token = 4.0
+        self.lock = threading.Lock()
+
+    def estimate(self, text: str) -> int:
+        return int(len(text) / self.chars_per_token) + 4
+
+    def calibrate(self, text: str, tokens: int) -> None:
+        """Move the ratio towards what the model's tokenizer reported"""
+        if tokens > 20:
+            self.chars_per_token = 0.8 * self.chars_per_token + 0.2 * (len(text) / tokens)
+
+    def add_turn(self, user: str, reply: str, reply_tokens: Optional[int] = None) -> None:
+        with self.lock:
+            if reply_tokens:
+                self.calibrate(reply, reply_tokens)
+            self.messages.append({"role": "user", "content": user, "tokens": self.estimate(user)})
+            self.messages.append({"role": "assistant", "content": reply,
+                                  "tokens": reply_tokens + 4 if reply_tokens else self.estimate(reply)})
+
+    def clear(self) -> None:
+        with self.lock:
+            self.messages = []
+            self.summary = ""
+
+    def total_tokens(self) -> int:
+        with self.lock:
+            return self.system_tokens() + sum(message["tokens"] for message in self.messages)
+
+    def system_tokens(self) -> int:
+        return self.estimate(self.system_text()) if self.system_text() else 0
+
+    def system_text(self) -> str:
+        parts = [self.system_prompt] if self.system_prompt else []
+        if self.summary:
+            parts.append(f"Önceki konuşmanın özeti:\n{self.summary}")
+        return "\n\n".join(parts)
+
+    def build(self, user: str) -> List[Dict[str, str]]:
+        """Messages for the next request, ending with ``user``"""
+        with self.lock:
+            messages = []
+            system = self.system_text()
+            if system:
+                messages.append({"role": "system", "content": system})
+            messages.extend({"role": message["role"], "content": message["content"]} for message in self.messages)
+        messages.append({"role": "user", "content": user})
+        return messages
+
+    def needs_compaction(self) -> bool:
+        return self.total_tokens() > self.budget_tokens
+
+    def compact(self, summarize: Optional[Callable[[str], str]] = None) -> int:
+        """Fold the oldest turns into the summary; returns the messages folded
+
+        ``summarize(prompt)`` is called without the lock held, so new turns
+        can be added meanwhile. Without it, or if it fails, the old turns
+        are kept as a clipped transcript instead.
+        """
+        with self.lock:
+            target = self.budget_tokens // 2
+            total = self.system_tokens() + sum(message["tokens"] for message in self.messages)
+            count = 0
+            # Whole turns only, and always keep the most recent ones
+            while count < len(self.messages) - self.keep_recent * 2 and total > target:
+                total -= self.messages[count]["tokens"] + self.messages[count + 1]["tokens"]
+                count += 2
+            if count == 0:
+                return 0
+            old = self.messages[:count]
+            previous = self.summary
+
+        transcript = "\n".join(f"{message['role']}: {message['content']}" for message in old)
+        if previous:
+            transcript = f"{previous}\n{transcript}"
+        words = max(50, int(self.budget_tokens / 4 * 0.75))
+        summary = ""
+        if summarize:
+            try:
+                summary = summarize(SUMMARY_PROMPT.format(words=words, text=transcript)).strip()
+            except Exception:
+                summary = ""
+        if not summary:
+            limit = int(self.budget_tokens / 4 * self.chars_per_token)
+            summary = transcript[-limit:]
+
+        with self.lock:
+            if self.messages[:count] != old:
+                # Cleared meanwhile
+                return 0
+            self.summary = summary
+            del self.messages[:count]
+        return count
@@ -7,12 +7,18 @@ import os
 import sys
 import json
 import time
+import bisect
 import hashlib
+import datetime
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import subprocess
 import threading
 
+from core.dispatcher import UIDispatcher
+from core.log_store import StructuredLogStore, default_log_dir, format_record
+from core.log_tail import LEVEL_NAMES, LogTail
+
 class DeveloperMode:
     """Geliştirici Modu Yöneticisi"""
     
@@ -23,6 +29,10 @@ class DeveloperMode:
         self.access_level = 0  # 0: Normal, 1: Developer, 2: System Admin
         self.session_start = None
         self.tools_window = None
+        self.log_tail = None
+        self.log_shown = []
+        self.log_update_pending = False
+        self.log_dir_cache = {}
         
     def authenticate(self):
         """Geliştirici modu kimlik doğrulaması"""
@@ -121,9 +131,7 @@ class DeveloperMode:
         """Geliştirici modunu devre dışı bırak"""
         self.enabled = False
         self.access_level = 0
-        if self.tools_window:
-            self.tools_window.destroy()
-            self.tools_window = None
+        self.close_tools()
     
     def is_enabled(self):
         """Geliştirici modu etkin mi?"""
@@ -172,6 +180,15 @@ class DeveloperMode:
             # System Configuration
             self.create_system_config_tab(notebook)
             
+            # Profiler
+            self.create_profiler_tab(notebook)
+            
+            # UI stalls
+            self.create_stalls_tab(notebook)
+            
+            # Memory inspector
+            self.create_memory_tab(notebook)
+            
         except Exception as e:
             print(f"Geliştirici araçları hatası: {e}")
     
@@ -258,13 +275,44 @@ class DeveloperMode:
         frame = tk.Frame(notebook, bg='#1a1a1a')
         notebook.add(frame, text="⚙️ Süreç Yöneticisi")
         
+        from core.process_monitor import ProcessMonitor
+        
+        # Process objects survive refreshes so CPU % is measured between ticks
+        self.process_monitor = ProcessMonitor()
+        # Rows of the last applied diff; the monitor's own dicts belong to the worker
+        self.process_rows = {}
+        self.process_sampling = False
+        self.process_after = None
+        self.process_sort = ("cpu", True)
+        
+        # Filter and auto-refresh
+        filter_frame = tk.Frame(frame, bg='#1a1a1a')
+        filter_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        tk.Label(filter_frame, text="Filtre:", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.process_filter_var = tk.StringVar()
+        self.process_filter_var.trace_add("write", lambda *args: self.apply_process_filter())
+        tk.Entry(filter_frame, textvariable=self.process_filter_var, width=20).pack(side=tk.LEFT, padx=5)
+        
+        self.process_auto_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(filter_frame, text="Otomatik yenile", variable=self.process_auto_var,
+                      command=self.schedule_process_refresh, bg='#1a1a1a', fg='white',
+                      selectcolor='#0a0a0f').pack(side=tk.LEFT, padx=5)
+        
+        self.process_interval_var = tk.StringVar(value="2")
+        ttk.Combobox(filter_frame, textvariable=self.process_interval_var, state="readonly", width=4,
+                     values=["0.5", "1", "2", "5", "10"]).pack(side=tk.LEFT)
+        tk.Label(filter_frame, text="sn", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        
+        self.process_stats_label = tk.Label(filter_frame, text="", bg='#1a1a1a', fg='#888888')
+        self.process_stats_label.pack(side=tk.RIGHT)
+        
         # Process list
         self.process_tree = ttk.Treeview(frame, columns=('PID', 'CPU', 'Memory', 'Status'), show='tree headings')
-        self.process_tree.heading('#0', text='Süreç Adı')
-        self.process_tree.heading('PID', text='PID')
-        self.process_tree.heading('CPU', text='CPU %')
-        self.process_tree.heading('Memory', text='Bellek %')
-        self.process_tree.heading('Status', text='Durum')
+        self.process_columns = {'#0': ("name", 'Süreç Adı'), 'PID': ("pid", 'PID'), 'CPU': ("cpu", 'CPU %'),
+                                'Memory': ("memory", 'Bellek %'), 'Status': ("status", 'Durum')}
+        for column, (key, title) in self.process_columns.items():
+            self.process_tree.heading(column, text=title, command=lambda key=key: self.sort_processes(key))
         self.process_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Control buttons
@@ -278,6 +326,7 @@ class DeveloperMode:
                  bg='#ff6b6b', fg='white').pack(side=tk.LEFT, padx=5)
         
         # Load processes
+        self.update_process_headings()
         self.refresh_processes()
     
     def create_network_tools_tab(self, notebook):
@@ -311,6 +360,26 @@ class DeveloperMode:
         frame = tk.Frame(notebook, bg='#1a1a1a')
         notebook.add(frame, text="🗄️ Veritabanı")
         
+        from core.stall_monitor import default_db_path
+        
+        self.sql_job = None
+        self.sql_more = False
+        self.sql_fetching = False
+        self.sql_dropped = 0
+        
+        # Database and write permission
+        db_frame = tk.Frame(frame, bg='#1a1a1a')
+        db_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        tk.Label(db_frame, text="Veritabanı:", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.sql_db_var = tk.StringVar(value=default_db_path())
+        tk.Entry(db_frame, textvariable=self.sql_db_var, bg='#0a0a0f', fg='white',
+                width=60).pack(side=tk.LEFT, padx=5)
+        
+        self.sql_writable_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(db_frame, text="Yazma izni", variable=self.sql_writable_var, bg='#1a1a1a',
+                      fg='#ff6b6b', selectcolor='#0a0a0f').pack(side=tk.LEFT, padx=5)
+        
         # SQL query area
         query_frame = tk.LabelFrame(frame, text="SQL Sorgusu", bg='#1a1a1a', fg='white')
         query_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -318,18 +387,38 @@ class DeveloperMode:
         self.sql_query = tk.Text(query_frame, height=5, bg='#0a0a0f', fg='white',
                                 font=('Courier', 10))
         self.sql_query.pack(fill=tk.X, padx=5, pady=5)
+        self.sql_query.bind("<Control-Return>", lambda e: (self.execute_sql(), "break")[1])
+        
+        sql_btn_frame = tk.Frame(query_frame, bg='#1a1a1a')
+        sql_btn_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        tk.Button(sql_btn_frame, text="▶️ Çalıştır", command=self.execute_sql,
+                 bg='#00ff88', fg='black').pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(sql_btn_frame, text="⏹️ İptal", command=self.cancel_sql,
+                 bg='#ff6b6b', fg='white').pack(side=tk.LEFT, padx=5)
         
-        tk.Button(query_frame, text="▶️ Çalıştır", command=self.execute_sql,
-                 bg='#00ff88', fg='black').pack(pady=5)
+        self.sql_status_label = tk.Label(sql_btn_frame, text="", bg='#1a1a1a', fg='#888888')
+        self.sql_status_label.pack(side=tk.LEFT, padx=10)
         
-        # Results area
+        # Query plan
+        self.sql_plan_label = tk.Label(query_frame, text="", bg='#1a1a1a', fg='#4a9eff',
+                                       font=('Courier', 9), justify=tk.LEFT, anchor='w')
+        self.sql_plan_label.pack(fill=tk.X, padx=5)
+        
+        # Results area: rows are fetched a page at a time as the view nears the end
         results_frame = tk.LabelFrame(frame, text="Sonuçlar", bg='#1a1a1a', fg='white')
         results_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
-        self.sql_results = scrolledtext.ScrolledText(
-            results_frame, bg='#0a0a0f', fg='#00ff88', font=('Courier', 9)
-        )
-        self.sql_results.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.sql_tree = ttk.Treeview(results_frame, show='headings')
+        sql_vsb = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.sql_tree.yview)
+        sql_hsb = ttk.Scrollbar(results_frame, orient=tk.HORIZONTAL, command=self.sql_tree.xview)
+        self.sql_tree.configure(yscrollcommand=lambda first, last: self.on_sql_scroll(sql_vsb, first, last),
+                                xscrollcommand=sql_hsb.set)
+        sql_vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        sql_hsb.pack(side=tk.BOTTOM, fill=tk.X)
+        self.sql_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.sql_dispatcher = UIDispatcher.for_widget(self.sql_tree)
     
     def create_log_viewer_tab(self, notebook):
         """Log görüntüleyici sekmesi"""
@@ -343,9 +432,9 @@ class DeveloperMode:
         tk.Label(log_frame, text="Log Dosyası:", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
         
         self.log_file_var = tk.StringVar()
-        log_combo = ttk.Combobox(log_frame, textvariable=self.log_file_var,
-                                values=self.get_log_files(), width=50)
-        log_combo.pack(side=tk.LEFT, padx=5)
+        self.log_combo = ttk.Combobox(log_frame, textvariable=self.log_file_var,
+                                      values=self.get_log_files(), width=50)
+        self.log_combo.pack(side=tk.LEFT, padx=5)
         
         tk.Button(log_frame, text="📖 Yükle", command=self.load_log_file,
                  bg='#4a9eff', fg='white').pack(side=tk.LEFT, padx=5)
@@ -353,11 +442,64 @@ class DeveloperMode:
         tk.Button(log_frame, text="🔄 Yenile", command=self.refresh_log,
                  bg='#00ff88', fg='black').pack(side=tk.LEFT, padx=5)
         
+        # Follow, level filter and time jump over the line index
+        follow_frame = tk.Frame(frame, bg='#1a1a1a')
+        follow_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        self.log_follow_var = tk.BooleanVar(value=True)
+        tk.Checkbutton(follow_frame, text="Takip et", variable=self.log_follow_var,
+                      command=self.apply_log_filter, bg='#1a1a1a', fg='white',
+                      selectcolor='#0a0a0f').pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(follow_frame, text="Filtre:", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.log_filter_var = tk.StringVar(value="Tümü")
+        filter_combo = ttk.Combobox(follow_frame, textvariable=self.log_filter_var, state="readonly", width=9,
+                                    values=["Tümü"] + list(LEVEL_NAMES))
+        filter_combo.pack(side=tk.LEFT, padx=5)
+        filter_combo.bind("<<ComboboxSelected>>", lambda e: self.apply_log_filter())
+        
+        tk.Label(follow_frame, text="Zaman:", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.log_time_var = tk.StringVar()
+        time_entry = tk.Entry(follow_frame, textvariable=self.log_time_var, width=19)
+        time_entry.pack(side=tk.LEFT, padx=5)
+        time_entry.bind("<Return>", lambda e: self.jump_to_log_time())
+        tk.Button(follow_frame, text="⏩ Git", command=self.jump_to_log_time,
+                 bg='#4a9eff', fg='white').pack(side=tk.LEFT, padx=5)
+        
+        self.log_status_label = tk.Label(follow_frame, text="", bg='#1a1a1a', fg='#888888')
+        self.log_status_label.pack(side=tk.RIGHT)
+        
+        # Structured log query (indexed by time, no whole-file reads)
+        query_frame = tk.Frame(frame, bg='#1a1a1a')
+        query_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        tk.Label(query_frame, text="Süre:", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.log_since_var = tk.StringVar(value="1 saat")
+        ttk.Combobox(query_frame, textvariable=self.log_since_var, state="readonly", width=8,
+                     values=list(self.LOG_RANGES)).pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(query_frame, text="Bileşen:", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.log_component_var = tk.StringVar()
+        tk.Entry(query_frame, textvariable=self.log_component_var, width=14).pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(query_frame, text="Seviye:", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.log_level_var = tk.StringVar(value="INFO")
+        ttk.Combobox(query_frame, textvariable=self.log_level_var, state="readonly", width=9,
+                     values=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]).pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(query_frame, text="Ara:", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.log_text_var = tk.StringVar()
+        tk.Entry(query_frame, textvariable=self.log_text_var, width=20).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(query_frame, text="🔍 Sorgula", command=self.query_structured_logs,
+                 bg='#4a9eff', fg='white').pack(side=tk.LEFT, padx=5)
+        
         # Log content
         self.log_content = scrolledtext.ScrolledText(
             frame, bg='#0a0a0f', fg='#00ff88', font=('Courier', 9)
         )
         self.log_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.log_dispatcher = UIDispatcher.for_widget(self.log_content)
     
     def create_system_config_tab(self, notebook):
         """Sistem konfigürasyonu sekmesi"""
@@ -386,6 +528,61 @@ class DeveloperMode:
         # Load config
         self.refresh_config()
     
+    def create_profiler_tab(self, notebook):
+        """Profil oluşturucu sekmesi"""
+        frame = tk.Frame(notebook, bg='#1a1a1a')
+        notebook.add(frame, text="🔥 Profil")
+        
+        from core.profiler import SamplingProfiler
+        
+        self.profiler = SamplingProfiler()
+        self.profiler_after = None
+        self.main_loop_profile = None
+        
+        # Sampling profiler (all threads)
+        sample_frame = tk.Frame(frame, bg='#1a1a1a')
+        sample_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        tk.Label(sample_frame, text="Örnekleme (Hz):", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.profiler_rate_var = tk.StringVar(value="100")
+        ttk.Combobox(sample_frame, textvariable=self.profiler_rate_var, state="readonly", width=5,
+                     values=["10", "50", "100", "250", "500"]).pack(side=tk.LEFT, padx=5)
+        
+        self.profiler_button = tk.Button(sample_frame, text="▶️ Başlat", command=self.toggle_profiler,
+                                         bg='#00ff88', fg='black')
+        self.profiler_button.pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(sample_frame, text="🗑️ Temizle", command=self.clear_profiler,
+                 bg='#ff6b6b', fg='white').pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(sample_frame, text="💾 speedscope", command=lambda: self.export_profile(".speedscope.json"),
+                 bg='#4a9eff', fg='white').pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(sample_frame, text="💾 collapsed", command=lambda: self.export_profile(".folded"),
+                 bg='#4a9eff', fg='white').pack(side=tk.LEFT, padx=5)
+        
+        self.profiler_status_label = tk.Label(sample_frame, text="", bg='#1a1a1a', fg='#888888')
+        self.profiler_status_label.pack(side=tk.RIGHT)
+        
+        # Deterministic profile of the Tk main loop
+        cprofile_frame = tk.Frame(frame, bg='#1a1a1a')
+        cprofile_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        tk.Label(cprofile_frame, text="Ana döngü cProfile (sn):", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.cprofile_seconds_var = tk.StringVar(value="5")
+        ttk.Combobox(cprofile_frame, textvariable=self.cprofile_seconds_var, state="readonly", width=4,
+                     values=["2", "5", "10", "30", "60"]).pack(side=tk.LEFT, padx=5)
+        
+        self.cprofile_button = tk.Button(cprofile_frame, text="⏺️ Kaydet", command=self.profile_main_loop,
+                                         bg='#ffb347', fg='black')
+        self.cprofile_button.pack(side=tk.LEFT, padx=5)
+        
+        # Results
+        self.profiler_text = scrolledtext.ScrolledText(
+            frame, bg='#0a0a0f', fg='#00ff88', font=('Courier', 9)
+        )
+        self.profiler_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    
     # Implementation methods for developer tools
     
     def refresh_system_info(self):
@@ -497,28 +694,148 @@ Süreç Sayısı: {len(psutil.pids())}
             messagebox.showerror("Hata", f"Dizin okunamadı: {e}")
     
     def refresh_processes(self):
-        """Süreçleri yenile"""
-        try:
-            import psutil
-            
-            # Clear existing items
-            for item in self.process_tree.get_children():
-                self.process_tree.delete(item)
-            
-            # List processes
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
-                try:
-                    info = proc.info
-                    self.process_tree.insert("", "end", text=info['name'],
-                                           values=(info['pid'], 
-                                                  f"{info['cpu_percent']:.1f}",
-                                                  f"{info['memory_percent']:.1f}",
-                                                  info['status']))
-                except:
-                    pass
-                    
-        except Exception as e:
-            messagebox.showerror("Hata", f"Süreçler listelenemedi: {e}")
+        """Süreçleri yenile (örnekleme arka planda, yalnızca değişen satırlar güncellenir)"""
+        if self.process_sampling:
+            return
+        self.process_sampling = True
+        dispatcher = UIDispatcher.for_widget(self.process_tree)
+        
+        def worker():
+            try:
+                diff = self.process_monitor.sample()
+                dispatcher.post(self.apply_process_diff, diff)
+            except Exception as e:
+                dispatcher.post(self.process_sample_failed, e)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def process_sample_failed(self, error):
+        self.process_sampling = False
+        self.process_auto_var.set(False)
+        messagebox.showerror("Hata", f"Süreçler listelenemedi: {error}")
+    
+    def schedule_process_refresh(self):
+        """Otomatik yenilemeyi seçili aralıkla planla"""
+        if self.process_after:
+            self.process_tree.after_cancel(self.process_after)
+            self.process_after = None
+        if self.process_auto_var.get() and self.process_tree.winfo_exists():
+            delay = int(float(self.process_interval_var.get() or 2) * 1000)
+            self.process_after = self.process_tree.after(delay, self.refresh_processes)
+    
+    def process_values(self, row):
+        return (row["pid"], f"{row['cpu']:.1f}", f"{row['memory']:.1f}", row["status"])
+    
+    def process_matches(self, row):
+        query = self.process_filter_var.get().strip().lower()
+        return not query or query in row["name"].lower() or query == str(row["pid"])
+    
+    def show_process_row(self, row):
+        """Filtreye uyan satırı ekle/güncelle, uymayanı kaldır"""
+        tree = self.process_tree
+        iid = str(row["pid"])
+        if self.process_matches(row):
+            if tree.exists(iid):
+                tree.item(iid, values=self.process_values(row))
+            else:
+                tree.insert("", "end", iid=iid, text=row["name"], values=self.process_values(row))
+        elif tree.exists(iid):
+            tree.delete(iid)
+    
+    def apply_process_diff(self, diff):
+        """Bir örneklemenin farkını tabloya uygula"""
+        self.process_sampling = False
+        if not self.process_tree.winfo_exists():
+            return
+        
+        start = time.perf_counter()
+        tree = self.process_tree
+        self.process_rows = diff["rows"]
+        for pid in diff["removed"]:
+            if tree.exists(str(pid)):
+                tree.delete(str(pid))
+        for row in diff["added"].values():
+            self.show_process_row(row)
+        for row in diff["changed"].values():
+            self.show_process_row(row)
+        
+        # Names and PIDs never change, so those orders only move for new rows
+        key = self.process_sort[0]
+        if diff["added"] or (diff["changed"] and key not in ("name", "pid")):
+            self.sort_process_rows()
+        
+        ui_ms = (time.perf_counter() - start) * 1000
+        self.process_stats_label.config(
+            text=f"{len(self.process_rows)} süreç  +{len(diff['added'])} "
+                 f"-{len(diff['removed'])} ~{len(diff['changed'])}  "
+                 f"örnekleme {diff['sample_ms']:.0f} ms, arayüz {ui_ms:.0f} ms")
+        self.schedule_process_refresh()
+    
+    def apply_process_filter(self):
+        """Filtreyi önbellekteki satırlara uygula (yeniden okumadan)"""
+        for row in self.process_rows.values():
+            self.show_process_row(row)
+        self.sort_process_rows()
+    
+    def sort_processes(self, key):
+        """Başlığa tıklanınca sırala; aynı başlık yönü değiştirir"""
+        if self.process_sort[0] == key:
+            self.process_sort = (key, not self.process_sort[1])
+        else:
+            self.process_sort = (key, key in ("cpu", "memory"))
+        self.update_process_headings()
+        self.sort_process_rows()
+    
+    def update_process_headings(self):
+        key, descending = self.process_sort
+        for column, (column_key, title) in self.process_columns.items():
+            arrow = (" ▼" if descending else " ▲") if column_key == key else ""
+            self.process_tree.heading(column, text=title + arrow)
+    
+    def sort_process_rows(self):
+        """Satırları yalnızca yeri değişenleri taşıyarak sırala"""
+        tree = self.process_tree
+        rows = self.process_rows
+        key, descending = self.process_sort
+        current = [iid for iid in tree.get_children("") if int(iid) in rows]
+        desired = sorted(current, key=lambda iid: rows[int(iid)][key], reverse=descending)
+        if current == desired:
+            return
+        
+        # The longest run already in order stays; every other row goes right
+        # after its predecessor in the sorted order. Detached first, so the
+        # index does not depend on where the row was.
+        stay = self.rows_in_order(current, desired)
+        previous = None
+        for iid in desired:
+            if iid not in stay:
+                tree.detach(iid)
+                tree.move(iid, "", 0 if previous is None else tree.index(previous) + 1)
+            previous = iid
+    
+    def rows_in_order(self, current, desired):
+        """Longest subsequence of current that is already in sorted order"""
+        position = {iid: index for index, iid in enumerate(current)}
+        sequence = [position[iid] for iid in desired]
+        tails = []
+        tail_index = []
+        parent = [-1] * len(sequence)
+        for index, value in enumerate(sequence):
+            slot = bisect.bisect_left(tails, value)
+            if slot:
+                parent[index] = tail_index[slot - 1]
+            if slot == len(tails):
+                tails.append(value)
+                tail_index.append(index)
+            else:
+                tails[slot] = value
+                tail_index[slot] = index
+        stay = set()
+        index = tail_index[-1] if tail_index else -1
+        while index >= 0:
+            stay.add(desired[index])
+            index = parent[index]
+        return stay
     
     def kill_process(self):
         """Seçili süreci sonlandır"""
@@ -528,15 +845,12 @@ Süreç Sayısı: {len(psutil.pids())}
             return
         
         try:
-            import psutil
-            
             item = self.process_tree.item(selection[0])
             pid = int(item['values'][0])
             
             result = messagebox.askyesno("Onay", f"PID {pid} sürecini sonlandırmak istediğinizden emin misiniz?")
             if result:
-                proc = psutil.Process(pid)
-                proc.terminate()
+                self.process_monitor.terminate(pid)
                 self.refresh_processes()
                 
         except Exception as e:
@@ -555,8 +869,117 @@ Süreç Sayısı: {len(psutil.pids())}
                 self.network_output.delete('1.0', tk.END)
                 self.network_output.insert('1.0', f"Ping hatası: {e}")
     
+    SQL_WINDOW = 5000
+    
+    def execute_sql(self):
+        """Sorguyu arka planda çalıştır; sonuçlar sayfa sayfa gelir"""
+        from core.sql_console import SqlQuery
+        
+        sql = self.sql_query.get('1.0', tk.END).strip()
+        if not sql:
+            return
+        
+        self.cancel_sql()
+        self.sql_tree.delete(*self.sql_tree.get_children())
+        self.sql_tree.configure(columns=())
+        self.sql_plan_label.config(text="")
+        self.sql_status_label.config(text="Çalışıyor...", fg='#888888')
+        self.sql_more = False
+        self.sql_fetching = True
+        self.sql_dropped = 0
+        
+        job = SqlQuery(self.sql_db_var.get(), sql, writable=self.sql_writable_var.get(),
+                       on_event=lambda kind, payload: self.sql_dispatcher.post(self.on_sql_event, job, kind, payload))
+        self.sql_job = job
+        job.start()
+    
+    def cancel_sql(self):
+        if self.sql_job:
+            self.sql_job.cancel()
+            self.sql_job = None
+            if self.sql_fetching or self.sql_more:
+                self.sql_status_label.config(text="İptal edildi", fg='#ffb347')
+            self.sql_more = False
+            self.sql_fetching = False
+    
+    def on_sql_event(self, job, kind, payload):
+        """SqlQuery olaylarını Tk thread'inde işle"""
+        if job is not self.sql_job or not self.sql_tree.winfo_exists():
+            return
+        
+        if kind == "plan":
+            self.sql_plan_label.config(text="\n".join(payload))
+        elif kind == "columns":
+            columns = [f"c{i}" for i in range(len(payload))]
+            self.sql_tree.configure(columns=columns)
+            for column, name in zip(columns, payload):
+                self.sql_tree.heading(column, text=name)
+                self.sql_tree.column(column, width=120, stretch=False)
+        elif kind == "page":
+            rows, finished = payload
+            self.append_sql_rows(rows)
+            self.sql_more = not finished
+            self.sql_fetching = False
+            self.update_sql_status()
+        elif kind == "done":
+            self.sql_fetching = False
+            if payload["truncated"]:
+                self.sql_more = False
+            self.sql_job = None if payload["changed"] is not None else job
+            self.update_sql_status(payload)
+        elif kind == "error":
+            self.sql_fetching = False
+            self.sql_more = False
+            self.sql_job = None
+            self.sql_status_label.config(text=f"Hata: {payload}", fg='#ff6b6b')
+    
+    @staticmethod
+    def sql_cell(value):
+        if value is None:
+            return "NULL"
+        if isinstance(value, bytes):
+            return f"<{len(value)} bayt>"
+        text = str(value)
+        return text if len(text) <= 200 else text[:200] + "…"
+    
+    def append_sql_rows(self, rows):
+        """Satırları ekle; ağaçta en fazla SQL_WINDOW satır tutulur"""
+        for row in rows:
+            self.sql_tree.insert('', 'end', values=[self.sql_cell(value) for value in row])
+        
+        children = self.sql_tree.get_children()
+        excess = len(children) - self.SQL_WINDOW
+        if excess > 0:
+            self.sql_tree.delete(*children[:excess])
+            self.sql_dropped += excess
+    
+    def on_sql_scroll(self, scrollbar, first, last):
+        """Görünüm sona yaklaşınca sonraki sayfayı iste"""
+        scrollbar.set(first, last)
+        if float(last) > 0.9 and self.sql_more and not self.sql_fetching and self.sql_job:
+            self.sql_fetching = True
+            self.sql_job.fetch_more()
+    
+    def update_sql_status(self, stats=None):
+        job = self.sql_job
+        if stats and stats["changed"] is not None:
+            text = f"{stats['changed']} satır değişti, {stats['execute_ms']} ms"
+        elif job:
+            shown = len(self.sql_tree.get_children())
+            text = f"{job.rows_fetched} satır"
+            if self.sql_more:
+                text += " (kaydırınca devamı gelir)"
+            elif stats and stats["truncated"]:
+                text += " (sorgu boşta kaldığı için kapatıldı, devamı için yeniden çalıştırın)"
+            if self.sql_dropped:
+                text += f", ilk {self.sql_dropped} satır pencereden çıkarıldı ({shown} gösteriliyor)"
+            text += f" — çalıştırma {job.execute_ms:.1f} ms, getirme {job.fetch_ms:.1f} ms"
+        else:
+            return
+        self.sql_status_label.config(text=text, fg='#00ff88')
+    
     def get_log_files(self):
-        """Log dosyalarını listele"""
+        """Log dosyalarını listele (dizin değişmediyse önbellekten)"""
         log_files = []
         log_dirs = [
             os.path.expanduser("~/.berke0s"),
@@ -565,36 +988,586 @@ Süreç Sayısı: {len(psutil.pids())}
         ]
         
         for log_dir in log_dirs:
-            if os.path.exists(log_dir):
-                for file in os.listdir(log_dir):
-                    if file.endswith('.log'):
-                        log_files.append(os.path.join(log_dir, file))
+            try:
+                mtime = os.stat(log_dir).st_mtime_ns
+            except OSError:
+                continue
+            cached = self.log_dir_cache.get(log_dir)
+            if cached is None or cached[0] != mtime:
+                try:
+                    files = [os.path.join(log_dir, file) for file in sorted(os.listdir(log_dir))
+                             if file.endswith('.log')]
+                except OSError:
+                    files = []
+                cached = self.log_dir_cache[log_dir] = (mtime, files)
+            log_files.extend(cached[1])
         
         return log_files
     
+    LOG_WINDOW = 2000
+    
     def load_log_file(self):
-        """Log dosyasını yükle"""
+        """Log dosyasını takip etmeye başla (yalnızca eklenen baytlar okunur)"""
         log_file = self.log_file_var.get()
         if not log_file:
             return
         
+        self.stop_log_tail()
+        self.show_log_lines([])
+        if not os.path.isfile(log_file):
+            self.log_content.insert('1.0', f"Log dosyası okunamadı: {log_file}")
+            return
+        
+        self.log_status_label.config(text="Dizinleniyor...")
+        self.log_tail = LogTail(log_file, on_lines=self.notify_log_lines)
+        self.log_tail.start()
+    
+    def stop_log_tail(self):
+        if self.log_tail:
+            self.log_tail.on_lines = None
+            self.log_tail.stop()
+            self.log_tail = None
+    
+    def notify_log_lines(self, count):
+        """LogTail thread'inden: yeni satırlar var (bekleyen bir güncelleme varsa birleştirilir)"""
+        if self.log_update_pending:
+            return
+        self.log_update_pending = True
+        self.log_dispatcher.post(self.on_log_lines)
+    
+    def log_min_level(self):
+        return LEVEL_NAMES.get(self.log_filter_var.get(), 0)
+    
+    def on_log_lines(self):
+        """Takip modunda yeni satırları pencerenin sonuna ekle"""
+        self.log_update_pending = False
+        if not self.log_tail or not self.log_content.winfo_exists():
+            self.stop_log_tail()
+            return
+        
+        if self.log_follow_var.get():
+            after = self.log_shown[-1] if self.log_shown else None
+            numbers = self.log_tail.filtered_lines(self.log_min_level(), after=after, limit=self.LOG_WINDOW)
+            if numbers:
+                self.append_log_lines(numbers)
+        self.update_log_status()
+    
+    def append_log_lines(self, numbers):
+        """Satırları ekle, pencereyi LOG_WINDOW satırla sınırla"""
+        text = self.log_content
+        at_bottom = text.yview()[1] >= 0.999
+        if len(numbers) >= self.LOG_WINDOW or not self.log_shown:
+            self.show_log_lines(numbers[-self.LOG_WINDOW:])
+        else:
+            text.insert(tk.END, "\n" + "\n".join(self.log_tail.get_lines(numbers)))
+            self.log_shown.extend(numbers)
+            excess = len(self.log_shown) - self.LOG_WINDOW
+            if excess > 0:
+                text.delete('1.0', f'{excess + 1}.0')
+                del self.log_shown[:excess]
+        if at_bottom:
+            text.see(tk.END)
+    
+    def show_log_lines(self, numbers):
+        text = self.log_content
+        text.delete('1.0', tk.END)
+        self.log_shown = list(numbers)
+        if numbers:
+            text.insert('1.0', "\n".join(self.log_tail.get_lines(numbers)))
+    
+    def apply_log_filter(self):
+        """Seviye filtresini dizinden uygula (dosya yeniden okunmaz)"""
+        if not self.log_tail:
+            return
+        if self.log_follow_var.get():
+            self.show_log_lines(self.log_tail.filtered_lines(self.log_min_level(), limit=self.LOG_WINDOW))
+            self.log_content.see(tk.END)
+        else:
+            first = self.log_shown[0] if self.log_shown else 0
+            self.show_log_lines(self.log_tail.filtered_lines(self.log_min_level(), after=first - 1,
+                                                             limit=self.LOG_WINDOW, last=False))
+            self.log_content.see('1.0')
+        self.update_log_status()
+    
+    def jump_to_log_time(self):
+        """Girilen zamana git: "SS:DD", "SS:DD:ss" veya "YYYY-AA-GG SS:DD[:ss]" """
+        if not self.log_tail:
+            return
+        value = self.log_time_var.get().strip()
         try:
-            with open(log_file, 'r') as f:
-                content = f.read()
-            
-            self.log_content.delete('1.0', tk.END)
-            self.log_content.insert('1.0', content)
-            
-        except Exception as e:
-            self.log_content.delete('1.0', tk.END)
-            self.log_content.insert('1.0', f"Log dosyası okunamadı: {e}")
+            if len(value) <= 8:
+                clock = datetime.datetime.strptime(value, "%H:%M:%S" if value.count(":") == 2 else "%H:%M")
+                target = datetime.datetime.combine(datetime.date.today(), clock.time())
+            else:
+                target = datetime.datetime.fromisoformat(value)
+        except ValueError:
+            messagebox.showwarning("Uyarı", "Zaman biçimi: 14:30, 14:30:15 veya 2024-01-31 14:30")
+            return
+        
+        self.log_follow_var.set(False)
+        line = self.log_tail.line_for_time(target.timestamp())
+        self.show_log_lines(self.log_tail.filtered_lines(self.log_min_level(), after=line - 1,
+                                                         limit=self.LOG_WINDOW, last=False))
+        self.log_content.see('1.0')
+        self.update_log_status()
+    
+    def update_log_status(self):
+        if self.log_tail:
+            self.log_status_label.config(
+                text=f"{self.log_tail.line_count()} satır dizinlendi, {len(self.log_shown)} gösteriliyor"
+                     f"{' (takip)' if self.log_follow_var.get() else ''}")
+    
+    def refresh_log(self):
+        """Dosya listesini yenile ve pencereyi dizinden yeniden çiz"""
+        self.log_combo.config(values=self.get_log_files())
+        self.apply_log_filter()
+    
+    LOG_RANGES = {"15 dakika": 900, "1 saat": 3600, "6 saat": 21600, "24 saat": 86400, "7 gün": 604800}
+    
+    def query_structured_logs(self):
+        """Yapılandırılmış logları filtrele (arka planda, sonuç UI thread'inde gösterilir)"""
+        since = time.time() - self.LOG_RANGES.get(self.log_since_var.get(), 3600)
+        component = self.log_component_var.get().strip()
+        level = self.log_level_var.get()
+        text = self.log_text_var.get().strip()
+        dispatcher = UIDispatcher.for_widget(self.log_content)
+        
+        def worker():
+            start = time.perf_counter()
+            try:
+                store = StructuredLogStore(default_log_dir())
+                records = store.query(start=since, components=[component] if component else None,
+                                      level=level, text=text or None, limit=2000, newest_first=True)
+                lines = [format_record(entry) for entry in reversed(records)]
+                lines.append(f"\n{len(records)} kayıt, {(time.perf_counter() - start) * 1000:.0f} ms")
+                content = "\n".join(lines)
+            except Exception as e:
+                content = f"Log sorgusu başarısız: {e}"
+            dispatcher.post(self.show_log_content, content)
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def show_log_content(self, content):
+        if not self.log_content.winfo_exists():
+            return
+        # Query results replace the window; stop following so new lines do not mix in
+        self.log_follow_var.set(False)
+        self.log_shown = []
+        self.log_content.delete('1.0', tk.END)
+        self.log_content.insert('1.0', content)
+        self.log_content.see(tk.END)
     
     def refresh_config(self):
         """Konfigürasyonu yenile"""
         # Implementation for config refresh
         pass
     
+    STALL_RANGES = {"Son 1 saat": 3600, "Son 24 saat": 86400, "Son 7 gün": 7 * 86400, "Tümü": None}
+    
+    def create_stalls_tab(self, notebook):
+        """Arayüz takılmaları sekmesi"""
+        frame = tk.Frame(notebook, bg='#1a1a1a')
+        notebook.add(frame, text="⏱️ Takılmalar")
+        
+        from core.stall_monitor import StallStore
+        
+        self.stall_store = StallStore()
+        self.stall_groups = {}
+        
+        # Range and export
+        stall_frame = tk.Frame(frame, bg='#1a1a1a')
+        stall_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        self.stall_range_var = tk.StringVar(value="Son 24 saat")
+        range_combo = ttk.Combobox(stall_frame, textvariable=self.stall_range_var, state="readonly", width=12,
+                                   values=list(self.STALL_RANGES))
+        range_combo.pack(side=tk.LEFT, padx=5)
+        range_combo.bind("<<ComboboxSelected>>", lambda e: self.refresh_stalls())
+        
+        tk.Button(stall_frame, text="🔄 Yenile", command=self.refresh_stalls,
+                 bg='#00ff88', fg='black').pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(stall_frame, text="💾 JSON", command=lambda: self.export_stalls(".json"),
+                 bg='#4a9eff', fg='white').pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(stall_frame, text="💾 collapsed", command=lambda: self.export_stalls(".folded"),
+                 bg='#4a9eff', fg='white').pack(side=tk.LEFT, padx=5)
+        
+        self.stall_stats_label = tk.Label(stall_frame, text="", bg='#1a1a1a', fg='#888888')
+        self.stall_stats_label.pack(side=tk.RIGHT)
+        
+        # Stalls grouped by the code that blocked
+        self.stall_tree = ttk.Treeview(frame, columns=('Count', 'Total', 'Max'), show='tree headings', height=10)
+        self.stall_tree.heading('#0', text='Konum')
+        self.stall_tree.heading('Count', text='Sayı')
+        self.stall_tree.heading('Total', text='Toplam ms')
+        self.stall_tree.heading('Max', text='En uzun ms')
+        self.stall_tree.column('#0', width=420)
+        self.stall_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.stall_tree.bind("<<TreeviewSelect>>", lambda e: self.show_stall_group())
+        
+        # Stack of the selected location's longest stall
+        self.stall_stack_text = scrolledtext.ScrolledText(
+            frame, bg='#0a0a0f', fg='#00ff88', font=('Courier', 9), height=14
+        )
+        self.stall_stack_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        self.refresh_stalls()
+    
+    def stall_since(self):
+        seconds = self.STALL_RANGES.get(self.stall_range_var.get())
+        return time.time() - seconds if seconds else None
+    
+    def refresh_stalls(self):
+        """Takılma istatistiklerini veritabanından yükle"""
+        since = self.stall_since()
+        stats = self.stall_store.stats(since)
+        self.stall_stats_label.config(
+            text=f"{stats['count']} takılma, toplam {stats['total_ms'] / 1000:.1f} sn, "
+                 f"p95 {stats['p95_ms']:.0f} ms, en uzun {stats['max_ms']:.0f} ms")
+        
+        self.stall_tree.delete(*self.stall_tree.get_children())
+        self.stall_groups = {}
+        for group in self.stall_store.groups(since):
+            item = self.stall_tree.insert('', 'end', text=group["location"],
+                                          values=(group["count"], round(group["total_ms"]), round(group["max_ms"])))
+            self.stall_groups[item] = group["location"]
+        self.stall_stack_text.delete('1.0', tk.END)
+    
+    def show_stall_group(self):
+        """Seçili konumun en uzun takılmasının yığınını ve son olayları göster"""
+        selection = self.stall_tree.selection()
+        if not selection:
+            return
+        
+        stalls = self.stall_store.recent(self.stall_since(), location=self.stall_groups.get(selection[0]), limit=50)
+        if not stalls:
+            return
+        longest = max(stalls, key=lambda stall: stall["duration_ms"])
+        lines = [f"En uzun: {longest['duration_ms']:.0f} ms, "
+                 f"{datetime.datetime.fromtimestamp(longest['timestamp']):%Y-%m-%d %H:%M:%S}", "",
+                 longest["stack"] or "(yığın alınamadı: eşikten kısa)", "Son olaylar:"]
+        for stall in stalls:
+            lines.append(f"  {datetime.datetime.fromtimestamp(stall['timestamp']):%Y-%m-%d %H:%M:%S}  "
+                         f"{stall['duration_ms']:>8.0f} ms")
+        self.stall_stack_text.delete('1.0', tk.END)
+        self.stall_stack_text.insert('1.0', "\n".join(lines))
+    
+    def export_stalls(self, suffix):
+        """Takılmaları ~/.berke0s/profiles altına yaz"""
+        try:
+            directory = os.path.expanduser("~/.berke0s/profiles")
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, time.strftime("stalls-%Y%m%d-%H%M%S") + suffix)
+            self.stall_store.export(path, self.stall_since())
+            messagebox.showinfo("Başarılı", f"Takılmalar kaydedildi:\n{path}")
+        except Exception as e:
+            messagebox.showerror("Hata", f"Takılmalar kaydedilemedi: {e}")
+    
+    MEMORY_INTERVALS = {"Kapalı": None, "5 dk": 300, "15 dk": 900, "60 dk": 3600}
+    
+    def create_memory_tab(self, notebook):
+        """Bellek denetleyici sekmesi"""
+        frame = tk.Frame(notebook, bg='#1a1a1a')
+        notebook.add(frame, text="🧠 Bellek")
+        
+        from core.memory_inspector import MemoryInspector
+        
+        self.memory_inspector = MemoryInspector()
+        self.memory_after = None
+        
+        # Tracing, snapshots and schedule
+        memory_frame = tk.Frame(frame, bg='#1a1a1a')
+        memory_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        self.memory_trace_button = tk.Button(memory_frame, command=self.toggle_memory_tracing,
+                                             bg='#00ff88', fg='black')
+        self.memory_trace_button.pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(memory_frame, text="📸 Anlık görüntü", command=self.take_memory_snapshot,
+                 bg='#4a9eff', fg='white').pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(memory_frame, text="Otomatik:", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.memory_interval_var = tk.StringVar(value="Kapalı")
+        interval_combo = ttk.Combobox(memory_frame, textvariable=self.memory_interval_var, state="readonly",
+                                      width=7, values=list(self.MEMORY_INTERVALS))
+        interval_combo.pack(side=tk.LEFT, padx=5)
+        interval_combo.bind("<<ComboboxSelected>>", lambda e: self.schedule_memory_snapshot())
+        
+        tk.Button(memory_frame, text="💾 Dışa aktar", command=self.export_memory_snapshots,
+                 bg='#ffb347', fg='black').pack(side=tk.LEFT, padx=5)
+        
+        self.memory_status_label = tk.Label(memory_frame, text="", bg='#1a1a1a', fg='#888888')
+        self.memory_status_label.pack(side=tk.RIGHT)
+        
+        # Comparison
+        compare_frame = tk.Frame(frame, bg='#1a1a1a')
+        compare_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        tk.Label(compare_frame, text="Karşılaştır:", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.memory_before_var = tk.StringVar()
+        self.memory_before_combo = ttk.Combobox(compare_frame, textvariable=self.memory_before_var,
+                                                state="readonly", width=14)
+        self.memory_before_combo.pack(side=tk.LEFT, padx=5)
+        tk.Label(compare_frame, text="→", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.memory_after_var = tk.StringVar()
+        self.memory_after_combo = ttk.Combobox(compare_frame, textvariable=self.memory_after_var,
+                                               state="readonly", width=14)
+        self.memory_after_combo.pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(compare_frame, text="Gruplama:", bg='#1a1a1a', fg='white').pack(side=tk.LEFT)
+        self.memory_group_var = tk.StringVar(value="lineno")
+        ttk.Combobox(compare_frame, textvariable=self.memory_group_var, state="readonly", width=9,
+                     values=["lineno", "filename", "traceback"]).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(compare_frame, text="🔍 Karşılaştır", command=self.compare_memory_snapshots,
+                 bg='#4a9eff', fg='white').pack(side=tk.LEFT, padx=5)
+        
+        self.memory_text = scrolledtext.ScrolledText(
+            frame, bg='#0a0a0f', fg='#00ff88', font=('Courier', 9)
+        )
+        self.memory_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.memory_dispatcher = UIDispatcher.for_widget(self.memory_text)
+        
+        self.update_memory_status()
+    
+    def toggle_memory_tracing(self):
+        """tracemalloc izlemesini aç/kapat (kapatınca anlık görüntüler silinir)"""
+        if self.memory_inspector.tracing:
+            self.memory_inspector.stop()
+            self.memory_interval_var.set("Kapalı")
+            self.schedule_memory_snapshot()
+        else:
+            self.memory_inspector.start()
+        self.update_memory_status()
+    
+    def update_memory_status(self):
+        tracing = self.memory_inspector.tracing
+        self.memory_trace_button.config(text="⏹️ İzlemeyi durdur" if tracing else "▶️ İzlemeyi başlat",
+                                        bg='#ffb347' if tracing else '#00ff88')
+        current, peak = self.memory_inspector.traced_memory()
+        rss = self.memory_inspector.process.memory_info().rss
+        self.memory_status_label.config(
+            text=f"RSS {rss / 1048576:.1f} MiB, izlenen {current / 1048576:.1f} MiB "
+                 f"(tepe {peak / 1048576:.1f}), {len(self.memory_inspector.snapshots)} görüntü")
+        
+        labels = [f"{i + 1}: {entry.label}" for i, entry in enumerate(self.memory_inspector.snapshots)]
+        self.memory_before_combo.config(values=labels)
+        self.memory_after_combo.config(values=labels)
+        if labels:
+            if self.memory_before_var.get() not in labels:
+                self.memory_before_var.set(labels[0])
+            self.memory_after_var.set(labels[-1])
+        else:
+            self.memory_before_var.set("")
+            self.memory_after_var.set("")
+    
+    def take_memory_snapshot(self):
+        """Anlık görüntü al (Tk thread'inde: widget'lar sayılır)"""
+        first = not self.memory_inspector.tracing
+        entry = self.memory_inspector.take(self.memory_text._root())
+        self.update_memory_status()
+        if first:
+            self.memory_text.delete('1.0', tk.END)
+            self.memory_text.insert('1.0', "İzleme başlatıldı; yalnızca bundan sonraki ayırmalar görülür.\n"
+                                           "Karşılaştırmak için bir süre sonra yeni bir görüntü alın.")
+        return entry
+    
+    def schedule_memory_snapshot(self):
+        """Seçili aralıkla otomatik anlık görüntü al"""
+        if self.memory_after:
+            self.memory_text.after_cancel(self.memory_after)
+            self.memory_after = None
+        
+        seconds = self.MEMORY_INTERVALS.get(self.memory_interval_var.get())
+        if seconds:
+            self.memory_after = self.memory_text.after(seconds * 1000, self.scheduled_memory_snapshot)
+    
+    def scheduled_memory_snapshot(self):
+        self.memory_after = None
+        if not self.memory_text.winfo_exists():
+            return
+        self.take_memory_snapshot()
+        self.schedule_memory_snapshot()
+    
+    def selected_memory_snapshot(self, value):
+        try:
+            return self.memory_inspector.snapshots[int(value.split(":", 1)[0]) - 1]
+        except (ValueError, IndexError):
+            return None
+    
+    def compare_memory_snapshots(self):
+        """İki görüntüyü arka planda karşılaştır (büyük yığınlarda saniyeler sürebilir)"""
+        from core.memory_inspector import format_diff
+        
+        before = self.selected_memory_snapshot(self.memory_before_var.get())
+        after = self.selected_memory_snapshot(self.memory_after_var.get())
+        if not before or not after or before is after:
+            messagebox.showwarning("Uyarı", "Karşılaştırmak için iki farklı anlık görüntü seçin")
+            return
+        
+        group = self.memory_group_var.get()
+        self.memory_text.delete('1.0', tk.END)
+        self.memory_text.insert('1.0', "Karşılaştırılıyor...")
+        
+        def worker():
+            try:
+                report = format_diff(before, after, group)
+            except Exception as e:
+                report = f"Karşılaştırma hatası: {e}"
+            self.memory_dispatcher.post(self.show_memory_report, report)
+        
+        threading.Thread(target=worker, daemon=True, name="Memory Diff").start()
+    
+    def show_memory_report(self, report):
+        if not self.memory_text.winfo_exists():
+            return
+        self.memory_text.delete('1.0', tk.END)
+        self.memory_text.insert('1.0', report)
+    
+    def export_memory_snapshots(self):
+        """Tüm anlık görüntüleri ~/.berke0s/profiles altına yaz (compare_memory.py ile karşılaştırılır)"""
+        snapshots = list(self.memory_inspector.snapshots)
+        if not snapshots:
+            messagebox.showwarning("Uyarı", "Önce bir anlık görüntü alın")
+            return
+        
+        directory = os.path.expanduser("~/.berke0s/profiles")
+        
+        def worker():
+            try:
+                os.makedirs(directory, exist_ok=True)
+                paths = [entry.export(os.path.join(
+                    directory, time.strftime("memory-%Y%m%d-%H%M%S", time.localtime(entry.taken_at)) + f"-{i + 1}.tracemalloc"))
+                    for i, entry in enumerate(snapshots)]
+                report = "Kaydedildi:\n" + "\n".join(paths) + \
+                         "\n\npython3 scripts/compare_memory.py ESKİ.tracemalloc YENİ.tracemalloc"
+            except Exception as e:
+                report = f"Dışa aktarma hatası: {e}"
+            self.memory_dispatcher.post(self.show_memory_report, report)
+        
+        threading.Thread(target=worker, daemon=True, name="Memory Export").start()
+    
+    def toggle_profiler(self):
+        """Örneklemeyi başlat/durdur"""
+        if self.profiler_after:
+            self.profiler_text.after_cancel(self.profiler_after)
+            self.profiler_after = None
+        if self.profiler.running:
+            self.profiler.stop()
+            self.profiler_button.config(text="▶️ Başlat", bg='#00ff88')
+            self.show_profiler_top()
+            return
+        
+        self.profiler.rate_hz = float(self.profiler_rate_var.get())
+        self.profiler.start()
+        self.profiler_button.config(text="⏸️ Durdur", bg='#ffb347')
+        self.show_profiler_top()
+    
+    def show_profiler_top(self):
+        """En sıcak fonksiyonları göster; örnekleme sürerken her saniye"""
+        if not self.profiler_text.winfo_exists():
+            self.profiler.stop()
+            return
+        
+        lines = [f"{'Kendi':>8} {'Toplam':>8}  Fonksiyon"]
+        for label, own, total in self.profiler.top(40):
+            lines.append(f"{own:>8} {total:>8}  {label}")
+        self.profiler_text.delete('1.0', tk.END)
+        self.profiler_text.insert('1.0', "\n".join(lines))
+        self.profiler_status_label.config(
+            text=f"{self.profiler.samples} örnek, {len(self.profiler.stacks)} thread, "
+                 f"ek yük %{self.profiler.overhead() * 100:.1f}")
+        
+        self.profiler_after = None
+        if self.profiler.running:
+            self.profiler_after = self.profiler_text.after(1000, self.show_profiler_top)
+    
+    def clear_profiler(self):
+        self.profiler.clear()
+        self.show_profiler_top()
+    
+    def export_profile(self, suffix):
+        """Toplanan yığınları ~/.berke0s/profiles altına yaz"""
+        if not self.profiler.samples:
+            messagebox.showwarning("Uyarı", "Önce örnekleme yapın")
+            return
+        
+        try:
+            directory = os.path.expanduser("~/.berke0s/profiles")
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, time.strftime("profile-%Y%m%d-%H%M%S") + suffix)
+            self.profiler.export(path)
+            messagebox.showinfo("Başarılı", f"Profil kaydedildi:\n{path}")
+        except Exception as e:
+            messagebox.showerror("Hata", f"Profil kaydedilemedi: {e}")
+    
+    def profile_main_loop(self):
+        """Tk ana döngüsünü N saniye cProfile ile ölç (bu çağrı ana thread'de çalışır)"""
+        import cProfile
+        
+        if self.main_loop_profile:
+            return
+        
+        seconds = int(self.cprofile_seconds_var.get())
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Another profiler (sys.setprofile / sys.monitoring tool) is active
+            messagebox.showerror("Hata", f"cProfile başlatılamadı: {e}")
+            return
+        
+        self.main_loop_profile = profile
+        self.cprofile_button.config(text=f"⏺️ {seconds} sn...", state=tk.DISABLED)
+        self.profiler_text.after(seconds * 1000, self.finish_main_loop_profile)
+    
+    def finish_main_loop_profile(self):
+        from core.profiler import capture_stats
+        
+        profile, self.main_loop_profile = self.main_loop_profile, None
+        if profile is None:
+            return
+        profile.disable()
+        if not self.profiler_text.winfo_exists():
+            return
+        
+        report = capture_stats(profile)
+        try:
+            directory = os.path.expanduser("~/.berke0s/profiles")
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, time.strftime("mainloop-%Y%m%d-%H%M%S.prof"))
+            profile.dump_stats(path)
+            report = f"{path} (snakeviz / python -m pstats)\n\n{report}"
+        except OSError as e:
+            report = f"Profil dosyası yazılamadı: {e}\n\n{report}"
+        
+        self.cprofile_button.config(text="⏺️ Kaydet", state=tk.NORMAL)
+        self.profiler_text.delete('1.0', tk.END)
+        self.profiler_text.insert('1.0', report)
+    
     def close_tools(self):
         """Geliştirici araçlarını kapat"""
-        self.tools_window.destroy()
-        self.tools_window = None
\ No newline at end of file
+        self.stop_tools()
+        if self.tools_window:
+            self.tools_window.destroy()
+            self.tools_window = None
+    
+    def stop_tools(self):
+        """Arka planda çalışan araçları durdur (pencere kapanırken ve mod kapatılırken)"""
+        self.stop_log_tail()
+        if getattr(self, 'sql_job', None):
+            self.sql_job.cancel()
+            self.sql_job = None
+        if getattr(self, 'profiler', None):
+            self.profiler.stop()
+        if getattr(self, 'main_loop_profile', None):
+            self.main_loop_profile.disable()
+            self.main_loop_profile = None
+        if getattr(self, 'memory_inspector', None):
+            # A scheduled snapshot would start tracing again
+            if self.memory_after:
+                self.memory_text.after_cancel(self.memory_after)
+                self.memory_after = None
+            # Tracing slows every allocation; do not leave it on unseen
+            self.memory_inspector.stop()
\ No newline at end of file
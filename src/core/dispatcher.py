@@ -0,0 +1,177 @@
+"""
+Main-thread UI dispatcher for BERKE0S
+
+Tk is not thread-safe: background threads must never touch widgets.
+They post closures (or widget option updates) here instead, and a single
+``after()`` pump on the Tk thread runs them within a per-tick time budget.
+"""
+
+import time
+import logging
+import threading
+import collections
+import tkinter as tk
+from typing import Any, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+class UIDispatcher:
+    """Runs callables posted from any thread on the Tk main thread"""
+
+    _instances: Dict[str, "UIDispatcher"] = {}
+
+    def __init__(self, root: tk.Misc, budget_ms: float = 8.0, interval_ms: int = 16,
+                 idle_interval_ms: int = 50, report_interval: float = 60.0):
+        self.root = root
+        self.budget = budget_ms / 1000.0
+        self.interval_ms = interval_ms
+        self.idle_interval_ms = idle_interval_ms
+        self.main_thread = threading.current_thread()
+
+        # deque.append/popleft are atomic, so producers never take a lock
+        self.queue: collections.deque = collections.deque()
+
+        # Latest value per (widget id, option); queue entries only carry the key.
+        # Ids are used because tk.Variable is not hashable.
+        self.latest: Dict[Tuple[int, str], Tuple[Any, Any, float]] = {}
+
+        self.running = True
+        self.report_interval = report_interval
+        self.last_report = time.monotonic()
+        self.stats_data = {
+            "executed": 0,
+            "coalesced": 0,
+            "errors": 0,
+            "max_latency_ms": 0.0,
+            "avg_latency_ms": 0.0,
+            "max_depth": 0,
+            "overruns": 0
+        }
+
+        self.root.after(self.interval_ms, self.pump)
+
+    @classmethod
+    def for_widget(cls, widget: tk.Misc) -> "UIDispatcher":
+        """Get (or create) the dispatcher of a widget's Tk root; call from the Tk thread"""
+        root = widget._root()
+        key = str(root)
+        dispatcher = cls._instances.get(key)
+        if dispatcher is None or dispatcher.root is not root:
+            dispatcher = cls(root)
+            cls._instances[key] = dispatcher
+        return dispatcher
+
+    def in_main_thread(self) -> bool:
+        """Whether the caller runs on the Tk thread"""
+        return threading.current_thread() is self.main_thread
+
+    def post(self, func: Callable, *args, **kwargs) -> None:
+        """Queue ``func(*args, **kwargs)`` to run on the Tk thread"""
+        self.queue.append((time.monotonic(), func, args, kwargs))
+
+    def call(self, func: Callable, *args, **kwargs) -> None:
+        """Run ``func`` now if on the Tk thread, otherwise post it"""
+        if self.in_main_thread():
+            func(*args, **kwargs)
+        else:
+            self.post(func, *args, **kwargs)
+
+    def post_config(self, widget: tk.Misc, **options) -> None:
+        """Queue widget option changes; only the newest value per option is applied"""
+        now = time.monotonic()
+        for option, value in options.items():
+            key = (id(widget), option)
+            if key in self.latest:
+                self.stats_data["coalesced"] += 1
+            self.latest[key] = (widget, value, now)
+            self.queue.append((now, None, key, None))
+
+    def post_set(self, variable: tk.Variable, value: Any) -> None:
+        """Queue a Tk variable update, coalesced like post_config"""
+        now = time.monotonic()
+        key = (id(variable), "value")
+        if key in self.latest:
+            self.stats_data["coalesced"] += 1
+        self.latest[key] = (variable, value, now)
+        self.queue.append((now, None, key, None))
+
+    def pump(self) -> None:
+        """Drain the queue on the Tk thread until the tick budget is spent"""
+        if not self.running:
+            return
+
+        start = time.monotonic()
+        deadline = start + self.budget
+        depth = len(self.queue)
+        if depth > self.stats_data["max_depth"]:
+            self.stats_data["max_depth"] = depth
+
+        while self.queue:
+            if time.monotonic() >= deadline:
+                self.stats_data["overruns"] += 1
+                break
+
+            posted_at, func, args, kwargs = self.queue.popleft()
+            try:
+                if func is None:
+                    # Coalesced option update; a later entry may have applied it already
+                    entry = self.latest.pop(args, None)
+                    if entry is None:
+                        continue
+                    target, value, posted_at = entry
+                    option = args[1]
+                    if option == "value":
+                        target.set(value)
+                    else:
+                        target.configure(**{option: value})
+                else:
+                    func(*args, **kwargs)
+            except tk.TclError:
+                # Widget destroyed while the update was queued
+                pass
+            except Exception as e:
+                self.stats_data["errors"] += 1
+                logger.error(f"UI dispatcher callback error: {e}")
+
+            self.record_latency(time.monotonic() - posted_at)
+
+        if start - self.last_report >= self.report_interval:
+            self.last_report = start
+            self.report()
+
+        try:
+            self.root.after(self.interval_ms if self.queue else self.idle_interval_ms, self.pump)
+        except tk.TclError:
+            self.running = False
+
+    def record_latency(self, latency: float) -> None:
+        """Update post-to-run latency statistics"""
+        stats = self.stats_data
+        latency_ms = latency * 1000.0
+        stats["executed"] += 1
+        stats["avg_latency_ms"] += (latency_ms - stats["avg_latency_ms"]) * 0.05
+        if latency_ms > stats["max_latency_ms"]:
+            stats["max_latency_ms"] = latency_ms
+
+    def report(self) -> None:
+        """Log latency and queue depth; warn when the UI thread falls behind"""
+        stats = self.stats()
+        message = (f"UI dispatcher: {stats['executed']} run, {stats['coalesced']} coalesced, "
+                   f"latency avg {stats['avg_latency_ms']:.1f} ms / max {stats['max_latency_ms']:.1f} ms, "
+                   f"queue {stats['queue_depth']} (max {stats['max_depth']})")
+        if stats["max_latency_ms"] > 250:
+            logger.warning(message)
+        else:
+            logger.debug(message)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of dispatcher statistics"""
+        data = dict(self.stats_data)
+        data["queue_depth"] = len(self.queue)
+        return data
+
+    def stop(self) -> None:
+        """Stop pumping (queued work is dropped)"""
+        self.running = False
+        self.queue.clear()
+        self.latest.clear()
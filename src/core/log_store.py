@@ -0,0 +1,315 @@
+"""
+Structured log store for BERKE0S
+
+Every log record is also appended as one compact JSON line to an hourly
+segment (``logs/YYYYMMDD-HH.jsonl``, UTC). Each segment has a sidecar
+index (``.idx``) with its time range, per-level and per-component counts
+and a byte offset for every minute, so a query only opens the segments
+that overlap its time range and may contain its components/levels, and
+seeks straight to the start time inside them.
+
+Record fields: ``t`` time, ``l`` level, ``c`` component (logger name),
+``m`` message, ``s`` source location.
+"""
+
+import os
+import json
+import time
+import logging
+import datetime
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.staging import live_staging_dir
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SECONDS = 3600
+MARK_SECONDS = 60
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+def default_log_dir() -> str:
+    """Structured log directory, preferring a live RAM staging copy"""
+    persistent = os.path.expanduser("~/.berke0s")
+    return os.path.join(live_staging_dir(persistent) or persistent, "logs")
+
+def segment_name(bucket: int) -> str:
+    return datetime.datetime.fromtimestamp(bucket * SEGMENT_SECONDS, datetime.timezone.utc).strftime("%Y%m%d-%H") + ".jsonl"
+
+def segment_bucket(name: str) -> Optional[int]:
+    try:
+        stamp = datetime.datetime.strptime(name[:-len(".jsonl")], "%Y%m%d-%H").replace(tzinfo=datetime.timezone.utc)
+    except ValueError:
+        return None
+    return int(stamp.timestamp()) // SEGMENT_SECONDS
+
+def component_matches(component: str, components: Iterable[str]) -> bool:
+    """Exact logger name or a child of it ("Berke0S" matches "Berke0S.Boot")"""
+    return any(component == name or component.startswith(name + ".") for name in components)
+
+def format_record(entry: Dict[str, Any]) -> str:
+    """Render a record like the text log"""
+    stamp = datetime.datetime.fromtimestamp(entry["t"]).strftime("%Y-%m-%d %H:%M:%S")
+    millis = int((entry["t"] % 1) * 1000)
+    return f"{stamp},{millis:03d} - {entry['c']} - {entry['l']} - {entry['m']}"
+
+class StructuredLogStore:
+    """Append-only hourly JSON-lines segments with sidecar indexes"""
+
+    def __init__(self, directory: str, retention_hours: int = 168, max_bytes: int = 64 * 1024 * 1024):
+        self.directory = directory
+        self.retention_hours = retention_hours
+        self.max_bytes = max_bytes
+        self.lock = threading.RLock()
+        self.file = None
+        self.bucket: Optional[int] = None
+        self.index: Optional[Dict[str, Any]] = None
+        self.last_flush = 0.0
+        self.last_index_write = 0.0
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, bucket: int) -> str:
+        return os.path.join(self.directory, segment_name(bucket))
+
+    @staticmethod
+    def new_index() -> Dict[str, Any]:
+        return {"version": 1, "start": None, "end": None, "count": 0, "size": 0,
+                "levels": {}, "components": {}, "marks": []}
+
+    @staticmethod
+    def add_to_index(index: Dict[str, Any], entry: Dict[str, Any], offset: int, size: int) -> None:
+        t = entry["t"]
+        if index["start"] is None or t < index["start"]:
+            index["start"] = t
+        if index["end"] is None or t > index["end"]:
+            index["end"] = t
+        index["count"] += 1
+        index["size"] = offset + size
+        index["levels"][entry["l"]] = index["levels"].get(entry["l"], 0) + 1
+        index["components"][entry["c"]] = index["components"].get(entry["c"], 0) + 1
+        marks = index["marks"]
+        if not marks or t >= marks[-1][0] + MARK_SECONDS:
+            marks.append([t, offset])
+
+    def build_index(self, path: str, index: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build a sidecar by scanning its segment, or extend one from where it stopped"""
+        index = index or self.new_index()
+        with open(path, 'rb') as f:
+            offset = index["size"]
+            f.seek(offset)
+            for line in f:
+                try:
+                    self.add_to_index(index, json.loads(line), offset, len(line))
+                except ValueError:
+                    pass
+                offset += len(line)
+        index["size"] = offset
+        return index
+
+    def load_index(self, bucket: int) -> Dict[str, Any]:
+        """Sidecar of a segment, rebuilt if missing or behind the segment"""
+        with self.lock:
+            if bucket == self.bucket and self.index is not None:
+                # Snapshot: the listener thread keeps appending to it
+                return dict(self.index, levels=dict(self.index["levels"]),
+                            components=dict(self.index["components"]), marks=list(self.index["marks"]))
+        path = self.path(bucket)
+        size = os.path.getsize(path)
+        index = None
+        try:
+            with open(path + ".idx", 'r') as f:
+                index = json.load(f)
+            if index.get("size") == size:
+                return index
+            if not 0 <= index.get("size", -1) < size:
+                index = None
+        except (OSError, ValueError):
+            index = None
+        # Missing (crash) or behind a segment another process is still writing
+        return self.build_index(path, index)
+
+    def write_index(self, bucket: int, index: Dict[str, Any]) -> None:
+        path = self.path(bucket) + ".idx"
+        temp_path = f"{path}.tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.debug(f"Log index write error: {e}")
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Append one record; called from the logging listener thread"""
+        line = (json.dumps(entry, separators=(",", ":"), ensure_ascii=False) + "\n").encode("utf-8")
+        bucket = int(entry["t"]) // SEGMENT_SECONDS
+        now = time.monotonic()
+        with self.lock:
+            if bucket != self.bucket and (self.bucket is None or bucket > self.bucket):
+                self.open_segment(bucket)
+            offset = self.file.tell()
+            self.file.write(line)
+            self.add_to_index(self.index, entry, offset, len(line))
+            if now - self.last_flush >= 1.0:
+                self.file.flush()
+                self.last_flush = now
+            if now - self.last_index_write >= 30.0:
+                self.file.flush()
+                self.write_index(self.bucket, self.index)
+                self.last_index_write = now
+
+    def open_segment(self, bucket: int) -> None:
+        self.close()
+        path = self.path(bucket)
+        self.index = self.build_index(path) if os.path.exists(path) else self.new_index()
+        self.file = open(path, 'ab')
+        self.bucket = bucket
+        self.prune()
+
+    def flush(self) -> None:
+        """Make appended records visible to readers and persist the open index"""
+        with self.lock:
+            if self.file:
+                self.file.flush()
+                self.write_index(self.bucket, self.index)
+                self.last_index_write = time.monotonic()
+
+    def close(self) -> None:
+        with self.lock:
+            if self.file:
+                self.flush()
+                self.file.close()
+                self.file = None
+                self.index = None
+                self.bucket = None
+
+    def segments(self) -> List[int]:
+        """Buckets of all segments, oldest first"""
+        buckets = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".jsonl"):
+                bucket = segment_bucket(name)
+                if bucket is not None:
+                    buckets.append(bucket)
+        return sorted(buckets)
+
+    def prune(self) -> None:
+        """Drop segments beyond the retention age or total size"""
+        buckets = self.segments()
+        cutoff = int(time.time()) // SEGMENT_SECONDS - self.retention_hours
+        sizes = {bucket: os.path.getsize(self.path(bucket)) for bucket in buckets}
+        total = sum(sizes.values())
+        for bucket in buckets:
+            if bucket == self.bucket:
+                break
+            if bucket >= cutoff and total <= self.max_bytes:
+                break
+            total -= sizes[bucket]
+            for path in (self.path(bucket), self.path(bucket) + ".idx"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None,
+              components: Optional[Iterable[str]] = None, level: Optional[str] = None,
+              text: Optional[str] = None, limit: int = 1000, newest_first: bool = False) -> List[Dict[str, Any]]:
+        """Records in [start, end] from the given components at or above level"""
+        components = list(components) if components else None
+        min_level = LEVELS.get(str(level).upper(), 0) if level else 0
+        needle = text.lower() if text else None
+        start_bucket = None if start is None else int(start) // SEGMENT_SECONDS
+        end_bucket = None if end is None else int(end) // SEGMENT_SECONDS
+
+        self.flush()
+        buckets = [bucket for bucket in self.segments()
+                   if (start_bucket is None or bucket >= start_bucket) and (end_bucket is None or bucket <= end_bucket)]
+        if newest_first:
+            buckets.reverse()
+
+        results: List[Dict[str, Any]] = []
+        for bucket in buckets:
+            try:
+                index = self.load_index(bucket)
+            except OSError:
+                continue
+            if components and not any(component_matches(c, components) for c in index["components"]):
+                continue
+            if min_level and not any(LEVELS.get(l, 0) >= min_level for l in index["levels"]):
+                continue
+
+            matches = self.scan_segment(bucket, index, start, end, components, min_level, needle,
+                                        None if newest_first else limit - len(results))
+            if newest_first:
+                matches.reverse()
+            results.extend(matches[:limit - len(results)])
+            if len(results) >= limit:
+                break
+        return results
+
+    def scan_segment(self, bucket: int, index: Dict[str, Any], start: Optional[float], end: Optional[float],
+                     components: Optional[List[str]], min_level: int, needle: Optional[str],
+                     limit: Optional[int]) -> List[Dict[str, Any]]:
+        offset = 0
+        if start is not None:
+            # Records from different threads can be a little out of order
+            for mark_time, mark_offset in index["marks"]:
+                if mark_time > start - 5:
+                    break
+                offset = mark_offset
+
+        matches = []
+        with open(self.path(bucket), 'rb') as f:
+            f.seek(offset)
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                t = entry["t"]
+                if start is not None and t < start:
+                    continue
+                if end is not None and t > end:
+                    if t > end + 5:
+                        break
+                    continue
+                if min_level and LEVELS.get(entry["l"], 0) < min_level:
+                    continue
+                if components and not component_matches(entry["c"], components):
+                    continue
+                if needle and needle not in entry["m"].lower():
+                    continue
+                matches.append(entry)
+                if limit is not None and len(matches) >= limit:
+                    break
+        return matches
+
+    def stats(self) -> Dict[str, Any]:
+        buckets = self.segments()
+        return {
+            "segments": len(buckets),
+            "bytes": sum(os.path.getsize(self.path(bucket)) for bucket in buckets),
+            "oldest": buckets[0] * SEGMENT_SECONDS if buckets else None
+        }
+
+class StructuredLogHandler(logging.Handler):
+    """Logging handler feeding a StructuredLogStore (runs on the listener thread)"""
+
+    def __init__(self, store: StructuredLogStore, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.store = store
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.store.append({
+                "t": round(record.created, 3),
+                "l": record.levelname,
+                "c": record.name,
+                "m": record.getMessage(),
+                "s": f"{record.filename}:{record.lineno}"
+            })
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        self.store.close()
+        super().close()
@@ -0,0 +1,254 @@
+"""
+Tail-follow log reader for BERKE0S
+
+LogTail follows a text log with positional reads: a background thread
+polls the file, reads only the bytes appended since the last poll and
+records each line's offset, level and timestamp in compact arrays (about
+17 bytes per line). Filtering by level or jumping to a time works on that
+index, and the viewer fetches only the lines it shows with ``os.pread``.
+
+Rotation (the path now names a different inode) is handled by draining
+the old file through the descriptor that is still open and starting a
+new generation on the new file, so nothing is read twice. Truncation in
+place (copytruncate) starts a new generation on the same file.
+"""
+
+import os
+import re
+import heapq
+import bisect
+import logging
+import datetime
+import threading
+from array import array
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Level codes stored per line; 0 means no level found
+LEVEL_CODES = {b"DEBUG": 1, b"INFO": 2, b"WARNING": 3, b"ERROR": 4, b"CRITICAL": 5}
+LEVEL_NAMES = {"DEBUG": 1, "INFO": 2, "WARNING": 3, "ERROR": 4, "CRITICAL": 5}
+LEVEL_PATTERN = re.compile(rb"\b(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b")
+TIME_PATTERN = re.compile(rb"(\d{4})-(\d\d)-(\d\d)[ T](\d\d):(\d\d):(\d\d)")
+
+class LogGeneration:
+    """One physical file the path pointed to, and the first line read from it"""
+
+    def __init__(self, file, inode: int, first_line: int):
+        self.file = file
+        self.inode = inode
+        self.first_line = first_line
+        self.position = 0
+        self.readable = True
+        # First bytes of the file, to notice truncate-and-rewrite past the old size
+        self.head = b""
+
+class LogTail:
+    """Follows a log file and indexes its lines by offset, level and time"""
+
+    def __init__(self, path: str, poll_interval: float = 0.5, chunk_size: int = 1 << 20,
+                 max_generations: int = 4, on_lines: Optional[Callable[[int], None]] = None):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.chunk_size = chunk_size
+        self.max_generations = max_generations
+        self.on_lines = on_lines
+
+        self.offsets = array('q')
+        self.levels = array('b')
+        self.times = array('d')
+        self.level_lines: Dict[int, array] = {code: array('l') for code in range(1, 6)}
+        self.generations: List[LogGeneration] = []
+        self.generation_starts: List[int] = []
+
+        self.partial = b""
+        self.last_level = 0
+        self.last_time = 0.0
+        self.time_cache: Dict[bytes, float] = {}
+        self.lock = threading.RLock()
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self.run, daemon=True, name="LogTail")
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop following; the poll thread closes the files on its way out"""
+        self.stop_event.set()
+        if self.thread is None:
+            self.close_files()
+
+    def close_files(self) -> None:
+        with self.lock:
+            for generation in self.generations:
+                if generation.file:
+                    generation.file.close()
+                    generation.file = None
+
+    def run(self) -> None:
+        try:
+            while not self.stop_event.is_set():
+                try:
+                    self.poll()
+                except Exception as e:
+                    logger.error(f"Log tail error {self.path}: {e}")
+                self.stop_event.wait(self.poll_interval)
+        finally:
+            # Closed here, not in stop(): a pread in progress on a closed
+            # descriptor could read whatever file reuses its number
+            self.close_files()
+
+    def poll(self) -> None:
+        """Read whatever was appended since the last poll"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            # Between rename and re-create during rotation
+            return
+
+        before = len(self.offsets)
+        current = self.generations[-1] if self.generations else None
+        if current is None or st.st_ino != current.inode:
+            if current is not None:
+                # Rotated: the old descriptor still reaches the renamed file's tail
+                self.read_available(current)
+                self.finish_partial(current)
+            self.open_generation(open(self.path, 'rb'), st.st_ino)
+        elif st.st_size < current.position or (
+                current.head and os.pread(current.file.fileno(), len(current.head), 0) != current.head):
+            # Truncated in place: lines indexed so far no longer exist
+            self.finish_partial(current)
+            current.readable = False
+            self.open_generation(current.file, st.st_ino, reuse=True)
+
+        self.read_available(self.generations[-1])
+        if self.on_lines and len(self.offsets) > before:
+            self.on_lines(len(self.offsets))
+
+    def open_generation(self, file, inode: int, reuse: bool = False) -> None:
+        with self.lock:
+            generation = LogGeneration(file, inode, len(self.offsets))
+            self.generations.append(generation)
+            self.generation_starts.append(generation.first_line)
+            self.partial = b""
+            if len(self.generations) > self.max_generations:
+                oldest = self.generations[-self.max_generations - 1]
+                if oldest.file and oldest.file is not file:
+                    oldest.file.close()
+                oldest.file = None
+                oldest.readable = False
+
+    def read_available(self, generation: LogGeneration) -> None:
+        fd = generation.file.fileno()
+        while not self.stop_event.is_set():
+            chunk = os.pread(fd, self.chunk_size, generation.position)
+            if not chunk:
+                break
+            self.index_chunk(generation, chunk)
+
+    def index_chunk(self, generation: LogGeneration, chunk: bytes) -> None:
+        data = self.partial + chunk
+        base = generation.position - len(self.partial)
+        start = 0
+        with self.lock:
+            while True:
+                end = data.find(b"\n", start)
+                if end < 0:
+                    break
+                self.add_line(base + start, data[start:end])
+                start = end + 1
+            self.partial = data[start:]
+            if len(generation.head) < 64 and generation.position < 64:
+                generation.head = (generation.head + chunk)[:64]
+            generation.position += len(chunk)
+
+    def finish_partial(self, generation: LogGeneration) -> None:
+        """Index an unterminated last line before leaving a generation"""
+        if self.partial:
+            with self.lock:
+                self.add_line(generation.position - len(self.partial), self.partial)
+                self.partial = b""
+
+    def add_line(self, offset: int, line: bytes) -> None:
+        head = line[:120]
+        match = TIME_PATTERN.match(head)
+        if match:
+            stamp = match.group(0)
+            timestamp = self.time_cache.get(stamp)
+            if timestamp is None:
+                year, month, day, hour, minute, second = (int(part) for part in match.groups())
+                try:
+                    timestamp = datetime.datetime(year, month, day, hour, minute, second).timestamp()
+                except ValueError:
+                    timestamp = self.last_time
+                if len(self.time_cache) > 4096:
+                    self.time_cache.clear()
+                self.time_cache[stamp] = timestamp
+            level_match = LEVEL_PATTERN.search(head)
+            level = LEVEL_CODES[level_match.group(1)] if level_match else 0
+            self.last_time = timestamp
+            self.last_level = level
+        else:
+            # Continuation (traceback, wrapped output) belongs to the record above
+            timestamp, level = self.last_time, self.last_level
+
+        number = len(self.offsets)
+        self.offsets.append(offset)
+        self.levels.append(level)
+        self.times.append(timestamp)
+        if level:
+            self.level_lines[level].append(number)
+
+    def line_count(self) -> int:
+        return len(self.offsets)
+
+    def filtered_lines(self, min_level: int = 0, before: Optional[int] = None,
+                       after: Optional[int] = None, limit: int = 2000, last: bool = True) -> List[int]:
+        """Line numbers at or above ``min_level`` in (after, before), the last or first ``limit``"""
+        with self.lock:
+            total = len(self.offsets)
+            low = 0 if after is None else after + 1
+            high = total if before is None else min(before, total)
+            if low >= high:
+                return []
+            if min_level <= 0:
+                if last:
+                    return list(range(max(low, high - limit), high))
+                return list(range(low, min(high, low + limit)))
+
+            parts = []
+            for code in range(min_level, 6):
+                numbers = self.level_lines[code]
+                i = bisect.bisect_left(numbers, low)
+                j = bisect.bisect_left(numbers, high)
+                parts.append(numbers[max(i, j - limit):j] if last else numbers[i:min(j, i + limit)])
+        merged = list(heapq.merge(*parts))
+        return merged[-limit:] if last else merged[:limit]
+
+    def line_for_time(self, timestamp: float) -> int:
+        """First line logged at or after ``timestamp``"""
+        with self.lock:
+            return bisect.bisect_left(self.times, timestamp)
+
+    def get_lines(self, numbers: List[int]) -> List[str]:
+        """Text of the given lines, read positionally"""
+        lines = []
+        with self.lock:
+            for number in numbers:
+                index = bisect.bisect_right(self.generation_starts, number) - 1
+                generation = self.generations[index] if index >= 0 else None
+                if generation is None or not generation.readable or generation.file is None:
+                    lines.append("<rotated out>")
+                    continue
+                offset = self.offsets[number]
+                next_number = number + 1
+                if next_number < len(self.offsets) and (index + 1 >= len(self.generation_starts)
+                                                       or next_number < self.generation_starts[index + 1]):
+                    length = self.offsets[next_number] - offset
+                else:
+                    length = generation.position - offset
+                data = os.pread(generation.file.fileno(), max(length, 0), offset)
+                # The last line of the open file is followed by a partial one
+                lines.append(data.split(b"\n", 1)[0].rstrip(b"\r").decode('utf-8', errors='replace'))
+        return lines
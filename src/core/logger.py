@@ -1,68 +1,224 @@
 """
 Logging configuration for BERKE0S
+
+Log calls never touch the disk or the console on the calling thread: a
+QueueHandler puts the record on a bounded queue and a QueueListener thread
+owns the rotating file and console handlers. Repeats of the same message
+within ``repeat_window`` seconds are folded into one "repeated N times"
+line, and records are dropped (and counted) rather than blocking when the
+queue is full.
 """
 
 import os
+import time
+import queue
+import atexit
 import logging
+import threading
+import collections
 import logging.handlers
-from typing import Optional
+from typing import Any, Dict, Optional
+
+from core.log_store import StructuredLogHandler, StructuredLogStore
+
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    "level": "INFO",
+    "console_level": "INFO",
+    "max_bytes": 10 * 1024 * 1024,
+    "backup_count": 5,
+    "queue_size": 10000,
+    "repeat_window": 60,
+    # JSON-lines copy of every record under logs/, queryable by time/component/level
+    "structured": True,
+    "retention_hours": 168,
+    "structured_max_bytes": 64 * 1024 * 1024,
+    # Logger name -> level, e.g. {"display": "WARNING"}
+    "components": {}
+}
+
+class RepeatFilter(logging.Filter):
+    """Suppresses repeats of a message seen within the last ``window`` seconds"""
+
+    def __init__(self, window: float = 60.0, max_keys: int = 512):
+        super().__init__()
+        self.window = window
+        self.max_keys = max_keys
+        self.seen: "collections.OrderedDict[tuple, list]" = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.suppressed = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.window <= 0:
+            return True
+
+        message = record.getMessage()
+        key = (record.name, record.levelno, message)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.seen.get(key)
+            if entry is not None and now - entry[0] < self.window:
+                entry[1] += 1
+                self.suppressed += 1
+                return False
+            self.seen[key] = [now, 0]
+            self.seen.move_to_end(key)
+            if len(self.seen) > self.max_keys:
+                self.seen.popitem(last=False)
+
+        if entry is not None and entry[1]:
+            record.msg = f"{message} (repeated {entry[1]} more times)"
+            record.args = None
+        return True
+
+    def pending(self) -> int:
+        """Repeats suppressed since each message was last written"""
+        with self.lock:
+            return sum(entry[1] for entry in self.seen.values())
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking on a full queue"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+class LoggingPipeline:
+    """Queue handler on the root logger, file/console I/O on a listener thread"""
+
+    def __init__(self, handlers: list, queue_size: int = 10000, repeat_window: float = 60.0):
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.handler = NonBlockingQueueHandler(self.queue)
+        self.repeat_filter = RepeatFilter(repeat_window)
+        self.handler.addFilter(self.repeat_filter)
+        self.handlers = handlers
+        self.listener = logging.handlers.QueueListener(self.queue, *handlers, respect_handler_level=True)
+        self.started = False
+
+    def start(self) -> None:
+        if not self.started:
+            self.listener.start()
+            self.started = True
+            atexit.register(self.stop)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "queued": self.queue.qsize(),
+            "dropped": self.handler.dropped,
+            "suppressed": self.repeat_filter.suppressed
+        }
+
+    def stop(self) -> None:
+        """Drain the queue and close the handlers"""
+        if not self.started:
+            return
+        self.started = False
+        pending = self.repeat_filter.pending()
+        if pending or self.handler.dropped:
+            summary = logging.LogRecord("berke0s", logging.INFO, __file__, 0,
+                                        f"Logging: {pending} repeated messages suppressed, "
+                                        f"{self.handler.dropped} dropped on a full queue", None, None)
+            self.queue.put(summary)
+        self.listener.stop()
+        for handler in self.handlers:
+            handler.close()
+
+_pipeline: Optional[LoggingPipeline] = None
+
+def level_number(name: Any) -> int:
+    """Numeric level for a name such as "debug"; unknown names mean INFO"""
+    value = logging.getLevelName(str(name).upper())
+    return value if isinstance(value, int) else logging.INFO
 
-def setup_logging(level: int = logging.INFO, config_dir: Optional[str] = None) -> logging.Logger:
+def get_pipeline() -> Optional[LoggingPipeline]:
+    """The active pipeline, if setup_logging has run"""
+    return _pipeline
+
+def setup_logging(level: int = logging.INFO, config_dir: Optional[str] = None,
+                  settings: Optional[Dict[str, Any]] = None) -> logging.Logger:
     """Setup comprehensive logging for BERKE0S"""
-    
+    global _pipeline
+
     if config_dir is None:
         config_dir = os.path.expanduser("~/.berke0s")
-    
+
     os.makedirs(config_dir, exist_ok=True)
-    
+
+    options = dict(DEFAULT_SETTINGS, level=logging.getLevelName(level), console_level=logging.getLevelName(level))
+    options.update(settings or {})
+    file_level = level_number(options["level"])
+    console_level = level_number(options["console_level"])
+
     # Main log file
     log_file = os.path.join(config_dir, "berke0s.log")
-    
+
     # Create formatters
     detailed_formatter = logging.Formatter(
         '%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
     )
-    
+
     simple_formatter = logging.Formatter(
         '%(asctime)s - %(levelname)s - %(message)s'
     )
-    
+
+    if _pipeline is not None:
+        _pipeline.stop()
+
     # Setup root logger
     root_logger = logging.getLogger()
-    root_logger.setLevel(level)
-    
+    root_logger.setLevel(min(file_level, console_level))
+
     # Clear existing handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
-    
+
     # File handler with rotation
     file_handler = logging.handlers.RotatingFileHandler(
-        log_file, maxBytes=10*1024*1024, backupCount=5
+        log_file, maxBytes=options["max_bytes"], backupCount=options["backup_count"]
     )
-    file_handler.setLevel(level)
+    file_handler.setLevel(file_level)
     file_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(file_handler)
-    
+
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
+    console_handler.setLevel(console_level)
     console_handler.setFormatter(simple_formatter)
-    root_logger.addHandler(console_handler)
-    
-    # Create specialized loggers
-    display_logger = logging.getLogger('display')
+
+    # Display records also get their own file
     display_log_file = os.path.join(config_dir, "display.log")
     display_handler = logging.handlers.RotatingFileHandler(
         display_log_file, maxBytes=5*1024*1024, backupCount=3
     )
     display_handler.setFormatter(detailed_formatter)
-    display_logger.addHandler(display_handler)
-    
+    display_handler.addFilter(logging.Filter('display'))
+
+    handlers = [file_handler, console_handler, display_handler]
+    if options["structured"]:
+        store = StructuredLogStore(os.path.join(config_dir, "logs"),
+                                   retention_hours=options["retention_hours"],
+                                   max_bytes=options["structured_max_bytes"])
+        handlers.append(StructuredLogHandler(store, file_level))
+
+    _pipeline = LoggingPipeline(handlers,
+                                queue_size=options["queue_size"],
+                                repeat_window=options["repeat_window"])
+    root_logger.addHandler(_pipeline.handler)
+    _pipeline.start()
+
+    # Per-component levels
+    for name, component_level in options["components"].items():
+        logging.getLogger(name).setLevel(level_number(component_level))
+
     # Application logger
     app_logger = logging.getLogger('berke0s')
-    
+
     app_logger.info("Logging system initialized")
-    app_logger.info(f"Log level: {logging.getLevelName(level)}")
+    app_logger.info(f"Log level: {logging.getLevelName(file_level)}")
     app_logger.info(f"Log directory: {config_dir}")
-    
-    return app_logger
\ No newline at end of file
+
+    return app_logger
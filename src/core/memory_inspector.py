@@ -0,0 +1,200 @@
+"""
+Memory inspector for BERKE0S
+
+Takes tracemalloc snapshots together with object counts by type and Tk
+widget counts, and diffs two snapshots by allocation site so the sites
+that keep growing over a long session stand out. A widget whose Tcl
+window was destroyed but whose Python object is still referenced is
+counted as leaked.
+
+Snapshots are exported in tracemalloc's own format (plus a JSON sidecar
+with the counts), so they can be compared offline with
+``scripts/compare_memory.py`` or ``tracemalloc.Snapshot.load``.
+"""
+
+import gc
+import os
+import json
+import time
+import tkinter as tk
+import tracemalloc
+import collections
+from typing import Any, Dict, List, Optional, Tuple
+
+import psutil
+
+# Allocation sites left out of diffs: the inspector itself and imports.
+# Applied to the compared statistics; Snapshot.filter_traces matches every
+# trace with fnmatch and takes seconds on a large heap.
+IGNORED_FILES = {
+    tracemalloc.__file__,
+    __file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>"
+}
+
+class MemorySnapshot:
+    """One tracemalloc snapshot with the process state at the same moment"""
+
+    def __init__(self, label: str, snapshot: tracemalloc.Snapshot, rss: int, traced: int,
+                 type_counts: Dict[str, int], widget_counts: Dict[str, int], leaked_widgets: Dict[str, int],
+                 taken_at: Optional[float] = None):
+        self.label = label
+        self.snapshot = snapshot
+        self.rss = rss
+        self.traced = traced
+        self.type_counts = type_counts
+        self.widget_counts = widget_counts
+        self.leaked_widgets = leaked_widgets
+        self.taken_at = taken_at or time.time()
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "label": self.label,
+            "taken_at": self.taken_at,
+            "rss": self.rss,
+            "traced": self.traced,
+            "type_counts": self.type_counts,
+            "widget_counts": self.widget_counts,
+            "leaked_widgets": self.leaked_widgets
+        }
+
+    def export(self, path: str) -> str:
+        """Write ``path`` (tracemalloc dump) and ``path + ".json"`` (counts)"""
+        self.snapshot.dump(path)
+        with open(path + ".json", 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, indent=2)
+        return path
+
+    @classmethod
+    def load(cls, path: str) -> "MemorySnapshot":
+        snapshot = tracemalloc.Snapshot.load(path)
+        try:
+            with open(path + ".json", 'r', encoding='utf-8') as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            info = {}
+        return cls(info.get("label", os.path.basename(path)), snapshot, info.get("rss", 0), info.get("traced", 0),
+                   info.get("type_counts", {}), info.get("widget_counts", {}), info.get("leaked_widgets", {}),
+                   info.get("taken_at"))
+
+def count_types(limit: int = 200) -> Dict[str, int]:
+    """Live objects tracked by the garbage collector, by type name"""
+    counts = collections.Counter(type(obj).__name__ for obj in gc.get_objects())
+    return dict(counts.most_common(limit))
+
+def count_widgets(root: Optional[tk.Misc]) -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Existing widgets by class, and referenced-but-destroyed widgets by class
+
+    Must run on the Tk thread.
+    """
+    existing: "collections.Counter[str]" = collections.Counter()
+    if root is not None:
+        pending = [root]
+        while pending:
+            widget = pending.pop()
+            existing[widget.winfo_class()] += 1
+            pending.extend(widget.winfo_children())
+
+    leaked: "collections.Counter[str]" = collections.Counter()
+    for obj in gc.get_objects():
+        if isinstance(obj, tk.Misc) and not isinstance(obj, tk.Tk):
+            try:
+                if not obj.tk.call('winfo', 'exists', obj._w):
+                    leaked[type(obj).__name__] += 1
+            except (tk.TclError, AttributeError, RuntimeError):
+                # Interpreter gone or a half-built widget
+                continue
+    return dict(existing), dict(leaked)
+
+def diff_counts(before: Dict[str, int], after: Dict[str, int], limit: int = 20) -> List[Tuple[str, int, int]]:
+    """(name, count now, change) for the largest increases"""
+    changes = [(name, count, count - before.get(name, 0)) for name, count in after.items()]
+    changes = [change for change in changes if change[2] > 0]
+    changes.sort(key=lambda change: change[2], reverse=True)
+    return changes[:limit]
+
+def diff_snapshots(before: MemorySnapshot, after: MemorySnapshot, key_type: str = "lineno",
+                   limit: int = 30) -> List[tracemalloc.StatisticDiff]:
+    """Allocation sites that grew the most between two snapshots"""
+    stats = after.snapshot.compare_to(before.snapshot, key_type)
+    growers = [stat for stat in stats if stat.size_diff > 0 and stat.traceback[-1].filename not in IGNORED_FILES]
+    return growers[:limit]
+
+def format_size(size: float) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+def format_diff(before: MemorySnapshot, after: MemorySnapshot, key_type: str = "lineno", limit: int = 30) -> str:
+    """Text report: RSS, top growing sites, growing types and widget counts"""
+    lines = [
+        f"{before.label} -> {after.label} ({(after.taken_at - before.taken_at) / 60:.1f} dk)",
+        f"RSS: {format_size(before.rss)} -> {format_size(after.rss)} ({format_size(after.rss - before.rss)})",
+        f"tracemalloc: {format_size(before.traced)} -> {format_size(after.traced)}",
+        "",
+        "En çok büyüyen ayırma noktaları:"
+    ]
+    for stat in diff_snapshots(before, after, key_type, limit):
+        # Frames run oldest to newest; the last one made the allocation
+        frame = stat.traceback[-1]
+        lines.append(f"  +{format_size(stat.size_diff):>10}  +{stat.count_diff:>7} blok  "
+                     f"{frame.filename}:{frame.lineno}")
+        if key_type == "traceback":
+            for line in stat.traceback.format()[-8:]:
+                lines.append(f"      {line}")
+
+    lines += ["", "Artan nesne türleri:"]
+    for name, count, change in diff_counts(before.type_counts, after.type_counts):
+        lines.append(f"  {name:<32} {count:>9} (+{change})")
+
+    lines += ["", "Tk widget'ları (var / yok edilmiş ama referanslı):"]
+    for name in sorted(set(after.widget_counts) | set(after.leaked_widgets)):
+        count = after.widget_counts.get(name, 0)
+        change = count - before.widget_counts.get(name, 0)
+        leaked = after.leaked_widgets.get(name, 0)
+        lines.append(f"  {name:<20} {count:>6} ({change:+d})  sızan: {leaked}")
+    return "\n".join(lines)
+
+class MemoryInspector:
+    """Keeps a bounded list of snapshots; the first one stays as the baseline"""
+
+    def __init__(self, frames: int = 10, max_snapshots: int = 6):
+        self.frames = frames
+        self.max_snapshots = max_snapshots
+        self.snapshots: List[MemorySnapshot] = []
+        self.process = psutil.Process()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self) -> None:
+        """Only allocations made after this are traced"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def stop(self) -> None:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.snapshots.clear()
+
+    def take(self, root: Optional[tk.Misc] = None, label: Optional[str] = None) -> MemorySnapshot:
+        """Snapshot now; call from the Tk thread so widgets can be counted"""
+        self.start()
+        snapshot = tracemalloc.take_snapshot()
+        widgets, leaked = count_widgets(root)
+        entry = MemorySnapshot(label or time.strftime("%H:%M:%S"), snapshot, self.process.memory_info().rss,
+                               tracemalloc.get_traced_memory()[0], count_types(), widgets, leaked)
+        self.snapshots.append(entry)
+        if len(self.snapshots) > self.max_snapshots:
+            # Keep the baseline, drop the oldest after it
+            del self.snapshots[1]
+        return entry
+
+    def traced_memory(self) -> Tuple[int, int]:
+        """(current, peak) bytes traced"""
+        return tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
@@ -0,0 +1,284 @@
+"""
+Ollama HTTP client for BERKE0S
+
+Streams ``/api/generate`` and ``/api/chat`` responses: Ollama sends one
+JSON object per line (NDJSON) as tokens are produced, and the last
+object carries ``done: true`` with the token counts and timings. The
+read timeout applies between chunks, so a slow model that keeps
+producing tokens never times out, while a stalled server still does.
+
+There is one client per host (``OllamaClient.for_host``) with one
+keep-alive session, so status checks and messages reuse open
+connections. Requests go through a scheduler that bounds how many run
+at once and lets identical requests share the one already in flight.
+The model list is cached and refreshed in the background once stale.
+"""
+
+import json
+import time
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+class OllamaError(Exception):
+    """Error reported by the Ollama server"""
+
+class DuplicateRequest(OllamaError):
+    """The same generation is already streaming"""
+
+def error_message(response: requests.Response) -> str:
+    """The "error" field Ollama puts in failed responses, or the status"""
+    try:
+        return response.json()["error"]
+    except (ValueError, KeyError, TypeError):
+        return f"HTTP {response.status_code}"
+
+def chunk_text(chunk: Dict[str, Any]) -> str:
+    """Token text of a chunk from either endpoint"""
+    message = chunk.get("message")
+    if message:
+        return message.get("content", "")
+    return chunk.get("response", "")
+
+def request_key(path: str, payload: Dict[str, Any]) -> str:
+    body = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return f"{path}:{hashlib.sha1(body).hexdigest()}"
+
+class InFlight:
+    """A request other callers can wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+class RequestScheduler:
+    """Bounded concurrency, and identical in-flight requests run once"""
+
+    def __init__(self, max_concurrent: int = 2):
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+        self.lock = threading.Lock()
+        self.inflight: Dict[str, InFlight] = {}
+        self.streaming: Dict[str, "OllamaStream"] = {}
+        self.stats_data = {"requests": 0, "shared": 0, "rejected": 0}
+
+    def run(self, key: str, func: Callable[[], Any]) -> Any:
+        """``func()``, or the result of the identical call already running"""
+        with self.lock:
+            call = self.inflight.get(key)
+            leader = call is None
+            if leader:
+                call = self.inflight[key] = InFlight()
+                self.stats_data["requests"] += 1
+            else:
+                self.stats_data["shared"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            with self.slots:
+                call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.inflight[key]
+            call.done.set()
+
+    def begin_stream(self, key: str, stream: "OllamaStream") -> None:
+        """Take a slot for a stream; an identical stream already running is refused"""
+        with self.lock:
+            if key in self.streaming:
+                self.stats_data["rejected"] += 1
+                raise DuplicateRequest("Aynı istek zaten yanıtlanıyor")
+            self.streaming[key] = stream
+            self.stats_data["requests"] += 1
+        self.slots.acquire()
+
+    def end_stream(self, key: str, stream: "OllamaStream") -> None:
+        self.slots.release()
+        with self.lock:
+            if self.streaming.get(key) is stream:
+                del self.streaming[key]
+
+    def stats(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.stats_data, inflight=len(self.inflight) + len(self.streaming))
+
+class OllamaStream:
+    """One streaming request; iterate it for chunks, cancel it from any thread"""
+
+    def __init__(self, url: str, payload: Dict[str, Any], connect_timeout: float = 5.0,
+                 read_timeout: float = 120.0, session: Optional[requests.Session] = None,
+                 scheduler: Optional[RequestScheduler] = None):
+        self.url = url
+        self.payload = payload
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = session or requests.Session()
+        self.scheduler = scheduler
+        self.key = request_key(url, payload)
+        self.response: Optional[requests.Response] = None
+        self.cancelled = threading.Event()
+        self.final: Dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        if self.scheduler:
+            self.scheduler.begin_stream(self.key, self)
+        try:
+            if self.cancelled.is_set():
+                # Cancelled while waiting for a slot
+                return
+            self.response = self.session.post(self.url, json=self.payload, stream=True, timeout=self.timeout)
+            if self.response.status_code != 200:
+                raise OllamaError(error_message(self.response))
+            for line in self.response.iter_lines():
+                if self.cancelled.is_set():
+                    return
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    raise OllamaError(chunk["error"])
+                if chunk.get("done"):
+                    self.final = chunk
+                yield chunk
+        except Exception:
+            # Closing the response from cancel() breaks the read in progress
+            # with whatever urllib3 raises for a closed socket
+            if not self.cancelled.is_set():
+                raise
+        finally:
+            if self.response is not None:
+                self.response.close()
+            if self.scheduler:
+                self.scheduler.end_stream(self.key, self)
+
+    def cancel(self) -> None:
+        """Stop the generation; the iterating thread returns at once"""
+        self.cancelled.set()
+        response = self.response
+        if response is not None:
+            try:
+                response.close()
+            except Exception:
+                pass
+
+class OllamaClient:
+    """Ollama API client; use ``for_host`` to share one per host"""
+
+    _instances: Dict[str, "OllamaClient"] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, host: str = "http://localhost:11434", max_concurrent: int = 2,
+                 models_ttl: float = 30.0):
+        self.host = host.rstrip("/")
+        self.models_ttl = models_ttl
+        self.scheduler = RequestScheduler(max_concurrent)
+
+        # Streams plus a status check or summary can be open at once; more
+        # connections than that would only be opened and thrown away
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrent + 2)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.models_lock = threading.Lock()
+        self.models: Optional[List[Dict[str, Any]]] = None
+        self.models_fetched = 0.0
+        self.models_refreshing = False
+
+    @classmethod
+    def for_host(cls, host: str) -> "OllamaClient":
+        """Get (or create) the shared client of a host"""
+        key = host.rstrip("/")
+        with cls._instances_lock:
+            client = cls._instances.get(key)
+            if client is None:
+                client = cls._instances[key] = cls(key)
+            return client
+
+    def close(self) -> None:
+        self.session.close()
+
+    def list_models(self, force: bool = False) -> List[Dict[str, Any]]:
+        """Installed models from ``/api/tags``
+
+        A fresh cached list is returned as is. A stale one is returned too,
+        while a background refresh replaces it; ``force`` always asks the
+        server. Raises ``requests.RequestException`` when it is unreachable.
+        """
+        with self.models_lock:
+            models = self.models
+            age = time.monotonic() - self.models_fetched
+            refresh = models is not None and age > self.models_ttl and not self.models_refreshing and not force
+            if refresh:
+                self.models_refreshing = True
+        if models is not None and not force:
+            if refresh:
+                threading.Thread(target=self.refresh_models, daemon=True, name="Ollama Models").start()
+            return models
+        return self.scheduler.run("/api/tags", self.fetch_models)
+
+    def refresh_models(self) -> None:
+        try:
+            self.scheduler.run("/api/tags", self.fetch_models)
+        except Exception as e:
+            # The next list_models asks the server again and reports the error
+            logger.debug(f"Model list refresh failed: {e}")
+            with self.models_lock:
+                self.models = None
+        finally:
+            with self.models_lock:
+                self.models_refreshing = False
+
+    def fetch_models(self) -> List[Dict[str, Any]]:
+        response = self.session.get(f"{self.host}/api/tags", timeout=5)
+        if response.status_code != 200:
+            raise OllamaError(error_message(response))
+        models = response.json().get("models", [])
+        with self.models_lock:
+            self.models = models
+            self.models_fetched = time.monotonic()
+        return models
+
+    def stream(self, path: str, payload: Dict[str, Any], read_timeout: float) -> OllamaStream:
+        return OllamaStream(f"{self.host}{path}", payload, read_timeout=read_timeout,
+                            session=self.session, scheduler=self.scheduler)
+
+    def generate_stream(self, model: str, prompt: str, options: Optional[Dict[str, Any]] = None,
+                        read_timeout: float = 120.0) -> OllamaStream:
+        payload = {"model": model, "prompt": prompt, "stream": True, "options": options or {}}
+        return self.stream("/api/generate", payload, read_timeout)
+
+    def chat_stream(self, model: str, messages: List[Dict[str, str]], options: Optional[Dict[str, Any]] = None,
+                    read_timeout: float = 120.0, keep_alive: Optional[str] = None) -> OllamaStream:
+        """Stream a reply to ``messages``; ``keep_alive`` keeps the model (and its cache) loaded"""
+        payload: Dict[str, Any] = {"model": model, "messages": messages, "stream": True, "options": options or {}}
+        if keep_alive:
+            payload["keep_alive"] = keep_alive
+        return self.stream("/api/chat", payload, read_timeout)
+
+    def generate(self, model: str, prompt: str, options: Optional[Dict[str, Any]] = None,
+                 timeout: float = 120.0) -> Dict[str, Any]:
+        """Complete response in one request"""
+        payload = {"model": model, "prompt": prompt, "stream": False, "options": options or {}}
+
+        def post():
+            response = self.session.post(f"{self.host}/api/generate", json=payload, timeout=(5.0, timeout))
+            if response.status_code != 200:
+                raise OllamaError(error_message(response))
+            return response.json()
+
+        return self.scheduler.run(request_key("/api/generate", payload), post)
@@ -0,0 +1,90 @@
+"""
+Incremental process monitor for BERKE0S
+
+psutil only reports a real ``cpu_percent`` for a Process object that has
+been sampled before, so the monitor keeps one Process per PID across
+refreshes. Each sample returns what changed since the previous one
+(added, changed, removed rows) so the UI updates only those rows instead
+of rebuilding its table.
+
+A sample builds new dicts and swaps them in when it is done; the rows
+returned with a diff are never modified afterwards, so the UI can keep
+reading them while the next sample runs on a worker thread.
+"""
+
+import time
+import logging
+from typing import Any, Dict, Set
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+class ProcessMonitor:
+    """Keeps psutil.Process objects alive between samples and diffs their rows"""
+
+    def __init__(self):
+        self.processes: Dict[int, psutil.Process] = {}
+        self.rows: Dict[int, Dict[str, Any]] = {}
+        self.last_sample_ms = 0.0
+
+    def sample(self) -> Dict[str, Any]:
+        """Read every process once; safe to call from a worker thread"""
+        start = time.perf_counter()
+        added: Dict[int, Dict[str, Any]] = {}
+        changed: Dict[int, Dict[str, Any]] = {}
+        rows: Dict[int, Dict[str, Any]] = {}
+        processes: Dict[int, psutil.Process] = {}
+
+        for pid in psutil.pids():
+            proc = self.processes.get(pid)
+            try:
+                if proc is None:
+                    proc = psutil.Process(pid)
+                    # The first call only primes the CPU counters and returns 0.0
+                    proc.cpu_percent(None)
+                    name = proc.name()
+                else:
+                    name = self.rows[pid]["name"] if pid in self.rows else proc.name()
+
+                with proc.oneshot():
+                    row = {
+                        "pid": pid,
+                        "name": name,
+                        "cpu": round(proc.cpu_percent(None), 1),
+                        "memory": round(proc.memory_percent(), 1),
+                        "status": proc.status()
+                    }
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                continue
+            except psutil.AccessDenied:
+                # Keep showing what was read before
+                if pid in self.rows:
+                    rows[pid] = self.rows[pid]
+                    processes[pid] = proc
+                continue
+
+            previous = self.rows.get(pid)
+            if previous is None:
+                added[pid] = row
+            elif previous != row:
+                changed[pid] = row
+            rows[pid] = row
+            processes[pid] = proc
+
+        removed: Set[int] = set(self.rows) - set(rows)
+        self.rows = rows
+        self.processes = processes
+        self.last_sample_ms = (time.perf_counter() - start) * 1000
+        return {
+            "added": added,
+            "changed": changed,
+            "removed": removed,
+            "rows": rows,
+            "sample_ms": self.last_sample_ms
+        }
+
+    def terminate(self, pid: int) -> None:
+        """Terminate a process using the tracked object (guards against PID reuse)"""
+        proc = self.processes.get(pid) or psutil.Process(pid)
+        proc.terminate()
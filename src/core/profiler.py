@@ -0,0 +1,201 @@
+"""
+Sampling profiler for BERKE0S
+
+Every app runs in the same Python process, so a sampler thread can see
+all of them: at a fixed rate it reads ``sys._current_frames()`` and counts
+each thread's stack (as a tuple of code objects, so a sample costs a
+frame walk and a dict increment). Aggregated stacks are exported as
+collapsed stacks (flamegraph.pl, speedscope, inferno) or as speedscope
+JSON with one profile per thread.
+
+``capture_stats`` formats a cProfile run, used for deterministic
+profiling of the Tk main loop for a fixed number of seconds.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import pstats
+import logging
+import threading
+import collections
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+def frame_label(code) -> str:
+    """Readable name of a code object, e.g. "refresh (window_manager.py:120)" """
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+class SamplingProfiler:
+    """Samples the stacks of all threads from a background thread"""
+
+    def __init__(self, rate_hz: float = 100.0, max_depth: int = 128):
+        self.rate_hz = rate_hz
+        self.max_depth = max_depth
+        # thread name -> Counter of stacks (root first)
+        self.stacks: Dict[str, "collections.Counter[Tuple[Any, ...]]"] = collections.defaultdict(collections.Counter)
+        # Same keys, wall seconds each stack stood for (the sampler cannot run
+        # while another thread holds the GIL, so real spacing varies)
+        self.durations: Dict[str, Dict[Tuple[Any, ...], float]] = collections.defaultdict(dict)
+        self.samples = 0
+        self.sample_time = 0.0
+        self.elapsed = 0.0
+        self.thread_names: Dict[int, str] = {}
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self.thread is not None and self.thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, daemon=True, name="SamplingProfiler")
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=2)
+            self.thread = None
+
+    def clear(self) -> None:
+        with self.lock:
+            self.stacks.clear()
+            self.durations.clear()
+            self.samples = 0
+            self.sample_time = 0.0
+            self.elapsed = 0.0
+
+    def run(self) -> None:
+        interval = 1.0 / self.rate_hz
+        own_ident = threading.get_ident()
+        last = time.perf_counter() - interval
+        while not self.stop_event.is_set():
+            start = time.perf_counter()
+            try:
+                self.sample(own_ident, start - last)
+            except Exception as e:
+                logger.error(f"Profiler sample error: {e}")
+            now = time.perf_counter()
+            with self.lock:
+                self.sample_time += now - start
+                self.elapsed += start - last
+            last = start
+            self.stop_event.wait(max(0.0, interval - (now - start)))
+
+    def sample(self, own_ident: int, duration: float) -> None:
+        frames = sys._current_frames()
+        if any(ident not in self.thread_names for ident in frames):
+            self.thread_names = {t.ident: t.name for t in threading.enumerate()}
+
+        with self.lock:
+            for ident, frame in frames.items():
+                if ident == own_ident:
+                    continue
+                codes = []
+                while frame is not None and len(codes) < self.max_depth:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                codes.reverse()
+                name = self.thread_names.get(ident, str(ident))
+                stack = tuple(codes)
+                self.stacks[name][stack] += 1
+                durations = self.durations[name]
+                durations[stack] = durations.get(stack, 0.0) + duration
+            self.samples += 1
+
+    def overhead(self) -> float:
+        """Share of wall time spent taking samples"""
+        with self.lock:
+            return self.sample_time / self.elapsed if self.elapsed else 0.0
+
+    def snapshot(self, durations: bool = False) -> Dict[str, Dict[Tuple[Any, ...], Any]]:
+        """Per-thread stack counts, or wall seconds with ``durations``"""
+        with self.lock:
+            source = self.durations if durations else self.stacks
+            return {name: dict(stacks) for name, stacks in source.items()}
+
+    def top(self, limit: int = 30, thread: Optional[str] = None) -> List[Tuple[str, int, int]]:
+        """(function, self samples, total samples), hottest self time first"""
+        own: "collections.Counter[Any]" = collections.Counter()
+        total: "collections.Counter[Any]" = collections.Counter()
+        for name, stacks in self.snapshot().items():
+            if thread is not None and name != thread:
+                continue
+            for stack, count in stacks.items():
+                if not stack:
+                    continue
+                own[stack[-1]] += count
+                for code in set(stack):
+                    total[code] += count
+        return [(frame_label(code), count, total[code]) for code, count in own.most_common(limit)]
+
+    def collapsed(self) -> str:
+        """Collapsed stacks: "thread;outer;...;inner count" per line"""
+        lines = []
+        for name, stacks in sorted(self.snapshot().items()):
+            for stack, count in stacks.items():
+                path = ";".join([name] + [frame_label(code).replace(";", ":") for code in stack])
+                lines.append(f"{path} {count}")
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self) -> Dict[str, Any]:
+        """speedscope "sampled" profiles, one per thread, weighted in wall milliseconds"""
+        frames: List[Dict[str, Any]] = []
+        frame_index: Dict[Any, int] = {}
+        profiles = []
+        for name, stacks in sorted(self.snapshot(durations=True).items()):
+            samples, weights = [], []
+            for stack, seconds in stacks.items():
+                indexes = []
+                for code in stack:
+                    index = frame_index.get(code)
+                    if index is None:
+                        index = frame_index[code] = len(frames)
+                        frames.append({"name": code.co_name, "file": code.co_filename, "line": code.co_firstlineno})
+                    indexes.append(index)
+                samples.append(indexes)
+                weights.append(round(seconds * 1000, 3))
+            profiles.append({
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": round(sum(weights), 3),
+                "samples": samples,
+                "weights": weights
+            })
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": "BERKE0S",
+            "exporter": "BERKE0S SamplingProfiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": profiles
+        }
+
+    def export(self, path: str) -> str:
+        """Write collapsed stacks (.txt/.folded) or speedscope JSON (anything else)"""
+        if path.endswith((".txt", ".folded", ".collapsed")):
+            content = self.collapsed()
+        else:
+            content = json.dumps(self.speedscope(), separators=(",", ":"))
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+def capture_stats(profile, sort: str = "cumulative", limit: int = 40) -> str:
+    """pstats report of a finished cProfile.Profile"""
+    output = io.StringIO()
+    stats = pstats.Stats(profile, stream=output)
+    stats.strip_dirs().sort_stats(sort).print_stats(limit)
+    return output.getvalue()
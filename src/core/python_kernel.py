@@ -0,0 +1,524 @@
+"""
+Warm Python execution kernel for the BERKE0S AI Workspace
+
+Running code used to start a new interpreter per run. Here one kernel
+process is started once, imports the usual modules up front and then
+waits for code. Each run gets its own limits:
+
+- Without kept state, the kernel forks a child per run. The child sets
+  hard rlimits (CPU seconds, address space, file size, no core files)
+  and runs the code in a fresh namespace. It keeps the kernel's warm
+  imports but nothing it does survives the run.
+- With kept state, the code runs in the kernel itself, in one namespace
+  shared between runs. Only soft limits can be used there, since hard
+  limits could never be raised again for the next run: SIGXCPU and an
+  interval timer raise inside the code, and a MemoryError is caught.
+
+stdout and stderr are pipes read as the code writes, so output streams
+back while the code runs. The kernel writes a sentinel to both pipes
+after each run, so the supervisor knows when a run's output is
+complete. If the kernel dies (a crash, ``os._exit`` in kept state, or a
+kill after it stops responding) the run is reported as crashed and a
+new kernel is started. A forked run leads its own process group, which
+the kernel reports when it forks, so that group is killed as well.
+
+This limits resources; it is not a security boundary. The code runs as
+the user, with the user's files and network.
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import select
+import signal
+import logging
+import threading
+import subprocess
+import codecs
+from typing import Any, Callable, Dict, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+PRELOAD = ("json", "re", "math", "random", "datetime", "collections", "itertools", "functools",
+           "statistics", "decimal", "fractions", "pathlib", "textwrap", "csv", "sqlite3")
+
+# Exit code of a forked run that ran out of memory
+EXIT_MEMORY = 3
+
+class RunResult:
+    """Outcome of one run"""
+
+    def __init__(self, status: str, wall: float = 0.0, cpu: float = 0.0, max_rss_kb: int = 0,
+                 exit_code: Optional[int] = None, message: str = ""):
+        # ok, error, timeout, cpu, memory, cancelled or crashed
+        self.status = status
+        self.wall = wall
+        self.cpu = cpu
+        self.max_rss_kb = max_rss_kb
+        self.exit_code = exit_code
+        self.message = message
+
+    def describe(self) -> str:
+        texts = {
+            "ok": "tamamlandı",
+            "error": "hata ile bitti",
+            "timeout": "süre sınırı aşıldı",
+            "cpu": "CPU sınırı aşıldı",
+            "memory": "bellek sınırı aşıldı",
+            "cancelled": "durduruldu",
+            "crashed": "çekirdek çöktü, yeniden başlatıldı"
+        }
+        text = f"{texts.get(self.status, self.status)}: {self.wall:.2f} sn, CPU {self.cpu:.2f} sn"
+        if self.max_rss_kb:
+            text += f", bellek {self.max_rss_kb / 1024:.0f} MB"
+        if self.message:
+            text += f" ({self.message})"
+        return text
+
+class OutputReader(threading.Thread):
+    """Reads one output pipe of the kernel and hands text to the current run"""
+
+    def __init__(self, fd: int, name: str, sentinel: bytes, kernel: "PythonKernel"):
+        super().__init__(daemon=True, name=f"Kernel {name}")
+        self.fd = fd
+        self.stream = name
+        self.sentinel = sentinel
+        self.kernel = kernel
+        self.decoder = codecs.getincrementaldecoder("utf-8")("replace")
+        self.finished: Dict[int, threading.Event] = {}
+        self.lock = threading.Lock()
+
+    def finished_event(self, run_id: int) -> threading.Event:
+        with self.lock:
+            return self.finished.setdefault(run_id, threading.Event())
+
+    def run(self) -> None:
+        buffer = b""
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except OSError:
+                data = b""
+            if not data:
+                break
+            buffer += data
+            while True:
+                start = buffer.find(self.sentinel)
+                if start < 0:
+                    break
+                end = buffer.find(b"\n", start)
+                if end < 0:
+                    break
+                self.emit(buffer[:start])
+                run_id = int(buffer[start + len(self.sentinel):end])
+                self.finished_event(run_id).set()
+                buffer = buffer[end + 1:]
+            # Hold back only what could be a sentinel split across reads
+            cut = len(buffer)
+            mark = buffer.rfind(b"\x1e")
+            if mark >= 0:
+                tail = buffer[mark:]
+                if self.sentinel.startswith(tail) or tail.startswith(self.sentinel):
+                    cut = mark
+            self.emit(buffer[:cut])
+            buffer = buffer[cut:]
+        self.emit(buffer)
+        with self.lock:
+            for event in self.finished.values():
+                event.set()
+
+    def emit(self, data: bytes) -> None:
+        text = self.decoder.decode(data)
+        if text:
+            self.kernel.output(self.stream, text)
+
+class PythonKernel:
+    """Supervises the kernel process; ``run`` blocks, call it off the Tk thread"""
+
+    def __init__(self, workdir: str, preload=PRELOAD, grace: float = 2.0):
+        self.workdir = workdir
+        self.preload = preload
+        self.grace = grace
+        self.process: Optional[subprocess.Popen] = None
+        self.reply_fd: Optional[int] = None
+        self.reply_buffer = b""
+        # Process group of the forked run in progress
+        self.child_pgid: Optional[int] = None
+        self.readers = []
+        self.sentinel = b""
+        self.run_lock = threading.Lock()
+        self.state_lock = threading.Lock()
+        self.run_id = 0
+        self.on_output: Optional[Callable[[str, str], None]] = None
+        self.cancelled = threading.Event()
+        self.restarts = 0
+
+    @property
+    def running(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def start(self) -> None:
+        """Start the kernel if it is not running; returns once it is warm"""
+        with self.state_lock:
+            if self.running:
+                return
+            os.makedirs(self.workdir, exist_ok=True)
+            token = uuid.uuid4().hex
+            self.sentinel = f"\x1e{token}:".encode("ascii")
+            reply_r, reply_w = os.pipe()
+            env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONDONTWRITEBYTECODE="1")
+            self.process = subprocess.Popen(
+                [sys.executable, "-u", os.path.abspath(__file__), "--kernel", str(reply_w), token,
+                 ",".join(self.preload)],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                pass_fds=(reply_w,), cwd=self.workdir, env=env, start_new_session=True
+            )
+            os.close(reply_w)
+            self.reply_fd = reply_r
+            self.reply_buffer = b""
+            self.readers = [
+                OutputReader(self.process.stdout.fileno(), "stdout", self.sentinel, self),
+                OutputReader(self.process.stderr.fileno(), "stderr", self.sentinel, self)
+            ]
+            for reader in self.readers:
+                reader.start()
+            # The kernel says "ready" once its imports are done
+            if self.read_reply(30.0) is None:
+                self.kill(self.process)
+                self.process = None
+                os.close(self.reply_fd)
+                self.reply_fd = None
+                raise RuntimeError("Python çekirdeği başlatılamadı")
+
+    def stop(self) -> None:
+        with self.state_lock:
+            process, self.process = self.process, None
+            reply_fd, self.reply_fd = self.reply_fd, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(self.grace)
+        except Exception:
+            self.kill(process)
+        if reply_fd is not None:
+            os.close(reply_fd)
+
+    def restart(self) -> None:
+        """New kernel: kept state is dropped; waits for a run in progress"""
+        with self.run_lock:
+            self.stop()
+            self.restarts += 1
+            self.start()
+
+    def shutdown(self) -> None:
+        """Stop the current run, then the kernel"""
+        self.cancel()
+        with self.run_lock:
+            self.stop()
+
+    def kill(self, process: subprocess.Popen) -> None:
+        # The kernel leads its own session, but a forked run has its own
+        # process group, which killing the kernel's does not reach
+        for pgid in (process.pid, self.child_pgid):
+            if pgid is None:
+                continue
+            try:
+                os.killpg(pgid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass
+        self.child_pgid = None
+        try:
+            process.wait(5)
+        except subprocess.TimeoutExpired:
+            pass
+
+    def output(self, stream: str, text: str) -> None:
+        callback = self.on_output
+        if callback:
+            callback(stream, text)
+
+    def read_reply(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """The next reply line, or None if the kernel died or the timeout passed"""
+        deadline = time.monotonic() + timeout
+        while b"\n" not in self.reply_buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or self.reply_fd is None:
+                return None
+            ready, _, _ = select.select([self.reply_fd], [], [], min(remaining, 0.5))
+            if not ready:
+                continue
+            chunk = os.read(self.reply_fd, 65536)
+            if not chunk:
+                return None
+            self.reply_buffer += chunk
+        line, self.reply_buffer = self.reply_buffer.split(b"\n", 1)
+        return json.loads(line)
+
+    def cancel(self) -> None:
+        """Interrupt the current run"""
+        self.cancelled.set()
+        process = self.process
+        if process is not None and self.run_lock.locked():
+            try:
+                process.send_signal(signal.SIGINT)
+            except ProcessLookupError:
+                pass
+
+    def run(self, code: str, on_output: Optional[Callable[[str, str], None]] = None, keep_state: bool = False,
+            timeout: float = 30.0, cpu_seconds: int = 20, memory_mb: int = 512) -> RunResult:
+        """Run ``code``; output goes to ``on_output(stream, text)`` as it is written"""
+        with self.run_lock:
+            self.cancelled.clear()
+            try:
+                self.start()
+            except Exception as e:
+                return RunResult("crashed", message=str(e))
+
+            self.run_id += 1
+            run_id = self.run_id
+            finished = [reader.finished_event(run_id) for reader in self.readers]
+            self.on_output = on_output
+            request = {
+                "command": "run", "id": run_id, "code": code, "keep_state": keep_state,
+                "timeout": timeout, "cpu": cpu_seconds, "memory": memory_mb * 1024 * 1024
+            }
+            start = time.monotonic()
+            # The kernel enforces the timeout itself; the grace covers a kernel stuck in C code
+            deadline = start + timeout + self.grace
+            try:
+                self.process.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+                self.process.stdin.flush()
+                reply = self.read_reply(timeout + self.grace)
+                while reply is not None and "child" in reply:
+                    self.child_pgid = reply["child"]
+                    reply = self.read_reply(deadline - time.monotonic())
+            except (BrokenPipeError, OSError):
+                reply = None
+
+            if reply is None:
+                # Dead, or not answering: output is complete once the pipes close
+                process = self.process
+                if process is not None:
+                    self.kill(process)
+                for event in finished:
+                    event.wait(2.0)
+                self.on_output = None
+                self.stop()
+                self.restarts += 1
+                # Warm again for the next run
+                threading.Thread(target=self.start, daemon=True, name="Kernel Restart").start()
+                status = "cancelled" if self.cancelled.is_set() else "crashed"
+                if not self.cancelled.is_set() and time.monotonic() - start >= timeout:
+                    status = "timeout"
+                return RunResult(status, time.monotonic() - start)
+
+            self.child_pgid = None
+            for event in finished:
+                event.wait(2.0)
+            self.on_output = None
+            status = reply["status"]
+            if status != "ok" and self.cancelled.is_set():
+                status = "cancelled"
+            return RunResult(status, reply["wall"], reply["cpu"], reply.get("max_rss_kb", 0),
+                             reply.get("exit_code"), reply.get("message", ""))
+
+# Kernel process side
+
+class RunInterrupted(BaseException):
+    """Raised inside kept-state code when a soft limit is hit"""
+
+    def __init__(self, status: str):
+        super().__init__(status)
+        self.status = status
+
+def apply_hard_limits(cpu: int, memory: int) -> None:
+    import resource
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))
+    resource.setrlimit(resource.RLIMIT_AS, (memory, memory))
+    resource.setrlimit(resource.RLIMIT_FSIZE, (256 * 1024 * 1024, 256 * 1024 * 1024))
+    resource.setrlimit(resource.RLIMIT_CORE, (0, 0))
+
+def execute(code: str, namespace: Dict[str, Any]) -> str:
+    """Run code, printing its traceback like the interpreter would; returns the status"""
+    import linecache
+    import traceback
+
+    filename = f"<kod-{len(linecache.cache)}>"
+    # Lets tracebacks show the lines of the code
+    linecache.cache[filename] = (len(code), None, code.splitlines(True), filename)
+    try:
+        exec(compile(code, filename, "exec"), namespace)
+        return "ok"
+    except SystemExit as e:
+        return "ok" if e.code in (None, 0) else "error"
+    except MemoryError:
+        sys.stderr.write("MemoryError: bellek sınırı aşıldı\n")
+        return "memory"
+    except (RunInterrupted, KeyboardInterrupt):
+        raise
+    except BaseException as e:
+        # Without the frame of this exec call
+        traceback.print_exception(type(e), e, e.__traceback__.tb_next)
+        return "error"
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+def run_forked(request: Dict[str, Any], interrupted: Dict[str, Any], reply: TextIO) -> Dict[str, Any]:
+    """Run in a child with hard limits; the kernel itself stays clean
+
+    The child's process group is sent on ``reply`` first, so the supervisor
+    can kill the run if the kernel itself dies or has to be killed.
+    """
+    start = time.monotonic()
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            # Otherwise the supervisor sees no EOF on replies when the kernel dies
+            os.close(reply.fileno())
+            # Own process group, so whatever the code starts is killed with it
+            os.setpgid(0, 0)
+            apply_hard_limits(request["cpu"], request["memory"])
+            status = execute(request["code"], {"__name__": "__main__"})
+            code = {"ok": 0, "memory": EXIT_MEMORY}.get(status, 1)
+        finally:
+            os._exit(code)
+    try:
+        os.setpgid(pid, pid)
+    except OSError:
+        # The child already did it, or already exited
+        pass
+    reply.write(json.dumps({"child": pid}) + "\n")
+
+    def kill():
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+    deadline = start + request["timeout"]
+    status = None
+    while True:
+        waited, exit_status, usage = os.wait4(pid, os.WNOHANG)
+        if waited:
+            break
+        if status is None and interrupted["cancel"]:
+            status = "cancelled"
+            kill()
+        elif status is None and time.monotonic() > deadline:
+            status = "timeout"
+            kill()
+        time.sleep(0.002)
+
+    cpu = usage.ru_utime + usage.ru_stime
+    result = {"wall": time.monotonic() - start, "cpu": cpu, "max_rss_kb": usage.ru_maxrss}
+    if os.WIFSIGNALED(exit_status):
+        signum = os.WTERMSIG(exit_status)
+        if status is None:
+            # SIGXCPU at the soft CPU limit, SIGKILL at the hard one
+            if signum == signal.SIGXCPU or (signum == signal.SIGKILL and cpu >= request["cpu"]):
+                status = "cpu"
+            else:
+                status = "crashed"
+                result["message"] = f"sinyal {signal.Signals(signum).name}"
+    else:
+        result["exit_code"] = os.WEXITSTATUS(exit_status)
+        if status is None:
+            status = {0: "ok", EXIT_MEMORY: "memory"}.get(result["exit_code"], "error")
+    result["status"] = status
+    return result
+
+def run_in_kernel(request: Dict[str, Any], namespace: Dict[str, Any]) -> Dict[str, Any]:
+    """Run in the kernel's own namespace under soft limits"""
+    import resource
+
+    def on_limit(signum, frame):
+        raise RunInterrupted("cpu" if signum == signal.SIGXCPU else "timeout")
+
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    cpu_before = usage.ru_utime + usage.ru_stime
+    old_cpu = resource.getrlimit(resource.RLIMIT_CPU)
+    old_memory = resource.getrlimit(resource.RLIMIT_AS)
+    start = time.monotonic()
+    status = "ok"
+    try:
+        signal.signal(signal.SIGXCPU, on_limit)
+        signal.signal(signal.SIGALRM, on_limit)
+        # Soft limits only: they have to come back off for the next run
+        resource.setrlimit(resource.RLIMIT_CPU, (int(cpu_before) + 1 + request["cpu"], old_cpu[1]))
+        with open("/proc/self/statm") as f:
+            size = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+        resource.setrlimit(resource.RLIMIT_AS, (size + request["memory"], old_memory[1]))
+        signal.setitimer(signal.ITIMER_REAL, request["timeout"])
+        status = execute(request["code"], namespace)
+    except RunInterrupted as e:
+        status = e.status
+        sys.stderr.write(f"\n{'CPU' if status == 'cpu' else 'Süre'} sınırı aşıldı\n")
+    except KeyboardInterrupt:
+        status = "cancelled"
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        resource.setrlimit(resource.RLIMIT_AS, old_memory)
+        resource.setrlimit(resource.RLIMIT_CPU, old_cpu)
+        signal.signal(signal.SIGXCPU, signal.SIG_DFL)
+        signal.signal(signal.SIGALRM, signal.SIG_DFL)
+        sys.stdout.flush()
+        sys.stderr.flush()
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return {"status": status, "wall": time.monotonic() - start,
+            "cpu": usage.ru_utime + usage.ru_stime - cpu_before, "max_rss_kb": usage.ru_maxrss}
+
+def serve(reply_fd: int, token: str, preload: str) -> None:
+    """Kernel main loop: one JSON run request per stdin line, one reply per run"""
+    import importlib
+
+    for name in filter(None, preload.split(",")):
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass
+    reply = os.fdopen(reply_fd, "w", buffering=1)
+    sentinel = f"\x1e{token}:"
+    # Requests come on the original stdin; the code gets an empty one
+    commands = os.fdopen(os.dup(0), "rb")
+    null = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(null, 0)
+    os.close(null)
+    sys.stdin = open(os.devnull)
+    interrupted = {"cancel": False, "running": None}
+
+    def on_interrupt(signum, frame):
+        if interrupted["running"]:
+            interrupted["cancel"] = True
+        # A forked run is killed by the wait loop; kept-state code is interrupted here
+        if interrupted["running"] == "kernel":
+            raise KeyboardInterrupt
+
+    signal.signal(signal.SIGINT, on_interrupt)
+    namespace: Dict[str, Any] = {"__name__": "__main__"}
+    reply.write(json.dumps({"status": "ready"}) + "\n")
+
+    for line in commands:
+        request = json.loads(line)
+
+        interrupted.update(cancel=False, running="kernel" if request["keep_state"] else "fork")
+        try:
+            if request["keep_state"]:
+                result = run_in_kernel(request, namespace)
+            else:
+                result = run_forked(request, interrupted, reply)
+        finally:
+            interrupted["running"] = None
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.write(1, f"{sentinel}{request['id']}\n".encode("ascii"))
+        os.write(2, f"{sentinel}{request['id']}\n".encode("ascii"))
+        reply.write(json.dumps(result) + "\n")
+
+if __name__ == "__main__" and len(sys.argv) == 5 and sys.argv[1] == "--kernel":
+    serve(int(sys.argv[2]), sys.argv[3], sys.argv[4])
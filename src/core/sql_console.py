@@ -0,0 +1,142 @@
+"""
+SQL console backend for BERKE0S developer tools
+
+Each query runs on its own worker thread with its own connection,
+read-only (``mode=ro``) unless writes are allowed explicitly. Results are
+fetched one page at a time when the UI asks for more, so a ``SELECT *``
+on a large table never materialises the whole result. A progress
+handler checks a cancel flag every few thousand VM instructions, so a
+long scan or sort stops as soon as the query is cancelled.
+
+An open cursor keeps a read transaction open, and in WAL mode that holds
+back checkpoints while the ``-wal`` file grows. A query nobody asks for
+more rows of within ``idle_timeout`` is therefore closed and reported
+``done`` with ``truncated`` set.
+
+Events are reported through ``on_event(kind, payload)`` from the worker
+thread: ``plan``, ``columns``, ``page``, ``done`` and ``error``.
+"""
+
+import time
+import queue
+import sqlite3
+import logging
+import threading
+from typing import Any, Callable, List, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+class SqlQuery:
+    """One statement on a worker thread, fetched page by page"""
+
+    def __init__(self, db_path: str, sql: str, params: Sequence[Any] = (), writable: bool = False,
+                 page_size: int = 200, on_event: Optional[Callable[[str, Any], None]] = None,
+                 idle_timeout: float = 30.0):
+        self.db_path = db_path
+        self.sql = sql.strip().rstrip(";")
+        self.params = params
+        self.writable = writable
+        self.page_size = page_size
+        self.idle_timeout = idle_timeout
+        self.on_event = on_event or (lambda kind, payload: None)
+
+        self.cancelled = threading.Event()
+        self.commands: queue.Queue = queue.Queue()
+        self.rows_fetched = 0
+        self.execute_ms = 0.0
+        self.fetch_ms = 0.0
+        self.truncated = False
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self.run, daemon=True, name="SQL Console")
+        self.thread.start()
+
+    def fetch_more(self) -> None:
+        """Ask for the next page"""
+        self.commands.put("more")
+
+    def cancel(self) -> None:
+        """Interrupt a running step and close the query"""
+        self.cancelled.set()
+        self.commands.put("close")
+
+    def connect(self) -> sqlite3.Connection:
+        if self.writable:
+            conn = sqlite3.connect(self.db_path, timeout=5)
+        else:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, timeout=5)
+        conn.set_progress_handler(lambda: 1 if self.cancelled.is_set() else 0, 10000)
+        return conn
+
+    def query_plan(self, conn: sqlite3.Connection) -> List[str]:
+        """EXPLAIN QUERY PLAN as indented lines; empty for statements without a plan"""
+        try:
+            rows = conn.execute(f"EXPLAIN QUERY PLAN {self.sql}", self.params).fetchall()
+        except sqlite3.Error:
+            return []
+        depth = {0: 0}
+        lines = []
+        for node, parent, _, detail in rows:
+            depth[node] = depth.get(parent, 0) + 1
+            lines.append("  " * (depth[node] - 1) + detail)
+        return lines
+
+    def run(self) -> None:
+        conn = None
+        try:
+            conn = self.connect()
+            self.on_event("plan", self.query_plan(conn))
+
+            start = time.perf_counter()
+            cursor = conn.execute(self.sql, self.params)
+            self.execute_ms = (time.perf_counter() - start) * 1000
+
+            if cursor.description is None:
+                # Not a query (allowed only on a writable connection)
+                conn.commit()
+                self.on_event("done", self.stats(cursor.rowcount))
+                return
+
+            self.on_event("columns", [column[0] for column in cursor.description])
+            command = "more"
+            while command == "more" and not self.cancelled.is_set():
+                start = time.perf_counter()
+                rows = cursor.fetchmany(self.page_size)
+                self.fetch_ms += (time.perf_counter() - start) * 1000
+                self.rows_fetched += len(rows)
+                finished = len(rows) < self.page_size
+                self.on_event("page", (rows, finished))
+                if finished:
+                    break
+                try:
+                    command = self.commands.get(timeout=self.idle_timeout)
+                except queue.Empty:
+                    # Left unscrolled: end the read transaction
+                    self.truncated = True
+                    break
+
+            cursor.close()
+            if self.cancelled.is_set():
+                self.on_event("error", "İptal edildi")
+                return
+            if conn.in_transaction:
+                # INSERT/UPDATE/DELETE ... RETURNING: close() would roll it back
+                conn.commit()
+            self.on_event("done", self.stats())
+        except sqlite3.OperationalError as e:
+            self.on_event("error", "İptal edildi" if self.cancelled.is_set() else str(e))
+        except Exception as e:
+            self.on_event("error", str(e))
+        finally:
+            if conn:
+                conn.close()
+
+    def stats(self, changed: Optional[int] = None) -> dict:
+        return {
+            "rows": self.rows_fetched,
+            "changed": changed,
+            "execute_ms": round(self.execute_ms, 1),
+            "fetch_ms": round(self.fetch_ms, 1),
+            "truncated": self.truncated
+        }
@@ -0,0 +1,38 @@
+"""
+RAM staging lookup for BERKE0S tools
+
+With ``storage.staging`` on, BERKE0S runs from a copy of ``~/.berke0s``
+in ``/dev/shm/berke0s-<uid>`` and flushes it back periodically. Tools
+started separately (developer mode, the SQL console) read the live copy
+when there is one. The path is predictable, so a directory there is only
+trusted if this user owns it, it is not a symlink, its mode is 0700 and
+its ``.staging-source`` marker names the persistent directory; another
+local user could otherwise plant one.
+"""
+
+import os
+import stat
+from typing import Optional
+
+STAGING_DIR = "/dev/shm"
+MARKER = ".staging-source"
+
+def is_live_copy(root: str, persistent: str) -> bool:
+    """Whether ``root`` is a private staging copy of ``persistent``"""
+    try:
+        st = os.lstat(root)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or stat.S_IMODE(st.st_mode) != 0o700:
+        return False
+    try:
+        with open(os.path.join(root, MARKER), 'r') as f:
+            return f.read().strip() == persistent
+    except OSError:
+        return False
+
+def live_staging_dir(persistent: Optional[str] = None) -> Optional[str]:
+    """The staging copy of ``persistent`` (default ``~/.berke0s``), if one is in use"""
+    persistent = persistent or os.path.expanduser("~/.berke0s")
+    root = os.path.join(STAGING_DIR, f"berke0s-{os.getuid()}")
+    return root if is_live_copy(root, persistent) else None
@@ -0,0 +1,287 @@
+"""
+Tk event-loop stall detector for BERKE0S
+
+A heartbeat ``after()`` callback on the Tk thread records when it last
+ran; a watchdog thread compares that with the monotonic clock. While the
+loop is overdue by more than ``threshold_ms`` the watchdog samples the
+main thread's stack with ``sys._current_frames()``, so the stack shows
+what is blocking, not where the loop was afterwards. When the heartbeat
+runs again the stall is recorded with its duration and the stack seen
+most often during it.
+
+Stalls are kept in the ``ui_stalls`` table of berke0s.db, written by a
+background thread so recording one never touches the disk on the Tk
+thread.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import queue
+import sqlite3
+import logging
+import sysconfig
+import threading
+import traceback
+import collections
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.staging import live_staging_dir
+
+logger = logging.getLogger(__name__)
+
+# Frames from these directories are skipped when naming a stall's location
+LIBRARY_DIRS = tuple({os.path.realpath(sysconfig.get_paths()[name]) + os.sep
+                      for name in ("stdlib", "platstdlib", "purelib", "platlib")})
+
+FRAME_PATTERN = re.compile(r'^  File "([^"]+)", line (\d+), in (.+)$', re.MULTILINE)
+
+def default_db_path() -> str:
+    """berke0s.db, preferring a live RAM staging copy"""
+    persistent = os.path.expanduser("~/.berke0s")
+    return os.path.join(live_staging_dir(persistent) or persistent, "berke0s.db")
+
+def stack_location(stack: traceback.StackSummary) -> str:
+    """Innermost frame outside the standard library / site-packages"""
+    for frame in reversed(stack):
+        if not os.path.realpath(frame.filename).startswith(LIBRARY_DIRS):
+            return f"{os.path.basename(frame.filename)}:{frame.lineno} {frame.name}"
+    if stack:
+        frame = stack[-1]
+        return f"{os.path.basename(frame.filename)}:{frame.lineno} {frame.name}"
+    return "?"
+
+class StallStore:
+    """ui_stalls table with batched background writes"""
+
+    def __init__(self, db_path: Optional[str] = None, max_rows: int = 5000):
+        self.db_path = db_path or default_db_path()
+        self.max_rows = max_rows
+        self.lock = threading.Lock()
+        self.write_queue: queue.Queue = queue.Queue()
+        self.conn: Optional[sqlite3.Connection] = None
+
+        try:
+            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS ui_stalls (
+                    id INTEGER PRIMARY KEY,
+                    timestamp REAL,
+                    duration_ms REAL,
+                    location TEXT,
+                    stack TEXT
+                )
+            ''')
+            self.conn.execute("CREATE INDEX IF NOT EXISTS idx_ui_stalls_time ON ui_stalls (timestamp)")
+            self.conn.commit()
+        except Exception as e:
+            logger.error(f"Stall store error: {e}")
+            self.conn = None
+
+        self.writer = threading.Thread(target=self.writer_loop, daemon=True, name="Stall Store")
+        self.writer.start()
+
+    def add(self, timestamp: float, duration_ms: float, location: str, stack: str) -> None:
+        self.write_queue.put((timestamp, duration_ms, location, stack))
+
+    def writer_loop(self) -> None:
+        while True:
+            batch = [self.write_queue.get()]
+            try:
+                while len(batch) < 100:
+                    batch.append(self.write_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            try:
+                if self.conn:
+                    with self.lock:
+                        self.conn.executemany(
+                            "INSERT INTO ui_stalls (timestamp, duration_ms, location, stack) VALUES (?, ?, ?, ?)",
+                            batch
+                        )
+                        self.conn.execute(
+                            "DELETE FROM ui_stalls WHERE id <= "
+                            "(SELECT id FROM ui_stalls ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                            (self.max_rows,)
+                        )
+                        self.conn.commit()
+            except Exception as e:
+                logger.error(f"Stall store write error: {e}")
+            finally:
+                for _ in batch:
+                    self.write_queue.task_done()
+
+    def flush(self) -> None:
+        """Block until every queued stall is committed"""
+        self.write_queue.join()
+
+    def stats(self, since: Optional[float] = None) -> Dict[str, Any]:
+        """Count, total, longest and 95th percentile duration since ``since``"""
+        if not self.conn:
+            return {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "p95_ms": 0.0}
+        since = since or 0.0
+        with self.lock:
+            count, total, longest = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(duration_ms), 0), COALESCE(MAX(duration_ms), 0) "
+                "FROM ui_stalls WHERE timestamp >= ?", (since,)).fetchone()
+            row = self.conn.execute(
+                "SELECT duration_ms FROM ui_stalls WHERE timestamp >= ? ORDER BY duration_ms DESC LIMIT 1 OFFSET ?",
+                (since, count // 20)).fetchone()
+        return {"count": count, "total_ms": total, "max_ms": longest, "p95_ms": row[0] if row else 0.0}
+
+    def groups(self, since: Optional[float] = None, limit: int = 100) -> List[Dict[str, Any]]:
+        """Stalls grouped by location, most total blocked time first"""
+        if not self.conn:
+            return []
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT location, COUNT(*), SUM(duration_ms), MAX(duration_ms), MAX(timestamp) "
+                "FROM ui_stalls WHERE timestamp >= ? GROUP BY location ORDER BY SUM(duration_ms) DESC LIMIT ?",
+                (since or 0.0, limit)).fetchall()
+        return [{"location": row[0], "count": row[1], "total_ms": row[2], "max_ms": row[3], "last": row[4]}
+                for row in rows]
+
+    def recent(self, since: Optional[float] = None, location: Optional[str] = None,
+               limit: int = 200) -> List[Dict[str, Any]]:
+        """Stalls newest first, optionally of one location"""
+        if not self.conn:
+            return []
+        sql = "SELECT id, timestamp, duration_ms, location, stack FROM ui_stalls WHERE timestamp >= ?"
+        params: List[Any] = [since or 0.0]
+        if location is not None:
+            sql += " AND location = ?"
+            params.append(location)
+        sql += " ORDER BY timestamp DESC LIMIT ?"
+        params.append(limit)
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [{"id": row[0], "timestamp": row[1], "duration_ms": row[2], "location": row[3], "stack": row[4]}
+                for row in rows]
+
+    def export(self, path: str, since: Optional[float] = None) -> str:
+        """JSON (stats, groups, stalls) or, for .folded, collapsed stacks weighted by blocked ms"""
+        stalls = self.recent(since, limit=self.max_rows)
+        if path.endswith((".folded", ".txt")):
+            weights: Dict[str, float] = collections.defaultdict(float)
+            for stall in stalls:
+                frames = ["{2} ({0}:{1})".format(os.path.basename(match[0]), match[1], match[2])
+                          for match in FRAME_PATTERN.findall(stall["stack"])]
+                weights[";".join(frames) or stall["location"]] += stall["duration_ms"]
+            content = "".join(f"{stack} {round(ms)}\n" for stack, ms in weights.items())
+        else:
+            content = json.dumps({"stats": self.stats(since), "groups": self.groups(since), "stalls": stalls},
+                                 indent=2, ensure_ascii=False)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+class StallMonitor:
+    """Heartbeat on the Tk thread, watchdog thread capturing its stack when late"""
+
+    def __init__(self, root, store: Optional[StallStore] = None, threshold_ms: float = 100.0,
+                 heartbeat_ms: int = 50, hang_report_s: float = 5.0, max_frames: int = 40):
+        self.root = root
+        self.store = store
+        self.threshold = threshold_ms / 1000.0
+        self.heartbeat_ms = heartbeat_ms
+        self.hang_report = hang_report_s
+        self.max_frames = max_frames
+        self.main_ident = threading.get_ident()
+
+        self.lock = threading.Lock()
+        self.expected = 0.0
+        self.samples: "collections.Counter[Tuple[str, str]]" = collections.Counter()
+        self.hang_reported = False
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+        self.running = False
+        self.after_id = None
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the heartbeat and the watchdog; call from the Tk thread"""
+        if self.running:
+            return
+        self.running = True
+        self.main_ident = threading.get_ident()
+        self.expected = time.monotonic() + self.heartbeat_ms / 1000.0
+        self.after_id = self.root.after(self.heartbeat_ms, self.beat)
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.watch, daemon=True, name="Stall Watchdog")
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.running = False
+        self.stop_event.set()
+        if self.after_id:
+            try:
+                self.root.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
+
+    def beat(self) -> None:
+        now = time.monotonic()
+        with self.lock:
+            lag = now - self.expected
+            samples = self.samples
+            self.samples = collections.Counter()
+            self.hang_reported = False
+            self.expected = now + self.heartbeat_ms / 1000.0
+
+        if lag >= self.threshold:
+            self.record(now - lag, lag * 1000, samples)
+
+        if self.running:
+            self.after_id = self.root.after(self.heartbeat_ms, self.beat)
+
+    def record(self, started: float, lag_ms: float, samples: "collections.Counter[Tuple[str, str]]") -> None:
+        """Keep the stall; the stack is the one sampled most often while it lasted"""
+        if samples:
+            (location, stack), _ = samples.most_common(1)[0]
+        else:
+            # Shorter than one watchdog tick, or the watchdog itself was starved
+            location, stack = "?", ""
+
+        self.count += 1
+        self.total_ms += lag_ms
+        self.max_ms = max(self.max_ms, lag_ms)
+        logger.debug(f"UI stall {lag_ms:.0f} ms at {location}")
+        if self.store:
+            self.store.add(time.time() - (time.monotonic() - started), round(lag_ms, 1), location, stack)
+
+    def watch(self) -> None:
+        interval = max(self.threshold / 4, 0.01)
+        while not self.stop_event.wait(interval):
+            with self.lock:
+                overdue = time.monotonic() - self.expected
+            if overdue < self.threshold:
+                continue
+
+            frame = sys._current_frames().get(self.main_ident)
+            if frame is None:
+                continue
+            summary = traceback.extract_stack(frame, limit=self.max_frames)
+            del frame
+            sample = (stack_location(summary), "".join(summary.format()))
+
+            with self.lock:
+                if time.monotonic() - self.expected < self.threshold:
+                    # The heartbeat ran while the stack was being read
+                    continue
+                self.samples[sample] += 1
+                report = overdue >= self.hang_report and not self.hang_reported
+                if report:
+                    self.hang_reported = True
+            if report:
+                logger.warning(f"UI loop blocked for {overdue:.1f} s at {sample[0]}:\n{sample[1]}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Stalls seen by this monitor since it started"""
+        return {"count": self.count, "total_ms": round(self.total_ms, 1), "max_ms": round(self.max_ms, 1)}
@@ -9,6 +9,7 @@ import tkinter as tk
 from typing import Optional
 
 from core.config import ConfigManager
+from core.stall_monitor import StallMonitor, StallStore
 from display.manager import DisplayManager
 from ui.desktop import Desktop
 from ui.taskbar import Taskbar
@@ -27,6 +28,7 @@ class WindowManager:
         self.desktop: Optional[Desktop] = None
         self.taskbar: Optional[Taskbar] = None
         self.notifications: Optional[NotificationSystem] = None
+        self.stall_monitor: Optional[StallMonitor] = None
         self.running = False
         
     def run(self) -> int:
@@ -67,6 +69,7 @@ class WindowManager:
             
             # Setup components
             self._setup_components()
+            self._start_stall_monitor()
             
             # Start main loop
             self.running = True
@@ -132,6 +135,20 @@ class WindowManager:
             logger.error(f"Component setup error: {e}")
             raise
     
+    def _start_stall_monitor(self):
+        """Record event-loop stalls (with the blocking stack) in berke0s.db"""
+        settings = self.get_config("diagnostics", {})
+        if not settings.get("stall_monitor", True):
+            return
+        try:
+            store = StallStore(os.path.join(self.config_manager.config_dir, "berke0s.db"))
+            self.stall_monitor = StallMonitor(self.root, store,
+                                              threshold_ms=settings.get("stall_threshold_ms", 100),
+                                              heartbeat_ms=settings.get("heartbeat_ms", 50))
+            self.stall_monitor.start()
+        except Exception as e:
+            logger.error(f"Stall monitor error: {e}")
+    
     def get_config(self, key: str, default=None):
         """Get configuration value"""
         return self.config_manager.get(key, default)
@@ -176,6 +193,11 @@ class WindowManager:
         try:
             logger.info("Cleaning up resources...")
             
+            if self.stall_monitor:
+                self.stall_monitor.stop()
+                if self.stall_monitor.store:
+                    self.stall_monitor.store.flush()
+            
             if self.display_manager:
                 self.display_manager.shutdown_display()
                 
@@ -0,0 +1,192 @@
+"""
+Frame-clock animation engine for BERKE0S
+
+Every fade/slide is a tween on one shared clock instead of its own
+``after()`` chain. Progress is computed from elapsed time, so late frames
+are dropped rather than queued, and effects switch off under sustained load.
+"""
+
+import os
+import time
+import logging
+import tkinter as tk
+from typing import Any, Callable, Dict, Hashable, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+EASING: Dict[str, Callable[[float], float]] = {
+    "linear": lambda t: t,
+    "ease_in": lambda t: t * t * t,
+    "ease_out": lambda t: 1 - (1 - t) ** 3,
+    "ease_in_out": lambda t: 4 * t * t * t if t < 0.5 else 1 - (-2 * t + 2) ** 3 / 2
+}
+
+class Animator:
+    """Single frame clock that drives every active tween"""
+
+    _instances: Dict[str, "Animator"] = {}
+
+    def __init__(self, root: tk.Misc, fps: int = 60, degrade_after: int = 10, cooldown: float = 30.0):
+        self.root = root
+        self.frame_interval = 1.0 / fps
+        self.tweens: Dict[Hashable, Dict[str, Any]] = {}
+        self.tween_id = 0
+        self.after_id: Optional[str] = None
+        self.last_tick = time.monotonic()
+        self.enabled = not self.is_low_end()
+        self.degraded_until = 0.0
+        self.degrade_after = degrade_after
+        self.cooldown = cooldown
+        self.overruns = 0
+        self.stats_data = {"frames": 0, "dropped": 0, "degraded": 0}
+
+        if not self.enabled:
+            logger.info("Low-end hardware detected, animations disabled")
+
+    @classmethod
+    def for_widget(cls, widget: tk.Misc) -> "Animator":
+        """Get (or create) the animator of a widget's Tk root"""
+        root = widget._root()
+        key = str(root)
+        animator = cls._instances.get(key)
+        if animator is None or animator.root is not root:
+            animator = cls(root)
+            cls._instances[key] = animator
+        return animator
+
+    @staticmethod
+    def is_low_end() -> bool:
+        """Single core or under 512 MB of RAM"""
+        if (os.cpu_count() or 1) < 2:
+            return True
+        if PSUTIL_AVAILABLE:
+            return psutil.virtual_memory().total < 512 * 1024 * 1024
+        return False
+
+    def active(self) -> bool:
+        """Whether new animations should actually animate"""
+        return self.enabled and time.monotonic() >= self.degraded_until
+
+    def animate(self, step: Callable[[float], Any], duration_ms: int = 250, easing: str = "ease_out",
+                on_done: Optional[Callable[[], Any]] = None, key: Optional[Hashable] = None) -> Hashable:
+        """Run ``step(value)`` with value eased from 0 to 1 over ``duration_ms``
+
+        A tween with the same ``key`` is replaced without calling its ``on_done``.
+        """
+        if key is None:
+            self.tween_id += 1
+            key = ("tween", self.tween_id)
+        self.tweens.pop(key, None)
+
+        if not self.active():
+            self.finish_tween(step, on_done)
+            return key
+
+        self.tweens[key] = {
+            "step": step,
+            "start": time.monotonic(),
+            "duration": max(duration_ms, 1) / 1000.0,
+            "easing": EASING.get(easing, EASING["ease_out"]),
+            "on_done": on_done
+        }
+
+        if self.after_id is None:
+            self.last_tick = time.monotonic()
+            self.after_id = self.root.after(0, self.tick)
+        return key
+
+    def cancel(self, key: Hashable, finish: bool = False) -> None:
+        """Stop a tween; with ``finish`` jump it to its end state"""
+        tween = self.tweens.pop(key, None)
+        if tween and finish:
+            self.finish_tween(tween["step"], tween["on_done"])
+
+    def finish_tween(self, step: Callable[[float], Any], on_done: Optional[Callable[[], Any]]) -> None:
+        """Apply the final frame and completion callback"""
+        try:
+            step(1.0)
+        except tk.TclError:
+            pass
+        except Exception as e:
+            logger.error(f"Animation step error: {e}")
+        if on_done:
+            try:
+                on_done()
+            except Exception as e:
+                logger.error(f"Animation completion error: {e}")
+
+    def tick(self) -> None:
+        """Advance all tweens by one frame"""
+        self.after_id = None
+        now = time.monotonic()
+
+        late = now - self.last_tick - self.frame_interval
+        if late > self.frame_interval:
+            self.stats_data["dropped"] += int(late / self.frame_interval)
+        self.last_tick = now
+        self.stats_data["frames"] += 1
+
+        for key, tween in list(self.tweens.items()):
+            progress = min(1.0, (now - tween["start"]) / tween["duration"])
+            if progress >= 1.0:
+                self.tweens.pop(key, None)
+                self.finish_tween(tween["step"], tween["on_done"])
+                continue
+            try:
+                tween["step"](tween["easing"](progress))
+            except tk.TclError:
+                # Widget destroyed mid-animation
+                self.tweens.pop(key, None)
+                self.finish_tween(lambda value: None, tween["on_done"])
+            except Exception as e:
+                logger.error(f"Animation step error: {e}")
+                self.tweens.pop(key, None)
+
+        work = time.monotonic() - now
+        self.check_load(work + max(late, 0.0))
+
+        if self.tweens:
+            delay = max(1, int((self.frame_interval - work) * 1000))
+            try:
+                self.after_id = self.root.after(delay, self.tick)
+            except tk.TclError:
+                self.tweens.clear()
+
+    def check_load(self, frame_cost: float) -> None:
+        """Turn effects off for a while when frames keep overrunning"""
+        if frame_cost > self.frame_interval * 2:
+            self.overruns += 1
+        else:
+            self.overruns = max(0, self.overruns - 1)
+
+        if self.overruns >= self.degrade_after:
+            self.overruns = 0
+            self.degraded_until = time.monotonic() + self.cooldown
+            self.stats_data["degraded"] += 1
+            logger.warning(f"UI under load, animations disabled for {self.cooldown:.0f}s")
+            for key in list(self.tweens):
+                self.cancel(key, finish=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of animation statistics"""
+        data: Dict[str, Any] = dict(self.stats_data)
+        data["active"] = len(self.tweens)
+        data["enabled"] = self.active()
+        return data
+
+    def stop(self) -> None:
+        """Finish every running tween and stop the clock"""
+        for key in list(self.tweens):
+            self.cancel(key, finish=True)
+        if self.after_id:
+            try:
+                self.root.after_cancel(self.after_id)
+            except tk.TclError:
+                pass
+            self.after_id = None
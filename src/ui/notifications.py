@@ -7,6 +7,8 @@ import datetime
 import logging
 from typing import List, Dict, Any, Optional, Callable
 
+from ui.animation import Animator
+
 logger = logging.getLogger(__name__)
 
 class NotificationSystem:
@@ -147,26 +149,17 @@ class NotificationSystem:
     def _animate_notification(self, notif: tk.Toplevel, action: str) -> None:
         """Animate notification appearance/disappearance"""
         try:
+            animator = Animator.for_widget(self.wm.root)
+            
             if action == "show":
                 notif.deiconify()
                 notif.attributes('-alpha', 0)
-                
-                def fade_in(alpha: float = 0) -> None:
-                    if alpha <= 0.95:
-                        notif.attributes('-alpha', alpha)
-                        self.wm.root.after(20, lambda: fade_in(alpha + 0.1))
-                
-                fade_in()
+                animator.animate(lambda progress: notif.attributes('-alpha', progress * 0.95),
+                                 200, key=("alpha", str(notif)))
                 
             elif action == "hide":
-                def fade_out(alpha: float = 0.95) -> None:
-                    if alpha >= 0:
-                        notif.attributes('-alpha', alpha)
-                        self.wm.root.after(20, lambda: fade_out(alpha - 0.1))
-                    else:
-                        notif.destroy()
-                
-                fade_out()
+                animator.animate(lambda progress: notif.attributes('-alpha', 0.95 * (1 - progress)),
+                                 200, easing="ease_in", key=("alpha", str(notif)), on_done=notif.destroy)
                 
         except Exception as e:
             logger.error(f"Animation error: {e}")